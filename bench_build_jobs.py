@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""Benchmark for ``cli.jobs.build_jobs`` job planning.
+
+Times the job-table build for the selection flags that do real work —
+``--sessions`` slices and explicit sessions, ``--smokescreen`` and
+``--recently-modified`` — against the full CML data index, or against a
+synthetic index of the same shape when ``--synthetic`` is given (no data
+archive access needed).
+
+Usage::
+
+    python bench_build_jobs.py                          # real data index
+    python bench_build_jobs.py --synthetic --n-subjects 5000 --repeats 5
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from cli import registry  # noqa: E402
+from cli.jobs import build_jobs  # noqa: E402
+
+
+def synthetic_index(n_subjects, seed=0):
+    """A data-index-shaped frame: every scalp experiment, 1-20 sessions each."""
+    rng = np.random.default_rng(seed)
+    experiments = registry.experiments_for(registry.SCALP)
+    rows = []
+    for i in range(n_subjects):
+        subject = f"LTP{i:04d}"
+        experiment = experiments[i % len(experiments)]
+        for session in range(int(rng.integers(1, 21))):
+            rows.append((subject, experiment, session))
+    return pd.DataFrame(rows, columns=["subject", "experiment", "session"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--synthetic", action="store_true",
+                        help="Use a synthetic data index instead of cmlreaders'.")
+    parser.add_argument("--n-subjects", type=int, default=2000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.synthetic:
+        index = synthetic_index(args.n_subjects)
+    else:
+        import cmlreaders as cml
+        index = cml.get_data_index()
+    modality = registry.SCALP if args.synthetic else registry.INTRACRANIAL
+
+    selected = index[index["experiment"].isin(registry.experiments_for(modality))]
+    recent = {s: sorted(g["session"].astype(int).tolist())[:2]
+              for s, g in selected.groupby("subject")}
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+        json.dump(recent, f)
+        recent_path = f.name
+
+    cases = {
+        "all sessions": {},
+        "--sessions 0:3 5": {"sessions_spec": ["0:3", "5"]},
+        "--sessions -2:": {"sessions_spec": ["-2:"]},
+        "--smokescreen": {"smokescreen": True},
+        "--recently-modified": {"recently_modified": recent_path},
+    }
+    print(f"data index: {len(index)} rows ({'synthetic' if args.synthetic else 'cmlreaders'}), "
+          f"{len(selected)} {modality}")
+    try:
+        with open(os.devnull, "w") as devnull:
+            for label, kwargs in cases.items():
+                stdout, sys.stdout = sys.stdout, devnull    # silence per-session warnings
+                try:
+                    times = timeit.repeat(
+                        lambda: build_jobs(modality=modality, data_index=index, **kwargs),
+                        number=1, repeat=args.repeats,
+                    )
+                    n_jobs = len(build_jobs(modality=modality, data_index=index, **kwargs))
+                finally:
+                    sys.stdout = stdout
+                print(f"{label:>22}: {min(times) * 1e3:8.1f} ms  ({n_jobs} jobs, "
+                      f"best of {args.repeats})")
+    finally:
+        os.unlink(recent_path)
+
+
+if __name__ == "__main__":
+    main()
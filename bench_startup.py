@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""Startup benchmark for ``bids_convert.py``.
+
+Runs the CLI under ``python -X importtime`` and reports the wall time of the
+best of ``--repeats`` runs along with the slowest top-level imports, so a
+heavy module creeping back into the import path shows up by name. Exits
+non-zero when the best run exceeds ``--max-seconds`` (default 1 s), which
+makes it usable as a check in CI.
+
+Usage::
+
+    python bench_startup.py                       # bids_convert.py --help
+    python bench_startup.py --args "--dry-run --experiments FR1 --subjects R1001P"
+    python bench_startup.py --top 20 --max-seconds 0.5
+"""
+
+import argparse
+import os
+import shlex
+import subprocess
+import sys
+import time
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_once(cli_args):
+    """(wall seconds, {top-level module: cumulative µs}) for one CLI run."""
+    cmd = [sys.executable, "-X", "importtime",
+           os.path.join(_HERE, "bids_convert.py"), *cli_args]
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    wall = time.perf_counter() - start
+
+    top_level = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nesting is shown by indentation; keep top-level imports only.
+        if name.startswith("  ") or not cumulative.strip().isdigit():
+            continue
+        top_level[name.strip()] = int(cumulative)
+    return wall, top_level
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--args", default="--help",
+                        help="Arguments passed to bids_convert.py (default: --help).")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10,
+                        help="Number of slowest top-level imports to list.")
+    parser.add_argument("--max-seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    cli_args = shlex.split(args.args)
+    runs = [run_once(cli_args) for _ in range(args.repeats)]
+    wall, imports = min(runs, key=lambda r: r[0])
+
+    print(f"bids_convert.py {args.args}: {wall * 1e3:.0f} ms "
+          f"(best of {args.repeats}, budget {args.max_seconds * 1e3:.0f} ms)")
+    for name, us in sorted(imports.items(), key=lambda kv: -kv[1])[:args.top]:
+        print(f"  {us / 1e3:8.1f} ms  {name}")
+
+    sys.exit(0 if wall <= args.max_seconds else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""Benchmark for the shared BIDS TSV writer (``cli.tsv``).
+
+Times one session's events table the way it used to be written — whole-frame
+``fillna('n/a').replace('', 'n/a')`` then ``to_csv`` for each of the three
+files that carry it (beh.tsv and events.tsv for both acquisitions) — against
+``StageGatedConverter._to_tsv``, which substitutes n/a while serializing and
+writes every copy from one cached buffer. A channels-shaped table (written
+once) is timed the same way. Tables are synthetic, shaped like FR1 events and
+a ~150-contact montage, so no data archive access is needed.
+
+Usage::
+
+    python bench_tsv.py                           # 5k events, 150 channels
+    python bench_tsv.py --n-events 50000 --n-channels 250 --repeats 3
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from cli.stages import StageGatedConverter  # noqa: E402
+from cli.tsv import tsv_text  # noqa: E402
+
+
+def synthetic_events(n_events, seed=0):
+    """FR1-shaped events: float onsets, int samples, object columns with
+    NaN / '' gaps."""
+    rng = np.random.default_rng(seed)
+    trial_type = rng.choice(["WORD", "REC_WORD", "DISTRACT_START", "COUNTDOWN_START"], n_events)
+    is_word = trial_type == "WORD"
+    onset = np.sort(rng.random(n_events)) * 3600
+    return pd.DataFrame({
+        "onset": onset,
+        "duration": np.where(is_word, 1.6, np.nan),
+        "sample": (onset * 1000).astype(int),
+        "trial_type": trial_type,
+        "stim_file": np.where(is_word, "wordpools/wordpool_en.txt", None),
+        "item_name": np.where(is_word, rng.choice(["APPLE", "BRIDGE", "CANDLE"], n_events), ""),
+        "serialpos": np.where(is_word, rng.integers(1, 13, n_events), -999),
+        "list": rng.integers(-1, 26, n_events),
+        "test": np.where(trial_type == "REC_WORD", "n/a", None),
+        "answer": np.where(rng.random(n_events) < 0.1, rng.random(n_events), np.nan),
+        "eegoffset": (onset * 1000).astype(int),
+    })
+
+
+def synthetic_channels(n_channels, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "name": [f"LA{i}" for i in range(n_channels)],
+        "type": rng.choice(["SEEG", "ECOG", None], n_channels),
+        "units": "uV",
+        "low_cutoff": "n/a",
+        "high_cutoff": "n/a",
+        "group": rng.choice(["LA", "LB", "RA"], n_channels),
+        "sampling_frequency": 1000.0,
+        "description": rng.choice(["depth", "strip", None], n_channels),
+        "notch": "n/a",
+        "status": "good",
+        "status_description": "n/a",
+        "category": rng.choice(["n/a", "soz", "bad_channel,soz", ""], n_channels),
+    })
+
+
+class _Writer(StageGatedConverter):
+    pass
+
+
+def legacy_write(frame, paths):
+    for path in paths:
+        frame.fillna("n/a").replace("", "n/a").to_csv(path, sep="\t", index=False)
+
+
+def shared_write(frame, paths):
+    writer = _Writer()                      # fresh cache, as per session
+    for path in paths:
+        writer._to_tsv(frame, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n-events", type=int, default=5_000)
+    parser.add_argument("--n-channels", type=int, default=150)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    tables = {
+        "events x3": (synthetic_events(args.n_events), 3),
+        "channels x1": (synthetic_channels(args.n_channels), 1),
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, (frame, n_files) in tables.items():
+            paths = [os.path.join(tmp, f"{i}.tsv") for i in range(n_files)]
+            legacy_text = frame.fillna("n/a").replace("", "n/a").to_csv(sep="\t", index=False)
+            if tsv_text(frame) != legacy_text:
+                sys.exit(f"{label}: cli.tsv output differs from the to_csv path")
+
+            legacy = min(timeit.repeat(lambda: legacy_write(frame, paths),
+                                       number=1, repeat=args.repeats))
+            shared = min(timeit.repeat(lambda: shared_write(frame, paths),
+                                       number=1, repeat=args.repeats))
+            print(f"{label:>12} ({len(frame)} rows): to_csv {legacy * 1e3:7.1f} ms, "
+                  f"cli.tsv {shared * 1e3:7.1f} ms  ({legacy / shared:.1f}x, "
+                  f"best of {args.repeats})")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,16 +11,15 @@ orchestrator, the per-task error CSV and validation — is shared. See the
 import argparse
 import os
 import sys
-
-import pandas as pd
+import time
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Only the light modules are imported up front so --help answers instantly;
+# pandas, cmlreaders, the orchestrator and the validators load in main() once
+# they are actually needed.
 from cli import registry  # noqa: E402
-from cli.jobs import build_jobs  # noqa: E402
 from cli.overwrite import resolve_overwrite, valid_tokens  # noqa: E402
-from cli.runner import make_error_logs, run_jobs  # noqa: E402
-from cli.validation import validate_bids, validation_requested  # noqa: E402
 
 _HERE = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_CONVERSION_CSV = os.path.join(_HERE, "intracranial", "system_1_unit_conversions.csv")
@@ -94,10 +93,20 @@ examples:
     beh.add_argument("--force", action="store_true", default=False,
                      help="Downgrade per-stage conversion failures to [WARN] and keep "
                           "going. By default any stage failure aborts that session.")
+    beh.add_argument("--resume-run", action="store_true", default=False,
+                     help="Pick up an interrupted run: jobs already in this run's "
+                          "result journal (same root, experiments and subjects) "
+                          "are not resubmitted. Refused if the journal was "
+                          "written under a different --overwrite. Without it "
+                          "the journal starts fresh.")
     beh.add_argument("--dry-run", action="store_true", default=False,
                      help="Print the resolved settings and job table, then exit.")
     beh.add_argument("--verbose", action="store_true", default=False,
                      help="Verbose output from the validation pipelines.")
+    beh.add_argument("--log-level", choices=["DEBUG", "INFO", "WARN"], default=None,
+                     help="Converter progress output: DEBUG adds internal state, WARN "
+                          "keeps only warnings and failures (default: "
+                          "$BIDS_CONVERT_LOG_LEVEL or INFO).")
 
     # ---- validation ----
     val = ap.add_argument_group("validation")
@@ -113,6 +122,20 @@ examples:
     val.add_argument("--validate-only", action="store_true", default=False,
                      help="Skip conversion and only validate --root for the selected "
                           "jobs. Combine with --bids-validator / --eeg-validator to scope.")
+    val.add_argument("--validate-written", action="store_true", default=False,
+                     help="Limit the BIDS Validator's path/naming check to files written "
+                          "by this run (the npm CLI still checks the whole dataset).")
+    val.add_argument("--verify-in-worker", action="store_true", default=False,
+                     help="Check each written EDF/BDF against the samples it was "
+                          "written from, and each events TSV against the source events "
+                          "(row count, trial_type, onset = eegoffset/sfreq), in the "
+                          "converting worker. A mismatch fails the session at stage "
+                          "'verify'. EGI recordings written as BrainVision get the "
+                          "events check only.")
+    val.add_argument("--validate-workers", type=int, default=None, metavar="N",
+                     help="Run the per-session eeg-validation pipelines in a local pool "
+                          "of N processes instead of on the Slurm+Dask cluster "
+                          "(ignored with --serial).")
 
     # ---- parallel (Dask/Slurm) ----
     par = ap.add_argument_group("parallel (Slurm + Dask)")
@@ -129,6 +152,13 @@ examples:
     intra.add_argument("--conversion-csv", default=DEFAULT_CONVERSION_CSV,
                        help="CSV of per-session System-1 unit conversions "
                             "(default: intracranial/system_1_unit_conversions.csv).")
+    intra.add_argument("--metadata-only", action="store_true", default=False,
+                       help="Regenerate channels.tsv, the _ieeg.json sidecars and the "
+                            "events files around recordings already in --root, and patch "
+                            "the recordings' header units in place, taking "
+                            "sfreq/duration from the existing files instead of loading "
+                            "the source EEG. Without --overwrite, implies "
+                            "--overwrite eeg channels.")
 
     return ap
 
@@ -145,6 +175,12 @@ def main():
     except ValueError as e:
         ap.error(str(e))
 
+    if args.metadata_only:
+        if modality != registry.INTRACRANIAL:
+            ap.error("--metadata-only is only supported for intracranial conversions.")
+        if args.overwrite is None:
+            args.overwrite = ["eeg", "channels"]
+
     try:
         overrides = resolve_overwrite(args.overwrite, modality)
     except ValueError as e:
@@ -166,8 +202,12 @@ def main():
     print("Overwrite:          ", ", ".join(s for s, v in overrides.items() if v) or "(nothing — resume)")
     print("Mode:               ", "serial" if args.serial else "parallel (Slurm+Dask)")
     print("On stage failure:   ", "warn and continue (--force)" if args.force else "abort session")
+    if args.metadata_only:
+        print("EEG stages:         ", "metadata only (existing recordings are kept)")
     print("-" * 50 + "\n")
 
+    from cli.jobs import build_jobs
+
     df_jobs = build_jobs(
         modality=modality,
         experiments=args.experiments,
@@ -190,10 +230,22 @@ def main():
         print("\n--dry-run: nothing was converted.")
         sys.exit(0)
 
+    from cli.runner import JournalError, make_error_logs, run_jobs
+    from cli.validation import validate_bids, validation_requested
+
     error_logs = make_error_logs(df_jobs, args.root)
+    dask_opts = {
+        "job_name": args.job_name,
+        "memory_per_job": args.memory_per_job,
+        "max_n_jobs": args.max_n_jobs,
+        "threads_per_job": args.threads_per_job,
+        "adapt": args.adapt,
+        "log_directory": args.log_directory,
+    }
 
     if args.validate_only:
-        valid = validate_bids(args, df_jobs, error_logs, modality)
+        valid = validate_bids(args, df_jobs, error_logs, modality,
+                              dask_opts=dask_opts)
         sys.exit(0 if valid else 1)
 
     brain_regions = None
@@ -201,31 +253,35 @@ def main():
         from intracranial.intracranial_BIDS_converter import intracranial_BIDS_converter
         brain_regions = {br: 1 for br in intracranial_BIDS_converter.BRAIN_REGIONS}
 
-    tally = run_jobs(
-        df_jobs,
-        modality=modality,
-        root=args.root,
-        overrides=overrides,
-        force=args.force,
-        serial=args.serial,
-        brain_regions=brain_regions,
-        dask_opts={
-            "job_name": args.job_name,
-            "memory_per_job": args.memory_per_job,
-            "max_n_jobs": args.max_n_jobs,
-            "threads_per_job": args.threads_per_job,
-            "adapt": args.adapt,
-            "log_directory": args.log_directory,
-        },
-        error_logs=error_logs,
-    )
+    run_started = time.time()
+    try:
+        tally = run_jobs(
+            df_jobs,
+            modality=modality,
+            root=args.root,
+            overrides=overrides,
+            force=args.force,
+            serial=args.serial,
+            brain_regions=brain_regions,
+            dask_opts=dask_opts,
+            error_logs=error_logs,
+            verify=args.verify_in_worker,
+            resume=args.resume_run,
+            log_level=args.log_level,
+            metadata_only=args.metadata_only,
+        )
+    except JournalError as e:
+        sys.exit(f"ERROR: {e}")
 
     valid = True
     if validation_requested(args):
+        import pandas as pd
+
         df_validate = pd.DataFrame(
             tally.converted_rows, columns=["subject", "experiment", "session"],
         )
-        valid = validate_bids(args, df_validate, error_logs, modality)
+        valid = validate_bids(args, df_validate, error_logs, modality,
+                              written_since=run_started, dask_opts=dask_opts)
 
     sys.exit(0 if tally.n_fail == 0 and valid else 1)
 
@@ -24,6 +24,7 @@ from __future__ import annotations
 
 import contextlib
 import os
+import re
 import subprocess
 import sys
 import traceback
@@ -39,15 +40,16 @@ _EEG_VALIDATION_SUBMODULE = os.path.join(_HERE, "eeg-validation")
 if os.path.isdir(_EEG_VALIDATION_SUBMODULE) and _EEG_VALIDATION_SUBMODULE not in sys.path:
     sys.path.insert(0, _EEG_VALIDATION_SUBMODULE)
 
-from eeg_validation import (
-    DigitalSignalPipeline,
-    EventsPipeline,
-    MontagePipeline,
-    RawSignalPipeline,
-)
 from conversion_error_log import CSV_COLUMNS as ERROR_CSV_COLUMNS
 
 
+def _eeg_validation():
+    """The eeg_validation package, imported on first use: it pulls in
+    cmlreaders and MNE, which the conversion and --help paths never need."""
+    import eeg_validation
+    return eeg_validation
+
+
 # The canonical log root is RAM_maint-owned, so users other than maint cannot
 # write to it. Override with BIDS_CONVERT_LOG_ROOT to run a conversion under
 # your own account (e.g. testing against a scratch BIDS root).
@@ -77,8 +79,47 @@ def session_log_dir(experiment, subject, session) -> str:
 # Tee
 # ----------------------------------------------------------------------
 
+# A tee'd log file is written once this much output has built up, and once
+# more when the tee closes — most session logs are written in one go at job
+# end rather than a line at a time onto the shared filesystem.
+TEE_FLUSH_BYTES = 1 << 20
+
+
+class _BufferedLog:
+    """Write-behind text file: collects writes in memory, appends to ``path``
+    in chunks of ``TEE_FLUSH_BYTES``."""
+
+    def __init__(self, path, mode):
+        self.path = path
+        self._mode = mode
+        self._parts = []
+        self._size = 0
+
+    def write(self, data):
+        self._parts.append(data)
+        self._size += len(data)
+        if self._size >= TEE_FLUSH_BYTES:
+            self.flush()
+
+    def flush(self):
+        if not self._parts and self._mode == "a":
+            return
+        with open(self.path, self._mode) as f:
+            f.write("".join(self._parts))
+        self._mode = "a"
+        self._parts = []
+        self._size = 0
+
+    def close(self):
+        self.flush()
+
+
 class _Tee:
-    """Write to multiple text streams. Used to fan stdout/stderr to a file."""
+    """Write to multiple text streams. Used to fan stdout/stderr to a file.
+
+    No flush per write: the console streams keep their own buffering and the
+    file side is a ``_BufferedLog``. Everything is flushed on exit.
+    """
 
     def __init__(self, *streams):
         self.streams = streams
@@ -87,7 +128,6 @@ class _Tee:
         for s in self.streams:
             try:
                 s.write(data)
-                s.flush()
             except ValueError:
                 # Underlying stream closed; ignore so the other survives.
                 pass
@@ -105,9 +145,13 @@ class _Tee:
 
 @contextlib.contextmanager
 def tee_to_file(path: str, mode: str = "a"):
-    """Tee both stdout AND stderr to `path` while still printing to the console."""
+    """Tee both stdout AND stderr to `path` while still printing to the console.
+
+    The file is written in ``TEE_FLUSH_BYTES`` chunks and on exit, so it is
+    only complete once the block ends.
+    """
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    f = open(path, mode, buffering=1)  # line-buffered
+    f = _BufferedLog(path, mode)
     orig_out, orig_err = sys.stdout, sys.stderr
     try:
         sys.stdout = _Tee(orig_out, f)
@@ -116,6 +160,11 @@ def tee_to_file(path: str, mode: str = "a"):
     finally:
         sys.stdout = orig_out
         sys.stderr = orig_err
+        for s in (orig_out, orig_err):
+            try:
+                s.flush()
+            except ValueError:
+                pass
         f.close()
 
 
@@ -344,35 +393,173 @@ def _read_bidsignore(root: str) -> List[str]:
     return patterns
 
 
-def _matches_bidsignore(rel: str, patterns: List[str]) -> bool:
+def _compile_bidsignore(patterns: List[str]) -> re.Pattern:
+    """Fold all ``.bidsignore`` patterns into one regex.
+
+    Each pattern becomes its :func:`fnmatch.translate` form; directory-style
+    patterns like ``derivatives/`` (which the npm validator treats as
+    "anywhere under derivatives") also match as a plain prefix. Match the
+    result against both the repo-relative path and the basename.
+    """
+    import fnmatch
+    alternatives = []
+    for pat in patterns:
+        alternatives.append(fnmatch.translate(pat))
+        if pat.endswith("/"):
+            alternatives.append(re.escape(pat) + ".*")
+    if not alternatives:
+        return re.compile(r"(?!)")          # matches nothing
+    return re.compile("|".join(f"(?:{alt})" for alt in alternatives))
+
+
+def _matches_bidsignore(rel: str, patterns) -> bool:
     """True if ``rel`` (a leading-slash repo path) matches any pattern.
 
     Mirrors what the npm bids-validator does in spirit: matches both
     the full path (without the leading slash) and the basename.
+    ``patterns`` is a pattern list or a regex from
+    :func:`_compile_bidsignore`.
     """
     if not patterns:
         return False
-    import fnmatch
+    if isinstance(patterns, list):
+        patterns = _compile_bidsignore(patterns)
     rel_stripped = rel.lstrip("/")
     base = os.path.basename(rel_stripped)
-    for pat in patterns:
-        if fnmatch.fnmatch(rel_stripped, pat) or fnmatch.fnmatch(base, pat):
-            return True
-        # Support directory-style patterns like 'derivatives/' that the
-        # npm validator treats as "anywhere under derivatives".
-        if pat.endswith("/") and rel_stripped.startswith(pat):
-            return True
-    return False
+    return bool(patterns.match(rel_stripped) or patterns.match(base))
+
+
+# Layer 1 walks in parallel: listing directories on /data is dominated by
+# network-filesystem latency, not the GIL.
+PATH_VALIDATION_WORKERS = 16
+
+
+def _path_cache_file(root: str) -> str:
+    """Per-root Layer 1 cache, kept under LOG_ROOT rather than inside the
+    BIDS root so it never becomes a dataset file itself."""
+    import hashlib
+    digest = hashlib.sha1(os.path.abspath(root).encode()).hexdigest()[:16]
+    return os.path.join(LOG_ROOT, "_path_validation_cache", f"{digest}.json")
+
+
+def _load_path_cache(path: str, meta: Dict[str, Any]) -> Dict[str, list]:
+    import json
+    try:
+        with open(path) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cached.get("meta") != meta:
+        return {}                  # validator or .bidsignore changed
+    return cached.get("dirs", {})
+
+
+def _save_path_cache(path: str, meta: Dict[str, Any], dirs: Dict[str, list]):
+    import json
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"meta": meta, "dirs": dirs}, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"WARNING: could not save path validation cache {path} ({e})")
+
+
+def _scan_bids_dir(root, reldir, cached, validator, ignore_rx):
+    """Validate the file names directly inside ``root/reldir``.
+
+    Returns ``(reldir, [mtime_ns, subdirs, naming_errors])``. A directory's
+    mtime changes whenever an entry is added, removed or renamed in it, so
+    an unchanged mtime means the cached listing and verdicts still hold and
+    the directory is not listed again. Symlinked directories are not
+    descended into, matching ``os.walk``.
+    """
+    full = os.path.join(root, reldir)
+    try:
+        mtime = os.stat(full).st_mtime_ns
+    except OSError:
+        return reldir, [None, [], []]
+    if cached is not None and cached[0] == mtime:
+        return reldir, cached
+    subdirs, errors = [], []
+    try:
+        with os.scandir(full) as it:
+            for entry in it:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append(entry.name)
+                    continue
+                rel = "/" + os.path.join(reldir, entry.name)
+                if _matches_bidsignore(rel, ignore_rx):
+                    continue
+                if not validator.is_bids(rel):
+                    errors.append(rel)
+    except OSError:
+        # unreadable, or removed between the stat and the listing
+        return reldir, [None, [], []]
+    return reldir, [mtime, sorted(subdirs), errors]
+
+
+def _validate_bids_paths(root: str, validator, ignore_patterns: List[str],
+                         *, since: Optional[float] = None) -> List[str]:
+    """Layer 1: every non-ignored file name under ``root`` that
+    ``BIDSValidator.is_bids`` rejects.
+
+    The tree is walked level by level with a thread pool, and per-directory
+    results are cached by (relative path, mtime) across runs, so a re-run
+    only lists and checks directories that gained, lost or renamed files.
+    With ``since`` (epoch seconds), only files modified at or after it are
+    reported — i.e. the files written by the current run.
+    """
+    import bids_validator as _bv
+    from concurrent.futures import ThreadPoolExecutor
+
+    meta = {
+        "validator": getattr(_bv, "__version__", ""),
+        "bidsignore": ignore_patterns,
+    }
+    cache_path = _path_cache_file(root)
+    cached = _load_path_cache(cache_path, meta)
+    ignore_rx = _compile_bidsignore(ignore_patterns)
+
+    dirs: Dict[str, list] = {}
+    pending = [""]
+    with ThreadPoolExecutor(max_workers=PATH_VALIDATION_WORKERS) as pool:
+        while pending:
+            level = pool.map(
+                lambda d: _scan_bids_dir(root, d, cached.get(d), validator, ignore_rx),
+                pending,
+            )
+            pending = []
+            for reldir, result in level:
+                dirs[reldir] = result
+                pending.extend(os.path.join(reldir, sub) for sub in result[1])
+    _save_path_cache(cache_path, meta, dirs)
+
+    naming_errors = [rel for result in dirs.values() for rel in result[2]]
+    if since is not None:
+        def _written(rel):
+            try:
+                return os.path.getmtime(os.path.join(root, rel.lstrip("/"))) >= since
+            except OSError:
+                return False
+        naming_errors = [rel for rel in naming_errors if _written(rel)]
+    return naming_errors
 
 
-def run_bids_validator(root: str, *, timeout: Optional[float] = None) -> bool:
+def run_bids_validator(root: str, *, timeout: Optional[float] = None,
+                       since: Optional[float] = None) -> bool:
     """Validate a BIDS dataset at ``root``.
 
     Two-layer approach:
-      1. Python path/naming validation via ``bids_validator``.
+      1. Python path/naming validation via ``bids_validator`` — parallel and
+         incremental, see :func:`_validate_bids_paths`. ``since`` limits it
+         to files written at or after that time (epoch seconds).
       2. Full CLI validation via the npm ``bids-validator`` (file contents,
          required metadata, sidecar completeness) when on PATH. Output is
-         streamed line-by-line so progress is visible while it runs.
+         streamed line-by-line so progress is visible while it runs. The
+         CLI always validates the whole dataset.
 
     Returns True if no errors were found, False otherwise. If ``timeout`` is
     set and the CLI exceeds it, the subprocess is terminated and the run is
@@ -393,20 +580,16 @@ def run_bids_validator(root: str, *, timeout: Optional[float] = None) -> bool:
         # Layer 1 doesn't flag files the npm validator would skip.
         ignore_patterns = _read_bidsignore(root)
 
-        naming_errors: List[str] = []
-        for dirpath, _, files in os.walk(root):
-            for fname in files:
-                full = os.path.join(dirpath, fname)
-                rel = "/" + os.path.relpath(full, root)
-                if _matches_bidsignore(rel, ignore_patterns):
-                    continue
-                if not validator.is_bids(rel):
-                    naming_errors.append(rel)
+        naming_errors = _validate_bids_paths(
+            root, validator, ignore_patterns, since=since,
+        )
         if naming_errors:
             print(f"[Path validation] {len(naming_errors)} file(s) with non-BIDS-compliant names:")
             for p in sorted(naming_errors):
                 print(f"  ✗ {p}")
             any_errors = True
+        elif since is not None:
+            print("[Path validation] All file names written this run are BIDS-compliant.")
         else:
             print("[Path validation] All file names are BIDS-compliant.")
     except ImportError:
@@ -526,16 +709,17 @@ def run_scalp_validation(
         bids_root=bids_root, out_path=out_dir, verbose=verbose,
         skip_if_exists=False,
     )
+    ev = _eeg_validation()
     overall_ok = True
     overall_ok &= _run_signal_pipeline(
-        "RawSignalPipeline", RawSignalPipeline(**common),
+        "RawSignalPipeline", ev.RawSignalPipeline(**common),
     )
 
     overall_ok &= _run_signal_pipeline(
-        "DigitalSignalPipeline", DigitalSignalPipeline(**common), digital=True,
+        "DigitalSignalPipeline", ev.DigitalSignalPipeline(**common), digital=True,
     )
     overall_ok &= _run_columns_pipeline(
-        "EventsPipeline", EventsPipeline(**common),
+        "EventsPipeline", ev.EventsPipeline(**common),
     )
     return overall_ok
 
@@ -560,31 +744,32 @@ def run_intra_validation(
         localization=localization, montage=montage,
         verbose=verbose, skip_if_exists=False,
     )
+    ev = _eeg_validation()
     overall_ok = True
     overall_ok &= _run_signal_pipeline(
         "RawSignalPipeline (contacts)",
-        RawSignalPipeline(**common, acquisition="contacts"),
+        ev.RawSignalPipeline(**common, acquisition="contacts"),
     )
     overall_ok &= _run_signal_pipeline(
         "RawSignalPipeline (pairs)",
-        RawSignalPipeline(**common, acquisition="pairs"),
+        ev.RawSignalPipeline(**common, acquisition="pairs"),
     )
     overall_ok &= _run_signal_pipeline(
         "DigitalSignalPipeline",
-        DigitalSignalPipeline(**common),
+        ev.DigitalSignalPipeline(**common),
         digital=True,
     )
     overall_ok &= _run_columns_pipeline(
         "EventsPipeline",
-        EventsPipeline(**common),
+        ev.EventsPipeline(**common),
     )
     overall_ok &= _run_columns_pipeline(
         "MontagePipeline (contacts)",
-        MontagePipeline(**common, acquisition="contacts"),
+        ev.MontagePipeline(**common, acquisition="contacts"),
     )
     overall_ok &= _run_columns_pipeline(
         "MontagePipeline (pairs)",
-        MontagePipeline(**common, acquisition="pairs"),
+        ev.MontagePipeline(**common, acquisition="pairs"),
     )
     return overall_ok
 
@@ -601,12 +786,8 @@ def write_session_error_csv(error_log, subject, session, out_dir, tag) -> str:
     """
     os.makedirs(out_dir, exist_ok=True)
     path = os.path.join(out_dir, f"{tag}_bids_conversion_error.csv")
-    rows: List[Dict[str, Any]] = []
-    if error_log is not None:
-        for r in getattr(error_log, "_rows", []):
-            if str(r.get("subject")) == str(subject) and int(r.get("session", -1)) == int(session):
-                rows.append(r)
-    df = pd.DataFrame(rows, columns=ERROR_CSV_COLUMNS)
+    row = error_log.error_row(subject, session) if error_log is not None else None
+    df = pd.DataFrame([row] if row else [], columns=ERROR_CSV_COLUMNS)
     df.to_csv(path, index=False)
     return path
 
@@ -615,6 +796,50 @@ def write_session_error_csv(error_log, subject, session, out_dir, tag) -> str:
 # Validation orchestration shared by both converters
 # ----------------------------------------------------------------------
 
+def validate_session(
+    subject, experiment, session, bids_root, *,
+    intracranial: bool,
+    localization: Optional[int] = None,
+    montage: Optional[int] = None,
+    verbose: bool = False,
+) -> Dict[str, Any]:
+    """Run one session's eeg-validation pipelines, teeing to its log.
+
+    Top-level and picklable so ``validate_jobs`` can hand it to a worker
+    pool or Dask; the per-session artifacts land in the session log dir
+    either way. Returns ``{subject, experiment, session, ok}``.
+    """
+    log_dir = session_log_dir(experiment, subject, session)
+    tag = session_tag(subject, experiment, session)
+    with tee_to_file(os.path.join(log_dir, f"{tag}_bids_validation.txt"), mode="w"):
+        print(f"Validation: {tag}")
+        print(SECTION_RULE)
+        print()
+        if intracranial:
+            ok = run_intra_validation(
+                subject, experiment, session, bids_root,
+                out_dir=log_dir, localization=localization, montage=montage,
+                verbose=verbose,
+            )
+        else:
+            ok = run_scalp_validation(
+                subject, experiment, session, bids_root,
+                out_dir=log_dir, verbose=verbose,
+            )
+    return {"subject": str(subject), "experiment": experiment,
+            "session": int(session), "ok": bool(ok)}
+
+
+def _map_serial(fn, kwargs_list):
+    for kwargs in kwargs_list:
+        try:
+            result = fn(**kwargs)
+        except Exception as e:
+            traceback.print_exc()
+            result = e
+        yield kwargs, result
+
+
 def validate_jobs(
     df_jobs: pd.DataFrame,
     bids_root_for_job,
@@ -627,6 +852,8 @@ def validate_jobs(
     verbose: bool = False,
     run_eeg_pipelines: bool = True,
     run_dataset_validator: bool = True,
+    written_since: Optional[float] = None,
+    map_sessions=None,
 ) -> bool:
     """Per-session pipeline validation + dataset-wide BIDS Validator.
 
@@ -653,9 +880,18 @@ def validate_jobs(
         written) but the eeg-validation pipelines are skipped. When
         ``run_dataset_validator`` is False the official BIDS Validator
         run at the end is skipped. Defaults to both True.
+    written_since : float, optional
+        Forwarded to ``run_bids_validator`` as ``since``: limit its path
+        validation to files written at or after this time (epoch seconds).
+    map_sessions : optional callable(fn, kwargs_list) -> iterable
+        Backend for the per-session pipelines: calls ``fn(**kwargs)`` for
+        each entry and yields ``(kwargs, result_or_exception)`` pairs in any
+        order. Defaults to running them one after another in this process;
+        ``cli.validation`` supplies a local process pool or Dask.
     """
     overall_ok = True
     seen_roots: Dict[str, str] = {}  # root -> experiment label (for top-level log path)
+    sessions: List[Dict[str, Any]] = []
 
     for _, row in df_jobs.iterrows():
         subj = row["subject"]
@@ -670,27 +906,31 @@ def validate_jobs(
         write_session_error_csv(error_logs.get(exp), subj, sess, log_dir, tag)
 
         if run_eeg_pipelines:
-            with tee_to_file(os.path.join(log_dir, f"{tag}_bids_validation.txt"), mode="w"):
-                print(f"Validation: {tag}")
-                print(SECTION_RULE)
-                print()
-                if intracranial:
-                    ok = run_intra_validation(
-                        subj, exp, sess, root,
-                        out_dir=log_dir,
-                        localization=localization_for_job(row) if localization_for_job else None,
-                        montage=montage_for_job(row) if montage_for_job else None,
-                        verbose=verbose,
-                    )
-                else:
-                    ok = run_scalp_validation(
-                        subj, exp, sess, root,
-                        out_dir=log_dir, verbose=verbose,
-                    )
-            overall_ok = overall_ok and ok
+            kwargs = dict(subject=subj, experiment=exp, session=sess,
+                          bids_root=root, intracranial=intracranial,
+                          verbose=verbose)
+            if intracranial:
+                kwargs["localization"] = localization_for_job(row) if localization_for_job else None
+                kwargs["montage"] = montage_for_job(row) if montage_for_job else None
+            sessions.append(kwargs)
 
         seen_roots[root] = exp
 
+    if sessions:
+        n_fail = 0
+        for kwargs, result in (map_sessions or _map_serial)(validate_session, sessions):
+            tag = session_tag(kwargs["subject"], kwargs["experiment"], kwargs["session"])
+            if isinstance(result, BaseException):
+                ok = False
+                print(f"✗ validation crashed: {tag} — {type(result).__name__}: {result}")
+            else:
+                ok = result["ok"]
+                print(f"{'✓' if ok else '✗'} validation: {tag}")
+            n_fail += not ok
+            overall_ok = overall_ok and ok
+        print(f"\nValidated {len(sessions)} session(s): "
+              f"{len(sessions) - n_fail} passed, {n_fail} failed\n")
+
     # Dataset-wide BIDS validator. One run per unique (root[, experiment]).
     if run_dataset_validator:
         if log_root_per_experiment:
@@ -698,14 +938,14 @@ def validate_jobs(
             for root, exp in seen_roots.items():
                 top = os.path.join(LOG_ROOT, str(exp), "_bids_validator.txt")
                 with tee_to_file(top, mode="w"):
-                    overall_ok = run_bids_validator(root) and overall_ok
+                    overall_ok = run_bids_validator(root, since=written_since) and overall_ok
         else:
             # Intracranial: one shared root across experiments. One log per root,
             # filed under whichever experiment we saw first (purely for layout).
             for root, exp in seen_roots.items():
                 top = os.path.join(LOG_ROOT, str(exp), "_bids_validator.txt")
                 with tee_to_file(top, mode="w"):
-                    overall_ok = run_bids_validator(root) and overall_ok
+                    overall_ok = run_bids_validator(root, since=written_since) and overall_ok
                 break  # one root for all experiments
 
     return overall_ok
@@ -10,7 +10,6 @@ from __future__ import annotations
 import json
 import os
 
-import cmlreaders as cml
 import pandas as pd
 
 from . import registry
@@ -69,53 +68,51 @@ def build_jobs(
     smokescreen: bool = False,
     recently_modified: str | None = None,
     conversion_csv: str | None = None,
+    data_index: pd.DataFrame | None = None,
 ) -> pd.DataFrame:
-    """Return the job table for this run, filtered by every selection flag."""
+    """Return the job table for this run, filtered by every selection flag.
+
+    ``data_index`` defaults to ``cmlreaders.get_data_index()``.
+    """
     columns = INTRACRANIAL_COLUMNS if modality == registry.INTRACRANIAL else BASE_COLUMNS
 
-    df = cml.get_data_index()
-    df = df.copy()
+    if data_index is None:
+        import cmlreaders as cml  # deferred: slow to import, and --help never needs it
+        data_index = cml.get_data_index()
+
+    df = data_index.copy()
     df["session"] = df["session"].astype(int)
 
     experiments = experiments or registry.experiments_for(modality)
-    df = df[df["experiment"].isin(experiments)].copy()
+    df = df[df["experiment"].isin(experiments)]
 
     if subjects:
-        df = df[df["subject"].isin(subjects)].copy()
+        df = df[df["subject"].isin(subjects)]
 
     if exclude_subjects:
-        df = df[~df["subject"].isin(set(exclude_subjects))].copy()
+        df = df[~df["subject"].isin(set(exclude_subjects))]
 
     if df.empty:
         return _empty(columns)
 
-    # Quick test mode: one subject per experiment.
+    # Quick test mode: one subject per experiment (the first, sorted).
     if smokescreen:
-        keep = []
-        for exp in df["experiment"].unique():
-            df_this = df[df["experiment"] == exp]
-            chosen = df_this["subject"].drop_duplicates().sort_values().head(1)
-            keep.append(df_this[df_this["subject"].isin(chosen)])
-        df = pd.concat(keep, ignore_index=True)
+        first = df.groupby("experiment")["subject"].transform("min")
+        # Experiments in order of first appearance, as the index lists them.
+        order = pd.factorize(df["experiment"])[0]
+        keep = (df["subject"] == first).to_numpy()
+        df = df[keep].iloc[order[keep].argsort(kind="stable")].reset_index(drop=True)
 
     if sessions_spec is not None:
-        rows = []
-        for (subject, exp), group in df.groupby(["subject", "experiment"]):
-            available = sorted(group["session"].tolist())
-            for session in parse_sessions(sessions_spec, available):
-                if session in available:
-                    rows.append(group[group["session"] == session])
-                else:
-                    print(f"WARNING: session {session} does not exist for {subject}/{exp}, skipping.")
-        if not rows:
+        df = _select_sessions(df, sessions_spec)
+        if df.empty:
             return _empty(columns)
-        df = pd.concat(rows, ignore_index=True)
 
     if recently_modified is not None:
         pairs = load_recent_pairs(recently_modified)
-        df = df[
-            df.apply(lambda r: (str(r["subject"]), int(r["session"])) in pairs, axis=1)
-        ].copy()
+        keys = pd.MultiIndex.from_arrays(
+            [df["subject"].astype(str), df["session"].astype(int)])
+        df = df[keys.isin(list(pairs))]
         print(
             f"Filtered to {len(df)} job(s) from {recently_modified} "
             f"({len(pairs)} pair(s) listed)."
@@ -130,6 +127,55 @@ def build_jobs(
     return _attach_intracranial_params(df, conversion_csv)
 
 
+def _select_sessions(df: pd.DataFrame, spec_list: list[str]) -> pd.DataFrame:
+    """Rows of ``df`` whose session matches ``spec_list`` (see
+    :func:`parse_sessions`), evaluated per (subject, experiment) at once.
+
+    Slices pick positions in each pair's sorted session list; explicit
+    sessions a pair doesn't have are warned about and skipped. Returns the
+    rows sorted by subject, experiment, session.
+    """
+    group_keys = ["subject", "experiment"]
+    df = df.sort_values(group_keys + ["session"], kind="stable")
+    grouped = df.groupby(group_keys, sort=False)["session"]
+    pos = grouped.cumcount().to_numpy()
+    n = grouped.transform("size").to_numpy()
+
+    wanted = []
+    picked = pd.Series(False, index=df.index)
+    for spec in spec_list:
+        if ":" not in spec:
+            wanted.append(int(spec))
+            continue
+        start, stop = (int(p) if p else None for p in spec.split(":", 1))
+        lo = _slice_bound(start, n, 0)
+        hi = _slice_bound(stop, n, n)
+        picked |= (pos >= lo) & (pos < hi)
+
+    if wanted:
+        picked |= df["session"].isin(wanted)
+        pairs = df[group_keys].drop_duplicates()
+        expected = pairs.merge(pd.DataFrame({"session": sorted(set(wanted))}), how="cross")
+        have = pd.MultiIndex.from_frame(df[group_keys + ["session"]])
+        missing = expected[~pd.MultiIndex.from_frame(expected).isin(have)]
+        for subject, exp, session in missing.itertuples(index=False):
+            print(f"WARNING: session {session} does not exist for {subject}/{exp}, skipping.")
+
+    # A session picked by position keeps all of its rows.
+    chosen = pd.MultiIndex.from_frame(df.loc[picked, group_keys + ["session"]])
+    rows = pd.MultiIndex.from_frame(df[group_keys + ["session"]]).isin(chosen)
+    return df[rows].reset_index(drop=True)
+
+
+def _slice_bound(bound, n, default):
+    """Per-row Python slice bound (``None`` / negative / past-the-end)."""
+    if bound is None:
+        return default
+    if bound < 0:
+        return (n + bound).clip(min=0)
+    return bound
+
+
 def _attach_intracranial_params(df: pd.DataFrame, conversion_csv: str | None) -> pd.DataFrame:
     """Attach system_version (from the data index) and unit_scale (from CSV)."""
     jobs = df[BASE_COLUMNS + ["system_version"]].copy()
@@ -0,0 +1,31 @@
+"""Import a converter module from a file path.
+
+Some converter directories cannot be imported by name (``PS2.1`` holds a
+dot), so both the registry and converters that subclass one of those load
+them from their file path. This module depends on nothing else in the
+engine, so a converter can use it without importing the orchestrator's
+registry.
+"""
+
+import importlib.util
+import sys
+
+
+def load_module_from_path(name, path):
+    """Import the .py file at ``path`` as module ``name``, once per process.
+
+    The module is registered in ``sys.modules`` under ``name`` so a later
+    load — from the registry or from another converter subclassing it —
+    gets the same module and class objects instead of re-executing the file.
+    """
+    module = sys.modules.get(name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+    return module
@@ -9,11 +9,11 @@ for the experiments actually being converted.
 from __future__ import annotations
 
 import importlib
-import importlib.util
 import os
 from dataclasses import dataclass
 
 from . import REPO_ROOT
+from .modules import load_module_from_path
 
 SCALP = "scalp"
 INTRACRANIAL = "intracranial"
@@ -38,6 +38,10 @@ DEFAULT_EXCLUDE_SUBJECTS = {
 
 _INTRACRANIAL_DIR = os.path.join(REPO_ROOT, "intracranial")
 
+# Converter classes already loaded in this process, by spec. build() runs once
+# per job, so a worker converting many sessions resolves each class once.
+_CLASS_CACHE: dict = {}
+
 
 @dataclass(frozen=True)
 class ExperimentSpec:
@@ -55,13 +59,14 @@ class ExperimentSpec:
     ctor: str = INTRACRANIAL  # "scalp" | "intracranial" | "pyFR"
 
     def load_class(self):
-        if self.module_path.endswith(".py"):
-            spec = importlib.util.spec_from_file_location(self.class_name, self.module_path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-        else:
-            module = importlib.import_module(self.module_path)
-        return getattr(module, self.class_name)
+        cls = _CLASS_CACHE.get(self)
+        if cls is None:
+            if self.module_path.endswith(".py"):
+                module = load_module_from_path(self.class_name, self.module_path)
+            else:
+                module = importlib.import_module(self.module_path)
+            cls = _CLASS_CACHE[self] = getattr(module, self.class_name)
+        return cls
 
     def build(self, subject, session, *, root, overrides, job=None):
         """Construct (but do not run) the converter for one session.
@@ -103,6 +108,20 @@ class ExperimentSpec:
         )
 
 
+def warm_up(experiments):
+    """Load the converter classes for ``experiments`` ahead of the first job.
+
+    Run once per worker so the first session on it doesn't also pay for the
+    converter imports and their class-level setup (wordpools etc.).
+    Failures are left for the job itself to report.
+    """
+    for experiment in experiments:
+        try:
+            get(experiment).load_class()
+        except Exception:
+            pass
+
+
 def _intracranial(name, package=None, class_name=None, ctor=INTRACRANIAL):
     package = package or name
     class_name = class_name or f"{name}_BIDS_converter"
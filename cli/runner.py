@@ -8,8 +8,12 @@ the console summary and the validation step have a single shape to consume.
 
 from __future__ import annotations
 
+import fcntl
+import hashlib
+import json
 import os
 import sys
+import time
 import traceback
 
 import pandas as pd
@@ -17,16 +21,22 @@ import pandas as pd
 from . import REPO_ROOT, registry
 
 from conversion_error_log import ConversionErrorLog, cmlreader_involved  # noqa: E402
-from bids_validation import session_log_dir, session_tag, tee_to_file  # noqa: E402
+from bids_validation import (  # noqa: E402
+    LOG_ROOT, _print_section, session_log_dir, session_tag, tee_to_file,
+)
 
 
 # ----------------------------------------------------------------------
 # Single job
 # ----------------------------------------------------------------------
+class VerificationError(Exception):
+    """A written file does not match the data it was written from."""
+
+
 def _result(status, subject, experiment, session, root, *, files_written=(),
             files_not_written=(), any_failure=False, raised=False, error_stage="",
             error_type="", error_message="", cmlreader_failure=False, message="",
-            no_eeg=False, no_eeg_reason=""):
+            no_eeg=False, no_eeg_reason="", checksums=None):
     return {
         "status": status,
         "subject": str(subject),
@@ -44,10 +54,12 @@ def _result(status, subject, experiment, session, root, *, files_written=(),
         "error_message": error_message or "",
         "cmlreader_failure": bool(cmlreader_failure),
         "message": message,
+        "checksums": dict(checksums or {}),
     }
 
 
-def convert_one_job(subject, experiment, session, *, root, overrides, force, job=None):
+def convert_one_job(subject, experiment, session, *, root, overrides, force, job=None,
+                    verify=False, log_level=None, metadata_only=False):
     """Run one (subject, experiment, session) job and return a result dict.
 
     Never raises: orchestration failures are reported in the returned dict so
@@ -55,6 +67,16 @@ def convert_one_job(subject, experiment, session, *, root, overrides, force, job
     outputs already exist the converter is never run and the job is reported
     as ``skip_existing`` — the caller leaves the error CSV untouched in that
     case, preserving any prior error rows.
+
+    With ``verify`` the converter remembers what it writes, and every file is
+    checked against the in-memory source right after ``run()`` — while it is
+    still loaded — instead of re-reading the source in a later pass. A
+    mismatch fails the job at stage ``'verify'``; the sha256 of each
+    verified EDF/BDF comes back under ``checksums``.
+
+    ``metadata_only`` (intracranial) regenerates sidecars, channels and
+    events around recordings already in the BIDS tree without re-reading
+    the source recording.
     """
     spec = registry.get(experiment)
     stages = registry.STAGES_BY_MODALITY[spec.modality]
@@ -64,6 +86,11 @@ def convert_one_job(subject, experiment, session, *, root, overrides, force, job
     try:
         converter = spec.build(subject, session, root=root, overrides=overrides, job=job)
         converter.force = bool(force)
+        converter.verify_written = bool(verify)
+        if log_level:
+            converter.log_level = log_level
+        if metadata_only:
+            converter.metadata_only = True
         if not converter.stages_to_run():
             return _result(
                 "skip_existing", subject, experiment, session, root,
@@ -96,6 +123,17 @@ def convert_one_job(subject, experiment, session, *, root, overrides, force, job
     failed = report["any_failure"] or exc is not None
     error_stage = report["error_stage"] or ("run" if exc is not None else "")
 
+    if verify:
+        bad = []
+        for name, ok, detail in converter.verify_written_outputs():
+            _print_section(name, ok, detail)
+            if not ok:
+                bad.append(f"{name} — {detail}")
+        if bad and not failed:
+            failed = True
+            error_stage = "verify"
+            first_exc = VerificationError("; ".join(bad))
+
     if failed:
         detail = f"{type(first_exc).__name__}: {first_exc}" if first_exc is not None else "see log"
         detail = " ".join(str(detail).splitlines()).strip()
@@ -119,10 +157,12 @@ def convert_one_job(subject, experiment, session, *, root, overrides, force, job
         error_message=" ".join(str(first_exc).splitlines()).strip() if first_exc is not None else "",
         cmlreader_failure=cmlreader_involved(first_exc) if first_exc is not None else False,
         message=message,
+        checksums=getattr(converter, "checksums", None),
     )
 
 
-def run_job(subject, experiment, session, job, root, overrides, force):
+def run_job(subject, experiment, session, job, root, overrides, force, verify=False,
+            log_level=None, metadata_only=False):
     """Top-level (picklable) worker: convert one session, teeing its output.
 
     stdout/stderr land in the per-session conversion log under
@@ -138,6 +178,7 @@ def run_job(subject, experiment, session, job, root, overrides, force):
         return convert_one_job(
             subject, experiment, int(session),
             root=root, overrides=overrides, force=force, job=job,
+            verify=verify, log_level=log_level, metadata_only=metadata_only,
         )
 
 
@@ -160,25 +201,142 @@ def make_error_logs(df_jobs, root):
     return {exp: ConversionErrorLog(root, exp) for exp in df_jobs["experiment"].unique()}
 
 
+# ----------------------------------------------------------------------
+# Result journal
+# ----------------------------------------------------------------------
+def journal_path(root, experiments=(), subjects=()):
+    """Result journal for one run selection — the BIDS root plus the
+    experiments and subjects being converted — kept under LOG_ROOT rather than
+    inside the BIDS root so it never becomes a dataset file itself. Drivers
+    converting different experiments into a shared root (FR1 and catFR1 into
+    the intracranial root) get journals of their own."""
+    selection = json.dumps([os.path.abspath(root), sorted(map(str, experiments)),
+                            sorted(map(str, subjects))])
+    digest = hashlib.sha1(selection.encode()).hexdigest()[:16]
+    return os.path.join(LOG_ROOT, "_journals", f"{digest}.jsonl")
+
+
+def _job_key(subject, experiment, session):
+    return (str(subject), experiment, int(session))
+
+
+class JournalError(RuntimeError):
+    """The result journal cannot be used for this run."""
+
+
+class _Journal:
+    """Append-only JSON-lines record of every result dict, one per line.
+
+    The first line is a header recording the run it belongs to (``header``:
+    root, experiments, subjects, overrides). Each result line is flushed and
+    fsync'd as its job finishes, so a driver that is killed mid-run loses at
+    most the job it was handling. Opening with ``resume`` keeps the existing
+    lines and exposes them as ``done`` — refused if they were written under
+    different overrides; otherwise the journal starts empty.
+
+    The journal is held under an exclusive lock while open: a second driver
+    on the same selection fails with ``JournalError`` instead of truncating
+    (or interleaving lines into) a journal that is in use.
+    """
+
+    def __init__(self, path, *, header=None, resume=False):
+        self.path = path
+        self.header = dict(header or {})
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._fh = open(path, "a")
+        try:
+            fcntl.flock(self._fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            self._fh.close()
+            raise JournalError(f"result journal {path} is in use by another driver "
+                               f"(same root, experiments and subjects)") from None
+        try:
+            self.done: dict[tuple, dict] = self._resume() if resume else {}
+            if not resume or os.path.getsize(path) == 0:
+                self._fh.truncate(0)
+                self.append({"journal": self.header})
+        except BaseException:
+            self._fh.close()
+            raise
+
+    def _resume(self):
+        header, done = self._load(self.path)
+        if header is None:
+            return {}
+        if header.get("overrides") != self.header.get("overrides"):
+            raise JournalError(
+                f"result journal {self.path} was written with overrides "
+                f"{header.get('overrides')}, not {self.header.get('overrides')}; rerun "
+                f"with the same --overwrite or without --resume-run")
+        return done
+
+    @staticmethod
+    def _load(path):
+        """``(header, results by job key)``. A torn final line (the driver
+        died mid-write) is cut off so the next append starts on a line of its
+        own."""
+        header, done = None, {}
+        if not os.path.exists(path):
+            return header, done
+        good = 0
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    result = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                good += len(line)
+                if "journal" in result:
+                    header = result["journal"]
+                    continue
+                done[_job_key(result["subject"], result["experiment"],
+                              result["session"])] = result
+        os.truncate(path, good)
+        return header, done
+
+    def append(self, result):
+        self._fh.write(json.dumps(result) + "\n")
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+
+    def close(self):
+        self._fh.close()
+
+
 # ----------------------------------------------------------------------
 # Orchestration
 # ----------------------------------------------------------------------
+# Error logs are also flushed this often mid-run, not just at the end.
+ERROR_LOG_FLUSH_S = 300
+
+
 class _Tally:
     """Shared result handling for the serial and Dask paths."""
 
-    def __init__(self, error_logs):
+    def __init__(self, error_logs, journal=None):
         self.error_logs = error_logs
+        self.journal = journal
         self.n_ok = 0
         self.n_fail = 0
         self.n_skip = 0
         self.converted_rows: list[dict] = []
+        self._last_flush = time.monotonic()
 
-    def handle(self, result):
+    def handle(self, result, *, replayed=False):
+        """Count and log one result; ``replayed`` ones came from the journal
+        and are not appended to it again."""
         if not isinstance(result, dict):
             print(f"✗ unexpected result: {result!r}")
             self.n_fail += 1
             return
 
+        if self.journal is not None and not replayed:
+            self.journal.append(result)
+        if time.monotonic() - self._last_flush > ERROR_LOG_FLUSH_S:
+            self.flush_error_logs()
+
         if result.get("status") == "skip_existing":
             # Deliberately not recorded: leave any prior error rows in place.
             self.n_skip += 1
@@ -203,6 +361,11 @@ class _Tally:
                 "session": int(result["session"]),
             })
 
+    def flush_error_logs(self):
+        for log in self.error_logs.values():
+            log.flush()
+        self._last_flush = time.monotonic()
+
     def record_unhandled(self, subject, experiment, session, exc, stages):
         """A worker died without returning a result dict."""
         self.n_fail += 1
@@ -226,7 +389,8 @@ class _Tally:
         })
 
 
-def _run_serial(df_jobs, *, modality, root, overrides, force, brain_regions, tally):
+def _run_serial(df_jobs, *, modality, root, overrides, force, brain_regions, tally,
+                verify=False, log_level=None, metadata_only=False):
     stages = registry.STAGES_BY_MODALITY[modality]
     total = len(df_jobs)
     for i, (_, row) in enumerate(df_jobs.iterrows(), start=1):
@@ -236,16 +400,27 @@ def _run_serial(df_jobs, *, modality, root, overrides, force, brain_regions, tal
             result = run_job(
                 subject, experiment, session,
                 job_payload(row, modality, brain_regions),
-                root, overrides, force,
+                root, overrides, force, verify, log_level, metadata_only,
             )
             tally.handle(result)
         except Exception as e:
             tally.record_unhandled(subject, experiment, session, e, stages)
 
 
-def _run_parallel(df_jobs, *, modality, root, overrides, force, brain_regions, tally, dask_opts):
+_DASK_CLIENT = None
+
+
+def dask_client(dask_opts):
+    """The Slurm+Dask client for this process, created on first use.
+
+    Conversion and validation share it, so ``--validate`` reuses the
+    workers the conversion already paid to start.
+    """
+    global _DASK_CLIENT
+    if _DASK_CLIENT is not None:
+        return _DASK_CLIENT
+
     import cmldask.CMLDask as da
-    from dask.distributed import as_completed
     from distributed.diagnostics.plugin import WorkerPlugin
 
     class _BidsConvertPath(WorkerPlugin):
@@ -256,8 +431,6 @@ def _run_parallel(df_jobs, *, modality, root, overrides, force, brain_regions, t
             if REPO_ROOT not in _sys.path:
                 _sys.path.insert(0, REPO_ROOT)
 
-    stages = registry.STAGES_BY_MODALITY[modality]
-
     log_dir = os.path.expanduser(dask_opts["log_directory"])
     os.makedirs(log_dir, exist_ok=True)
 
@@ -273,6 +446,33 @@ def _run_parallel(df_jobs, *, modality, root, overrides, force, brain_regions, t
     # Ship conversion_error_log.py so pickled ConversionErrorLog objects
     # deserialize even before the path plugin has run on a new worker.
     client.upload_file(os.path.join(REPO_ROOT, "conversion_error_log.py"))
+    _DASK_CLIENT = client
+    return client
+
+
+def _run_parallel(df_jobs, *, modality, root, overrides, force, brain_regions, tally, dask_opts,
+                  verify=False, log_level=None, metadata_only=False):
+    from dask.distributed import as_completed
+
+    from distributed.diagnostics.plugin import WorkerPlugin
+
+    stages = registry.STAGES_BY_MODALITY[modality]
+    client = dask_client(dask_opts)
+
+    experiments = sorted(df_jobs["experiment"].unique())
+
+    class _WarmUp(WorkerPlugin):
+        """Load this run's converter classes once per worker, including
+        workers the adaptive cluster starts later."""
+
+        def setup(self, worker):
+            import sys as _sys
+            if REPO_ROOT not in _sys.path:
+                _sys.path.insert(0, REPO_ROOT)
+            from cli import registry as _registry
+            _registry.warm_up(experiments)
+
+    client.register_worker_plugin(_WarmUp(), name="bids-convert-warm-up")
 
     jobs = [job_payload(row, modality, brain_regions) for _, row in df_jobs.iterrows()]
     n = len(df_jobs)
@@ -286,6 +486,9 @@ def _run_parallel(df_jobs, *, modality, root, overrides, force, brain_regions, t
         [root] * n,
         [overrides] * n,
         [force] * n,
+        [verify] * n,
+        [log_level] * n,
+        [metadata_only] * n,
     )
 
     # Key futures back to their job so a dead worker is attributed correctly.
@@ -308,28 +511,131 @@ def _run_parallel(df_jobs, *, modality, root, overrides, force, brain_regions, t
                 tally.record_unhandled(*job, e, stages)
 
 
+def _drop_existing(df_jobs, *, modality, root, overrides, brain_regions, tally,
+                   log_level=None):
+    """Skip fully-converted jobs in the driver, before any worker starts.
+
+    Builds each job's converter here (construction is I/O-free) and asks
+    ``stages_to_run`` against one cached ``OutputListing`` of the BIDS root,
+    so the check costs one directory walk per subject rather than a stat per
+    expected file per session. Jobs with nothing to run are reported to the
+    tally as ``skip_existing`` — exactly what their worker would have returned
+    — and the rest are returned for dispatch. Any job whose converter cannot
+    be built here is left for the worker to run and report; the error is
+    printed at INFO (with its traceback at DEBUG) so a bug in the check
+    itself does not go unnoticed.
+    """
+    stages = registry.STAGES_BY_MODALITY[modality]
+    if any((overrides or {}).get(s) for s in stages):
+        return df_jobs      # an overwritten stage runs for every job
+
+    from .stages import LOG_LEVEL, LOG_LEVELS, OutputListing
+
+    level = LOG_LEVELS.index(log_level or LOG_LEVEL)
+    listing = OutputListing(root)
+    unbuildable = set()
+    keep = []
+    for _, row in df_jobs.iterrows():
+        subject, experiment, session = row["subject"], row["experiment"], int(row["session"])
+        todo = True
+        if experiment not in unbuildable:
+            try:
+                converter = registry.get(experiment).build(
+                    subject, session, root=root, overrides=overrides,
+                    job=job_payload(row, modality, brain_regions),
+                )
+                converter.output_listing = listing
+                todo = bool(converter.stages_to_run())
+            except ImportError:
+                unbuildable.add(experiment)     # converter imports unavailable in the driver
+            except Exception as exc:
+                if level <= LOG_LEVELS.index("INFO"):
+                    print(f"  could not pre-check {subject} {experiment} {session} "
+                          f"({type(exc).__name__}: {exc}); leaving it to the worker")
+                if level <= LOG_LEVELS.index("DEBUG"):
+                    traceback.print_exc()
+        if not todo:
+            tally.handle(_result(
+                "skip_existing", subject, experiment, session, root,
+                files_written=stages,
+                message=f"SKIP existing outputs: {subject} {experiment} {session}",
+            ))
+        keep.append(todo)
+
+    n_skip = len(keep) - sum(keep)
+    if n_skip:
+        print(f"Skipped {n_skip} of {len(keep)} job(s) with every stage already on disk\n")
+    return df_jobs.loc[keep]
+
+
 def run_jobs(df_jobs, *, modality, root, overrides, force, serial,
-             brain_regions=None, dask_opts=None, error_logs=None):
+             brain_regions=None, dask_opts=None, error_logs=None, verify=False,
+             resume=False, log_level=None, metadata_only=False):
     """Convert every job in ``df_jobs``; return the tally.
 
     Returns a ``_Tally`` carrying counts, the rows that actually ran (for
     validation) and the per-experiment error logs, already flushed.
+    ``verify`` turns on the in-worker written-file checks (see
+    ``convert_one_job``).
+
+    Every result is appended to the run's journal (``journal_path``: root,
+    experiments and subjects) as it arrives. With ``resume``, jobs already in
+    the journal — finished, failed or skipped — are not resubmitted; their
+    results are replayed into the tally instead, so the summary covers the
+    whole run. Resuming under different ``overrides``, or opening a journal
+    another driver holds, raises ``JournalError``.
+
+    Jobs whose outputs are all on disk already are dropped in the driver
+    before dispatch (``_drop_existing``) and counted as skipped.
+
+    ``log_level`` (DEBUG / INFO / WARN) sets the converters' verbosity;
+    None keeps the BIDS_CONVERT_LOG_LEVEL default. ``metadata_only`` is
+    passed through to ``convert_one_job``.
     """
     error_logs = error_logs if error_logs is not None else make_error_logs(df_jobs, root)
-    tally = _Tally(error_logs)
-
-    if serial:
-        print("Running SERIALLY (no Dask)\n")
-        _run_serial(df_jobs, modality=modality, root=root, overrides=overrides,
-                    force=force, brain_regions=brain_regions, tally=tally)
-    else:
-        print("Running in PARALLEL via Slurm+Dask\n")
-        _run_parallel(df_jobs, modality=modality, root=root, overrides=overrides,
-                      force=force, brain_regions=brain_regions, tally=tally,
-                      dask_opts=dask_opts or {})
+    experiments = sorted(df_jobs["experiment"].unique())
+    subjects = sorted(df_jobs["subject"].astype(str).unique())
+    journal = _Journal(
+        journal_path(root, experiments, subjects),
+        header={"root": os.path.abspath(root), "experiments": experiments,
+                "subjects": subjects, "overrides": overrides},
+        resume=resume,
+    )
+    tally = _Tally(error_logs, journal)
+
+    if journal.done:
+        keys = [_job_key(*k) for k in zip(df_jobs["subject"], df_jobs["experiment"],
+                                          df_jobs["session"])]
+        finished = [k in journal.done for k in keys]
+        print(f"Resuming from {journal.path}: {sum(finished)} of {len(keys)} "
+              f"job(s) already finished\n")
+        for key, done in zip(keys, finished):
+            if done:
+                tally.handle(journal.done[key], replayed=True)
+        df_jobs = df_jobs.loc[[not done for done in finished]]
 
-    for log in error_logs.values():
-        log.flush()
+    try:
+        if not df_jobs.empty:
+            df_jobs = _drop_existing(df_jobs, modality=modality, root=root,
+                                     overrides=overrides, brain_regions=brain_regions,
+                                     tally=tally, log_level=log_level)
+        if df_jobs.empty:
+            print("Nothing left to run.\n")
+        elif serial:
+            print("Running SERIALLY (no Dask)\n")
+            _run_serial(df_jobs, modality=modality, root=root, overrides=overrides,
+                        force=force, brain_regions=brain_regions, tally=tally,
+                        verify=verify, log_level=log_level,
+                        metadata_only=metadata_only)
+        else:
+            print("Running in PARALLEL via Slurm+Dask\n")
+            _run_parallel(df_jobs, modality=modality, root=root, overrides=overrides,
+                          force=force, brain_regions=brain_regions, tally=tally,
+                          dask_opts=dask_opts or {}, verify=verify,
+                          log_level=log_level, metadata_only=metadata_only)
+    finally:
+        journal.close()
+        tally.flush_error_logs()
 
     print(f"\nDone. ok={tally.n_ok} skipped={tally.n_skip} fail={tally.n_fail}")
     return tally
@@ -8,11 +8,11 @@ and lives here. Only ``_stage_outputs_exist`` stays modality-specific, since
 the two write genuinely different filenames.
 """
 
+import fnmatch
+import glob
 import json
 import os
-
-import mne_bids
-import pandas as pd
+from pathlib import Path
 
 _MNE_BIDS_CITATION = (
     "Appelhoff, S., Sanderson, M., Brooks, T., Vliet, M., Quentin, R., "
@@ -40,6 +40,138 @@ EEG_BIDS_CITATION = (
 )
 
 
+def _verify_events(path, source, sfreq):
+    """``(ok, detail)``: does the events TSV at ``path`` carry the source
+    events it was converted from?
+
+    ``source`` holds the source ``eegoffset`` and ``type`` of every event, in
+    order. The written table must have one row per source event, its
+    ``trial_type`` must be the source ``type`` and — when ``sfreq`` is known
+    — the ``onset`` of every event aligned to the recording (eegoffset >= 0)
+    must be ``eegoffset / sfreq`` to within half a sample.
+    """
+    import numpy as np
+    import pandas as pd
+
+    written = pd.read_csv(path, sep="\t", dtype=str, keep_default_na=False)
+    if len(written) != len(source):
+        return False, f"{len(written)} rows on disk, source has {len(source)} events"
+
+    if "trial_type" in written.columns:
+        # Missing / empty source types are written as n/a.
+        expected = ["n/a" if t is None or t != t or t == "" else str(t) for t in source["type"]]
+        bad = np.flatnonzero(written["trial_type"].to_numpy() != np.asarray(expected, dtype=object))
+        if bad.size:
+            i = bad[0]
+            return False, (f"row {i + 1}: trial_type {written['trial_type'].iat[i]!r}, "
+                           f"source type {expected[i]!r}")
+
+    if sfreq and "onset" in written.columns:
+        eegoffset = pd.to_numeric(source["eegoffset"], errors="coerce").to_numpy(dtype=float)
+        onset = pd.to_numeric(written["onset"], errors="coerce").to_numpy(dtype=float)
+        aligned = eegoffset >= 0
+        bad = np.flatnonzero(aligned & ~(np.abs(onset - eegoffset / sfreq) <= 0.5 / sfreq))
+        if bad.size:
+            i = bad[0]
+            return False, (f"row {i + 1}: onset {written['onset'].iat[i]!r}, expected "
+                           f"eegoffset/sfreq = {float(eegoffset[i] / sfreq)!r}")
+    return True, ""
+
+
+class OutputListing:
+    """Cached listing of the BIDS tree under ``root``, one walk per subject.
+
+    Lets the orchestrator ask ``stages_to_run`` of thousands of sessions
+    without a stat per expected file: the first query under ``sub-<label>/``
+    walks that subject directory with ``os.scandir`` and every later query for
+    any of its sessions is answered from memory. Paths outside a subject
+    directory fall through to the filesystem. The listing is a snapshot —
+    build a fresh one per run.
+    """
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self._dirs = {}         # directory -> frozenset of entry names
+        self._scanned = set()   # subject directories already walked
+
+    def _scan(self, directory, seen=None):
+        # Symlinked directories are followed, so each directory is keyed by
+        # (st_dev, st_ino) and listed once: a link loop would otherwise
+        # recurse until RecursionError.
+        seen = set() if seen is None else seen
+        try:
+            st = os.stat(directory)
+            if (st.st_dev, st.st_ino) in seen:
+                return
+            seen.add((st.st_dev, st.st_ino))
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return
+        self._dirs[directory] = frozenset(e.name for e in entries)
+        for e in entries:
+            if e.is_dir(follow_symlinks=True):
+                self._scan(e.path, seen)
+
+    def _subject_dir(self, directory):
+        rel = os.path.relpath(directory, self.root)
+        top = rel.split(os.sep, 1)[0]
+        if not top.startswith('sub-'):
+            return None
+        return os.path.join(self.root, top)
+
+    def names(self, directory):
+        """Entry names in ``directory``, or None if it is not a directory."""
+        directory = os.path.abspath(directory)
+        subject_dir = self._subject_dir(directory)
+        if subject_dir is None:
+            try:
+                return frozenset(os.listdir(directory))
+            except OSError:
+                return None
+        if subject_dir not in self._scanned:
+            self._scanned.add(subject_dir)
+            self._scan(subject_dir)
+        return self._dirs.get(directory)
+
+    def exists(self, path):
+        directory, name = os.path.split(os.path.abspath(path))
+        names = self.names(directory)
+        return names is not None and name in names
+
+    def isdir(self, path):
+        return self.names(path) is not None
+
+    def glob(self, pattern):
+        """``glob.glob`` for a pattern whose wildcards are in the last component."""
+        directory, pat = os.path.split(pattern)
+        names = self.names(directory) or ()
+        hidden_ok = pat.startswith('.')
+        return [os.path.join(directory, n) for n in sorted(names)
+                if fnmatch.fnmatchcase(n, pat) and (hidden_ok or not n.startswith('.'))]
+
+
+# Converter progress output, least to most severe. Messages below the active
+# level are dropped; [WARN] / WARNING lines are always printed.
+LOG_LEVELS = ("DEBUG", "INFO", "WARN")
+
+
+def _env_log_level():
+    """BIDS_CONVERT_LOG_LEVEL, checked once: WARNING is taken as WARN, and
+    anything else outside LOG_LEVELS falls back to INFO with a warning."""
+    raw = os.environ.get("BIDS_CONVERT_LOG_LEVEL", "INFO")
+    level = raw.strip().upper()
+    level = {"WARNING": "WARN"}.get(level, level)
+    if level not in LOG_LEVELS:
+        print(f"[WARN] BIDS_CONVERT_LOG_LEVEL={raw!r} is not one of "
+              f"{', '.join(LOG_LEVELS)}; using INFO")
+        return "INFO"
+    return level
+
+
+LOG_LEVEL = _env_log_level()
+
+
 class StageGatedConverter:
     """Mixin providing stage bookkeeping, failure policy and root BIDS files.
 
@@ -61,6 +193,14 @@ class StageGatedConverter:
     # remaining stages still run. Set by the orchestrator from --force.
     force = False
 
+    # Verbosity of the progress messages routed through ``_log``. Set by the
+    # orchestrator from --log-level (default: BIDS_CONVERT_LOG_LEVEL or INFO).
+    log_level = LOG_LEVEL
+
+    def _log(self, level, msg):
+        if LOG_LEVELS.index(level) >= LOG_LEVELS.index(self.log_level):
+            print(msg)
+
     # ------------------------------------------------------------------
     # Stage bookkeeping
     # ------------------------------------------------------------------
@@ -97,6 +237,25 @@ class StageGatedConverter:
             self.first_exception = exc
             self.first_error_stage = stage
 
+    # Set by the orchestrator's pre-dispatch scan so ``_stage_outputs_exist``
+    # reads a cached OutputListing instead of stat-ing every expected file.
+    output_listing = None
+
+    def _exists(self, path):
+        if self.output_listing is not None:
+            return self.output_listing.exists(path)
+        return os.path.exists(path)
+
+    def _isdir(self, path):
+        if self.output_listing is not None:
+            return self.output_listing.isdir(path)
+        return os.path.isdir(path)
+
+    def _glob(self, pattern):
+        if self.output_listing is not None:
+            return self.output_listing.glob(pattern)
+        return glob.glob(pattern)
+
     def _should_run(self, stage):
         if self.overrides.get(stage, False):
             return True
@@ -125,6 +284,94 @@ class StageGatedConverter:
             raise RuntimeError(msg) from exc
         print(f"[WARN] {msg}")
 
+    # ------------------------------------------------------------------
+    # TSV tables
+    # ------------------------------------------------------------------
+    def _to_tsv(self, frame, path):
+        """Write ``frame`` to ``path`` as a BIDS TSV (``cli.tsv``: missing and
+        empty cells become ``n/a``).
+
+        The serialized bytes are cached per frame object, so a table written
+        to more than one file — the events go to beh.tsv and to events.tsv
+        once per acquisition — is serialized once. Frames are treated as
+        immutable once written; build a new one rather than editing in place.
+        """
+        cache = self.__dict__.setdefault('_tsv_cache', {})
+        entry = cache.get(id(frame))
+        if entry is None or entry[0] is not frame:
+            from .tsv import tsv_bytes
+
+            # Holding the frame keeps its id from being reused while cached.
+            entry = cache[id(frame)] = (frame, tsv_bytes(frame))
+        with open(path, 'wb') as f:
+            f.write(entry[1])
+
+    # ------------------------------------------------------------------
+    # In-worker verification (opt-in)
+    # ------------------------------------------------------------------
+    # Set by the orchestrator from --verify-in-worker. When True the writers
+    # remember what they put on disk — the digital samples exactly as loaded
+    # from the source, and the source events behind each events table — so
+    # ``verify_written_outputs`` can check the files against them in the same
+    # worker, without a second read of the source recording.
+    verify_written = False
+
+    def _remember_written(self, kind, path, *payload):
+        """Record a written file for ``verify_written_outputs``.
+
+        ``kind`` is ``'digital'`` (payload: labels, signals_int),
+        ``'digests'`` (payload: labels, a ``ChannelDigests`` taken as the
+        blocks streamed out) or ``'events'`` (payload: the source events and
+        sfreq recorded by ``_remember_source_events``).
+        """
+        if self.verify_written:
+            self.__dict__.setdefault('_written_outputs', []).append(
+                (kind, str(path), payload))
+
+    def _remember_source_events(self, eegoffset, types, sfreq):
+        """Keep the source ``eegoffset`` / ``type`` of the events table being
+        built (one entry per row it will have) for the events check."""
+        if self.verify_written:
+            import pandas as pd
+
+            self._source_events = (
+                pd.DataFrame({'eegoffset': list(eegoffset), 'type': list(types)}), sfreq)
+
+    def _remember_events_written(self, path):
+        if self.verify_written and getattr(self, '_source_events', None) is not None:
+            self._remember_written('events', path, *self._source_events)
+
+    def verify_written_outputs(self):
+        """Check every remembered file against the data it came from.
+
+        Returns ``[(name, ok, detail)]``, one per file. Digital files must
+        hold exactly the source integers (or, for streamed recordings, hash
+        per channel to the blocks that were written); events TSVs must match
+        the source events row for row (``_verify_events``). The sha256 of
+        each verified digital file is kept in ``self.checksums`` (path
+        relative to the BIDS root).
+        """
+        from intracranial.edf_digital_writer import verify_digital, verify_digital_digests
+
+        checks = []
+        self.checksums = {}
+        for kind, path, payload in getattr(self, '_written_outputs', []):
+            label = 'Events' if kind == 'events' else 'Digital'
+            name = f"{label} check: {os.path.basename(path)}"
+            try:
+                if kind in ('digital', 'digests'):
+                    verify = verify_digital if kind == 'digital' else verify_digital_digests
+                    ok, detail, sha256 = verify(path, *payload)
+                    if ok:
+                        self.checksums[os.path.relpath(path, self.root)] = sha256
+                        detail = f"sha256 {sha256}"
+                else:
+                    ok, detail = _verify_events(path, *payload)
+            except Exception as e:
+                ok, detail = False, f"{type(e).__name__}: {e}"
+            checks.append((name, ok, detail))
+        return checks
+
     # ------------------------------------------------------------------
     # Root-level BIDS files
     # ------------------------------------------------------------------
@@ -164,20 +411,29 @@ class StageGatedConverter:
     # ------------------------------------------------------------------
     # scans.tsv
     # ------------------------------------------------------------------
-    def _update_scans_tsv(self, data_file_path):
-        """Append a row for the new recording to ``scans.tsv``.
+    def _scans_tsv_path(self):
+        """The session's ``scans.tsv``; converters with a precomputed path
+        plan return it from there."""
+        import mne_bids
 
-        BIDS spec: ``scans.tsv`` lists every recording in the session with a
-        path relative to the session directory. We append rather than
-        overwrite so multiple acquisitions in the same session coexist.
-        """
-        scans_tsv = mne_bids.BIDSPath(
+        return mne_bids.BIDSPath(
             subject=self.subject,
             session=str(self.session),
             suffix="scans",
             extension=".tsv",
             root=self.root,
         ).fpath
+
+    def _update_scans_tsv(self, data_file_path):
+        """Append a row for the new recording to ``scans.tsv``.
+
+        BIDS spec: ``scans.tsv`` lists every recording in the session with a
+        path relative to the session directory. We append rather than
+        overwrite so multiple acquisitions in the same session coexist.
+        """
+        import pandas as pd
+
+        scans_tsv = Path(self._scans_tsv_path())
         # Path relative to the session directory.
         rel_path = os.path.relpath(data_file_path, scans_tsv.parent)
         new_row = pd.DataFrame([{"filename": rel_path}])
@@ -0,0 +1,91 @@
+"""BIDS TSV serialization shared by the scalp and intracranial converters.
+
+Every table the converters write (events, beh, channels, electrodes, channel
+maps) goes through ``tsv_bytes``: the same text ``DataFrame.to_csv(sep="\\t",
+index=False)`` produces, except that missing cells — NaN / None / NaT / pd.NA
+and empty strings — are written as ``n/a``, as BIDS requires. Substituting
+while serializing means the builders no longer need a whole-frame
+``fillna('n/a').replace('', 'n/a')`` pass, which copies the frame and scans
+every cell twice.
+
+Numeric columns are converted to strings with numpy (``astype(str)`` is what
+pandas' own CSV formatter uses, so floats keep their shortest round-trip
+repr), object columns with ``str`` per cell, and rows are joined in C via
+``str.join``; only a column that actually holds a tab, quote or line break
+is quoted cell by cell, with the same minimal quoting the csv module
+applies. Frames with datetime / timedelta / complex columns take the
+``to_csv`` path.
+"""
+
+import csv
+import io
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+NA = "n/a"
+
+
+def _quoted_chars():
+    """The characters that make the csv module (and so ``to_csv``) quote a
+    field. Whether a bare carriage return counts varies between Python
+    versions, so ask rather than assume."""
+    chars = []
+    for c in '\t"\r\n':
+        buf = io.StringIO()
+        csv.writer(buf, delimiter="\t", lineterminator=os.linesep).writerow([f"a{c}b", "c"])
+        if buf.getvalue().startswith('"'):
+            chars.append(c)
+    return chars
+
+
+_NEEDS_QUOTE = re.compile("[" + re.escape("".join(_quoted_chars())) + "]")
+
+
+def _quote(values):
+    return ['"' + v.replace('"', '""') + '"' if _NEEDS_QUOTE.search(v) else v
+            for v in values]
+
+
+def _column_strings(column, na_rep):
+    if isinstance(column.dtype, pd.api.extensions.ExtensionDtype):
+        values = column.to_numpy(dtype=object)   # Int64 etc. keep their own repr
+    else:
+        values = column.to_numpy()
+    kind = values.dtype.kind
+    if kind in "iub":                           # ints / bools can't be missing
+        return values.astype(str).tolist()
+    missing = pd.isna(column).to_numpy()
+    if kind == "f":
+        return np.where(missing, na_rep, values.astype(str)).tolist()
+    # object / extension dtypes: str() per cell, as to_csv does
+    strings = [na_rep if m or not s else s for s, m in zip(map(str, values), missing)]
+    if _NEEDS_QUOTE.search("".join(strings)):
+        strings = _quote(strings)
+    return strings
+
+
+def _fallback(frame, na_rep):
+    return frame.replace("", na_rep).to_csv(sep="\t", index=False, na_rep=na_rep)
+
+
+def tsv_text(frame, na_rep=NA):
+    """``frame`` as TSV text, with missing / empty cells written as ``na_rep``."""
+    if (len(frame.columns) < 2 or isinstance(frame.columns, pd.MultiIndex)
+            or any(dtype.kind in "mMc" for dtype in frame.dtypes)):
+        # A lone column's empty cells are quoted by csv ('""'); leave these
+        # rare shapes (and non-numpy-formattable dtypes) to pandas.
+        return _fallback(frame, na_rep)
+    newline = os.linesep
+    header = _quote([str(c) for c in frame.columns])
+    columns = [_column_strings(frame.iloc[:, i], na_rep) for i in range(len(frame.columns))]
+    lines = ["\t".join(header)]
+    lines.extend(map("\t".join, zip(*columns)))
+    return newline.join(lines) + newline
+
+
+def tsv_bytes(frame, na_rep=NA):
+    """``tsv_text(frame)`` encoded as UTF-8."""
+    return tsv_text(frame, na_rep).encode("utf-8")
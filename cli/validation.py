@@ -2,12 +2,14 @@
 
 Thin wrapper over ``bids_validation.validate_jobs``: resolves which of the two
 validation layers the flags asked for, then runs them against the single BIDS
-root the CLI was given.
+root the CLI was given. The per-session pipelines run on the same backend as
+conversion — serially with --serial, otherwise on the Slurm+Dask cluster — or
+in a local process pool with --validate-workers.
 """
 
 from __future__ import annotations
 
-from bids_validation import validate_jobs
+from functools import partial
 
 from .registry import INTRACRANIAL
 
@@ -29,8 +31,52 @@ def validation_requested(args) -> bool:
     return bool(args.validate or args.bids_validator or args.eeg_validator)
 
 
-def validate_bids(args, df_jobs, error_logs, modality: str) -> bool:
-    """Run per-session eeg-validation pipelines and/or the BIDS Validator."""
+def _map_local_pool(fn, kwargs_list, *, workers):
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(fn, **kwargs): kwargs for kwargs in kwargs_list}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except Exception as e:
+                yield futures[future], e
+
+
+def _map_dask(fn, kwargs_list, *, dask_opts):
+    from dask.distributed import as_completed
+
+    from .runner import dask_client
+
+    client = dask_client(dask_opts)
+    futures = {client.submit(fn, pure=False, **kwargs): kwargs for kwargs in kwargs_list}
+    for future in as_completed(futures):
+        try:
+            yield futures[future], future.result()
+        except Exception as e:
+            yield futures[future], e
+
+
+def session_mapper(args, dask_opts=None):
+    """The ``map_sessions`` backend the flags select (None = serial)."""
+    if args.serial:
+        return None
+    workers = getattr(args, "validate_workers", None)
+    if workers:
+        return partial(_map_local_pool, workers=workers)
+    return partial(_map_dask, dask_opts=dask_opts or {})
+
+
+def validate_bids(args, df_jobs, error_logs, modality: str, *,
+                  written_since=None, dask_opts=None) -> bool:
+    """Run per-session eeg-validation pipelines and/or the BIDS Validator.
+
+    ``written_since`` (the conversion's start time) scopes the validator's
+    path checks to this run's output when --validate-written is set.
+    ``dask_opts`` configures the cluster when validation runs on Dask.
+    """
+    from bids_validation import validate_jobs
+
     run_eeg, run_bids = resolve_validation_flags(args)
     return validate_jobs(
         df_jobs,
@@ -43,4 +89,6 @@ def validate_bids(args, df_jobs, error_logs, modality: str) -> bool:
         verbose=args.verbose,
         run_eeg_pipelines=run_eeg,
         run_dataset_validator=run_bids,
+        written_since=written_since if getattr(args, "validate_written", False) else None,
+        map_sessions=session_mapper(args, dask_opts) if run_eeg else None,
     )
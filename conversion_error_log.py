@@ -5,10 +5,19 @@ listing only jobs that had at least one failure. Rows are upserted by
 (subject, session): re-running a subject replaces its prior row, and a
 subject that now succeeds has its prior row dropped.
 
-The CSV name is also added to `.bidsignore` so BIDS validation ignores it.
+The rows themselves live in `bids_conversion_log.sqlite` at the root, keyed
+by (task, subject, session), so an upsert touches only the sessions that ran
+rather than rewriting the whole table. A task's CSV is re-exported from it
+only when a flush actually changed that table's rows (or the CSV is missing),
+so the periodic flushes of a long run don't re-read the whole table each
+time. A pre-existing CSV with no rows in the database yet is imported once.
+
+The CSV and database names are also added to `.bidsignore` so BIDS
+validation ignores them.
 """
 
 import os
+import sqlite3
 import traceback as _tb
 
 import pandas as pd
@@ -34,11 +43,23 @@ NOEEG_COLUMNS = [
     "reason",
 ]
 
+DB_FILENAME = "bids_conversion_log.sqlite"
+
 _BIDSIGNORE_PATTERNS = (
     "bids_conversion_error_*.csv",
     "bids_conversion_noeeg_*.csv",
+    DB_FILENAME + "*",   # plus the -journal / -wal / -shm sidecars
 )
 
+# SQLite table -> (CSV filename template, columns, label) for each log.
+_TABLES = {
+    "errors": ("bids_conversion_error_{task}.csv", CSV_COLUMNS, "conversion error log"),
+    "noeeg": ("bids_conversion_noeeg_{task}.csv", NOEEG_COLUMNS, "no-EEG session log"),
+}
+
+# Seconds a writer waits on another process's lock before giving up.
+_DB_TIMEOUT_S = 300
+
 
 def cmlreader_involved(exc: BaseException) -> bool:
     """True if any frame in the exception's traceback is inside the cmlreaders package."""
@@ -59,23 +80,38 @@ def _one_line(msg: str) -> str:
 
 
 class ConversionErrorLog:
-    """Collects per-job failure rows and flushes to a task CSV on demand.
+    """Collects per-job failure rows and flushes them to the task tables.
 
     One instance per (root, task). The orchestrator calls `record_attempt()`
     for every job it tries (to build the upsert key set), then
     `record_failure()` only for jobs that failed (partial or full).
-    `flush()` writes the merged CSV and updates `.bidsignore`.
+    `flush()` upserts into the root's SQLite store in one transaction,
+    re-exports the task CSVs whose rows changed and updates `.bidsignore`.
+
+    No connection is held between calls, so instances pickle cleanly and
+    any number of processes can flush into the same root.
     """
 
     def __init__(self, root: str, task: str):
         self.root = root
         self.task = task
         self._attempted: set[tuple[str, int]] = set()
-        self._rows: list[dict] = []
-        self._noeeg_rows: list[dict] = []
+        self._pending: set[tuple[str, int]] = set()   # attempted since last flush
+        self._rows: dict[tuple[str, int], dict] = {}
+        self._noeeg_rows: dict[tuple[str, int], dict] = {}
+
+    @property
+    def db_path(self) -> str:
+        return os.path.join(self.root, DB_FILENAME)
 
     def record_attempt(self, subject: str, session):
-        self._attempted.add((str(subject), int(session)))
+        key = (str(subject), int(session))
+        self._attempted.add(key)
+        self._pending.add(key)
+
+    def error_row(self, subject, session):
+        """This run's error row for (subject, session), or None."""
+        return self._rows.get((str(subject), int(session)))
 
     def record_result(self, result: dict):
         """Record a job result dict produced by a converter orchestrator.
@@ -93,76 +129,129 @@ class ConversionErrorLog:
         and mixing them into the error CSV hides the failures that matter.
         """
         self.record_attempt(result["subject"], result["session"])
+        key = (str(result["subject"]), int(result["session"]))
+        self._rows.pop(key, None)
+        self._noeeg_rows.pop(key, None)
         if result.get("no_eeg"):
-            self._noeeg_rows.append({
-                "subject": str(result["subject"]),
+            self._noeeg_rows[key] = {
+                "subject": key[0],
                 "experiment": result["experiment"],
-                "session": int(result["session"]),
+                "session": key[1],
                 "files_written": ",".join(result.get("files_written") or []),
                 "reason": _one_line(result.get("no_eeg_reason") or "no EEG recording"),
-            })
+            }
         if not (result.get("any_failure") or result.get("raised")):
             return
-        self._rows.append({
-            "subject": str(result["subject"]),
+        self._rows[key] = {
+            "subject": key[0],
             "experiment": result["experiment"],
-            "session": int(result["session"]),
+            "session": key[1],
             "files_written": ",".join(result.get("files_written") or []),
             "files_not_written": ",".join(result.get("files_not_written") or []),
             "error_stage": result.get("error_stage") or "",
             "error_type": result.get("error_type") or "",
             "error_message": _one_line(result.get("error_message") or ""),
             "cmlreader_failure": bool(result.get("cmlreader_failure")),
-        })
+        }
 
     def flush(self):
         os.makedirs(self.root, exist_ok=True)
-        csv_path = self._flush_table(
-            f"bids_conversion_error_{self.task}.csv",
-            CSV_COLUMNS, self._rows, "conversion error log",
-        )
-        self._flush_table(
-            f"bids_conversion_noeeg_{self.task}.csv",
-            NOEEG_COLUMNS, self._noeeg_rows, "no-EEG session log",
-        )
+        con = self._connect()
+        changed = set()
+        try:
+            with con:
+                con.execute("BEGIN IMMEDIATE")
+                for table, rows in (("errors", self._rows), ("noeeg", self._noeeg_rows)):
+                    before = con.total_changes
+                    self._import_legacy_csv(con, table)
+                    self._upsert(con, table, rows)
+                    if con.total_changes != before:
+                        changed.add(table)
+            self._pending.clear()
+            for table in _TABLES:
+                if table in changed or not os.path.exists(self._csv_path(table)):
+                    self._export_csv(con, table)
+        finally:
+            con.close()
         self._ensure_bidsignore()
-        return csv_path
+        return self._csv_path("errors")
 
-    def _flush_table(self, filename, columns, rows, label):
-        """Merge `rows` into `filename`, upserting by (subject, session).
+    # ------------------------------------------------------------------
+    # SQLite store
+    # ------------------------------------------------------------------
+    def _connect(self):
+        con = sqlite3.connect(self.db_path, timeout=_DB_TIMEOUT_S,
+                              isolation_level=None)
+        for table, (_, columns, _) in _TABLES.items():
+            cols = ", ".join(f'"{c}"' for c in columns if c not in ("subject", "session"))
+            con.execute(
+                f'CREATE TABLE IF NOT EXISTS {table} (task TEXT NOT NULL, '
+                f'subject TEXT NOT NULL, session INTEGER NOT NULL, {cols}, '
+                f'PRIMARY KEY (task, subject, session))'
+            )
+        return con
+
+    def _upsert(self, con, table, rows):
+        """Replace this task's rows for every (subject, session) attempted
+        since the last flush.
 
         Re-running a subject replaces its prior row; a subject that no longer
         belongs in this table has its prior row dropped.
         """
-        csv_path = os.path.join(self.root, filename)
+        columns = _TABLES[table][1]
+        con.executemany(
+            f"DELETE FROM {table} WHERE task = ? AND subject = ? AND session = ?",
+            [(self.task, subj, sess) for subj, sess in self._pending],
+        )
+        self._insert(con, table, (tuple(rows[k][c] for c in columns)
+                                  for k in self._pending if k in rows))
 
-        if os.path.exists(csv_path):
-            try:
-                prior = pd.read_csv(csv_path, dtype={"subject": str})
-            except Exception as e:
-                print(f"WARNING: could not read prior {csv_path} ({e}); starting fresh")
-                prior = pd.DataFrame(columns=columns)
-        else:
-            prior = pd.DataFrame(columns=columns)
+    def _insert(self, con, table, records):
+        columns = _TABLES[table][1]
+        placeholders = ", ".join("?" * (len(columns) + 1))
+        con.executemany(
+            f'INSERT OR REPLACE INTO {table} (task, {", ".join(columns)}) '
+            f'VALUES ({placeholders})',
+            ((self.task, *record) for record in records),
+        )
 
+    def _import_legacy_csv(self, con, table):
+        """Seed the store from a CSV written before it existed (once per task)."""
+        columns = _TABLES[table][1]
+        csv_path = self._csv_path(table)
+        if not os.path.exists(csv_path):
+            return
+        if con.execute(f"SELECT 1 FROM {table} WHERE task = ? LIMIT 1",
+                       (self.task,)).fetchone():
+            return
+        try:
+            prior = pd.read_csv(csv_path, dtype={"subject": str}, keep_default_na=False)
+        except Exception as e:
+            print(f"WARNING: could not read prior {csv_path} ({e}); starting fresh")
+            return
         for col in columns:
             if col not in prior.columns:
                 prior[col] = "" if col != "cmlreader_failure" else False
         prior = prior[columns]
+        prior["session"] = prior["session"].astype(int)
+        if "cmlreader_failure" in columns:
+            prior["cmlreader_failure"] = prior["cmlreader_failure"].astype(str) == "True"
+        self._insert(con, table, prior.itertuples(index=False))
 
-        if len(prior) and self._attempted:
-            prior["session"] = prior["session"].astype(int)
-            keys = list(zip(prior["subject"].astype(str), prior["session"]))
-            keep = [k not in self._attempted for k in keys]
-            prior = prior.loc[keep].reset_index(drop=True)
-
-        new_df = pd.DataFrame(rows, columns=columns) if rows else pd.DataFrame(columns=columns)
-        merged = pd.concat([prior, new_df], ignore_index=True)
-
-        if len(merged):
-            merged["session"] = merged["session"].astype(int)
-            merged = merged.sort_values(["subject", "session"]).reset_index(drop=True)
+    def _csv_path(self, table):
+        return os.path.join(self.root, _TABLES[table][0].format(task=self.task))
 
+    def _export_csv(self, con, table):
+        """Rewrite this task's CSV for ``table`` from the store."""
+        _, columns, label = _TABLES[table]
+        csv_path = self._csv_path(table)
+        merged = pd.read_sql_query(
+            f'SELECT {", ".join(columns)} FROM {table} WHERE task = ? '
+            f'ORDER BY subject, session',
+            con, params=(self.task,),
+        )
+        if "cmlreader_failure" in merged.columns:
+            merged["cmlreader_failure"] = merged["cmlreader_failure"].astype(bool)
         merged.to_csv(csv_path, index=False)
         print(f"Wrote {label}: {csv_path} ({len(merged)} row(s))")
         return csv_path
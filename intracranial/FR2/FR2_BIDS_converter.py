@@ -89,48 +89,6 @@ class FR2_BIDS_converter(intracranial_BIDS_converter):
         events['duration'] = durations               # preserves column order
         return events
     
-    # assign serial positions to recall events (all given serial position = -999)
-    def assign_serial_positions(self, events):
-        serialpos = []
-        for l, l_evs in events.groupby('list', sort=False):         # preserve order
-            w_evs = l_evs.query("trial_type == 'WORD'")
-            r_evs = l_evs.query("trial_type == 'REC_WORD'")
-            
-            # recall events all given default serial position == -999
-            if len(r_evs.serialpos.unique()) == 1 and r_evs.serialpos.unique()[0] == -999:
-                words = np.array(w_evs.item_name)
-                recs = np.array(r_evs.item_name)
-                sp = [np.argwhere(words == r)[0][0] + 1 if r in words else -999 for r in recs]
-            
-            # serial positions already assigned
-            else:
-                sp = list(r_evs.serialpos)
-
-            serialpos.extend(sp)
-
-        events.loc[events['trial_type'] == 'REC_WORD', 'serialpos'] = serialpos
-        return events
-    
-    # unpack stimulation parameters from dictionary and add as columns to events dataframe
-    def unpack_stim_params(self, events):
-        stim_params_df = pd.DataFrame()
-        for _, row in events.iterrows():
-            stim_params_df = pd.concat([stim_params_df, pd.DataFrame.from_dict([row.stim_params])], ignore_index=True)
-
-        return pd.concat([events, stim_params_df], axis=1)
-    
-    # assign stim_list values to math events with default -999
-    def assign_stim_lists(self, events):
-        stim_list = []
-        for _, row in events.iterrows():
-            if row['stim_list'] == -999:
-                stim_list.append(max(events[events['list'] == row['list']].stim_list))
-            else:
-                stim_list.append(row.stim_list)
-        
-        events['stim_list'] = stim_list
-        return events
-    
     def make_events_descriptor(self):
         descriptions = {
             "SESS_START": "Beginning of session.",
@@ -91,26 +91,6 @@ class PAL2_BIDS_converter(intracranial_BIDS_converter):
         events['duration'] = durations
         return events
     
-    # unpack stimulation parameters from dictionary and add as columns to events dataframe
-    def unpack_stim_params(self, events):
-        stim_params_df = pd.DataFrame()
-        for _, row in events.iterrows():
-            stim_params_df = pd.concat([stim_params_df, pd.DataFrame.from_dict([row.stim_params])], ignore_index=True)
-
-        return pd.concat([events, stim_params_df], axis=1)
-    
-    # assign stim_list values to math events with default -999
-    def assign_stim_lists(self, events):
-        stim_list = []
-        for _, row in events.iterrows():
-            if row['stim_list'] == -999:
-                stim_list.append(max(events[events['list'] == row['list']].stim_list))
-            else:
-                stim_list.append(row.stim_list)
-        
-        events['stim_list'] = stim_list
-        return events
-    
     def make_events_descriptor(self):
         descriptions = {
             "SESS_START": "Beginning of session.",
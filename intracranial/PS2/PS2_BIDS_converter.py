@@ -1,16 +1,13 @@
 # imports
-import importlib.util
 import os
 import pandas as pd
 import numpy as np
+from cli.modules import load_module_from_path
 
 # PS2.1 folder contains a dot so it cannot be imported via standard importlib;
-# load it directly from its file path.
+# load it directly from its file path (shared with the registry's PS2.1 entry).
 _ps21_path = os.path.join(os.path.dirname(__file__), '..', 'PS2.1', 'PS2.1_BIDS_converter.py')
-_ps21_spec = importlib.util.spec_from_file_location('PS21_BIDS_converter', _ps21_path)
-_ps21_module = importlib.util.module_from_spec(_ps21_spec)
-_ps21_spec.loader.exec_module(_ps21_module)
-PS21_BIDS_converter = _ps21_module.PS21_BIDS_converter
+PS21_BIDS_converter = load_module_from_path('PS21_BIDS_converter', _ps21_path).PS21_BIDS_converter
 
 
 class PS2_BIDS_converter(PS21_BIDS_converter):
@@ -4,6 +4,7 @@ import pandas as pd
 import numpy as np
 from tqdm import tqdm
 from ..intracranial_BIDS_converter import intracranial_BIDS_converter
+from .. import static_tables
 from pathlib import Path
 
 _HERE = Path(__file__).parent
@@ -54,9 +55,7 @@ class RepFR1_BIDS_converter(intracranial_BIDS_converter):
 
     def apply_event_durations(self, events):
         # word durations
-        wd_path = _HERE / 'word_durations.csv'
-        word_durations = pd.read_csv(wd_path)
-        wd = word_durations[(word_durations.subject == self.subject) & (word_durations.session == self.session)].iloc[0].word_duration_rounded
+        wd = static_tables.row('word_durations', self.subject, self.session)['word_duration_rounded']
         wd /= 1000                               # convert from ms to s
 
         durations = []
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""Micro-benchmark for the shared stimulation-parameter helpers.
+
+Times ``unpack_stim_params`` + ``assign_stim_lists`` (the FR2 / catFR2 / PAL2
+events path) on FR2-shaped events, reported per 10k events. By default the
+events are synthetic — stim and no-stim ``stim_params`` dicts, ``stim_list``
+sentinels on math events — so no data archive access is needed; pass
+``--subject`` / ``--session`` to time a real FR2 session's events instead.
+
+Usage::
+
+    python intracranial/bench_stim_params.py                  # 10k synthetic events
+    python intracranial/bench_stim_params.py --n-events 50000 --repeats 3
+    python intracranial/bench_stim_params.py --subject R1111M --session 0
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from intracranial.FR2.FR2_BIDS_converter import FR2_BIDS_converter  # noqa: E402
+
+
+def synthetic_events(n_events, seed=0):
+    rng = np.random.default_rng(seed)
+    lists = np.sort(rng.integers(-1, 26, n_events))
+    types = rng.choice(["WORD", "REC_WORD", "PROB", "STIM_ON", "ORIENT"], n_events)
+    stim_list = (lists % 2).astype(bool)
+    stim_params = []
+    for t in types:
+        stim = t == "STIM_ON"
+        stim_params.append({
+            "anode_label": "LA1" if stim else "",
+            "cathode_label": "LA2" if stim else "",
+            "amplitude": 0.5 if stim else 0.0,
+            "pulse_freq": 50 if stim else -999,
+            "n_pulses": 250 if stim else -999,
+            "pulse_width": 300 if stim else -999,
+            "stim_duration": 500 if stim else -999,
+        })
+    return pd.DataFrame({
+        "type": types,
+        "list": lists,
+        "stim_list": np.where(types == "PROB", -999, stim_list).astype(object),
+        "stim_params": stim_params,
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n-events", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--subject", default=None)
+    parser.add_argument("--session", type=int, default=None)
+    args = parser.parse_args()
+
+    converter = FR2_BIDS_converter("R1999X", "FR2", 0, 4.0, 1e6, False, None,
+                                   root="/tmp/bench_bids")
+    if args.subject is not None:
+        import cmlreaders as cml
+        events = cml.CMLReader(args.subject, "FR2", args.session).load("events")
+        source = f"{args.subject} FR2 ses-{args.session}"
+    else:
+        events = synthetic_events(args.n_events)
+        source = "synthetic"
+
+    def run():
+        converter.assign_stim_lists(converter.unpack_stim_params(events.copy()))
+
+    times = timeit.repeat(run, number=1, repeat=args.repeats)
+    per_10k = min(times) * 10_000 / len(events)
+    print(f"unpack_stim_params + assign_stim_lists: {per_10k * 1e3:.1f} ms per 10k "
+          f"events (best of {args.repeats}, {len(events)} events, {source})")
+
+
+if __name__ == "__main__":
+    main()
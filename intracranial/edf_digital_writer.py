@@ -18,11 +18,21 @@ via this priority cascade, evaluated independently for each channel:
      'nV' for finer scales.
   3. Data-derived fallback: gain=1.0 µV/LSB (matches the legacy
      converter default of unit_scale=1e6).
+
+When labels or units need correcting on files that are already written,
+``patch_header`` rewrites just those header fields, leaving the data
+records untouched.
 """
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Sequence, Tuple
+import hashlib
+import io
+import os
+import shutil
+import struct
+import tempfile
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
 import numpy as np
 import pyedflib
@@ -38,6 +48,119 @@ _CONTAINER_RANGES = {
 _VALID_DIMENSIONS = {"uv", "µv", "nv", "mv", "v"}
 
 
+# ----------------------------------------------------------------------
+# Header parser
+# ----------------------------------------------------------------------
+
+_ANNOTATION_LABELS = {"EDF Annotations", "BDF Annotations"}
+
+# Fixed 256-byte header: version, patient, recording, start date, start time,
+# header bytes, reserved (EDF+/BDF+ type), n records, record duration, n signals.
+_FIXED_HEADER = struct.Struct("8s80s80s8s8s8s44s8s8s4s")
+
+# Per-signal header fields: (name, width). Each field is stored for every
+# signal in turn before the next field starts, so field ``f`` of signal ``k``
+# lives at ``ns * offset(f) + width(f) * k`` within the signal header block.
+_SIGNAL_FIELDS = (
+    ("label", 16), ("transducer", 80), ("dimension", 8),
+    ("physical_min", 8), ("physical_max", 8),
+    ("digital_min", 8), ("digital_max", 8),
+    ("prefiltering", 80), ("samples_per_record", 8), ("reserved", 32),
+)
+
+
+def _field_span(name: str, ns: int, k: int) -> Tuple[int, int]:
+    offset = 0
+    for field, width in _SIGNAL_FIELDS:
+        if field == name:
+            start = ns * offset + width * k
+            return start, start + width
+        offset += width
+    raise KeyError(name)
+
+
+class EdfHeader(NamedTuple):
+    """The fixed and per-signal header of an EDF/BDF file.
+
+    Per-signal fields are lists over *every* signal, annotation signal
+    included; ``data_signals`` gives the indices of the others.
+    """
+
+    container: str                  # "EDF" or "BDF"
+    header_bytes: int
+    n_records: int                  # -1 while a recording is still open
+    record_duration: float
+    labels: List[str]
+    dimensions: List[str]
+    physical_min: List[float]
+    physical_max: List[float]
+    digital_min: List[int]
+    digital_max: List[int]
+    samples_per_record: List[int]
+
+    @property
+    def sample_width(self) -> int:
+        return 3 if self.container == "BDF" else 2
+
+    @property
+    def data_signals(self) -> List[int]:
+        return [k for k, label in enumerate(self.labels) if label not in _ANNOTATION_LABELS]
+
+    @property
+    def record_bytes(self) -> int:
+        return sum(self.samples_per_record) * self.sample_width
+
+    @property
+    def file_bytes(self) -> int:
+        """Size the file must have to hold every advertised data record."""
+        return self.header_bytes + max(self.n_records, 0) * self.record_bytes
+
+    def sfreq(self, k: int) -> float:
+        return self.samples_per_record[k] / self.record_duration
+
+
+def _parse_header(fh) -> EdfHeader:
+    fixed = fh.read(_FIXED_HEADER.size)
+    if len(fixed) != _FIXED_HEADER.size:
+        raise ValueError("file is shorter than an EDF/BDF header")
+    version, _, _, _, _, _, _, n_records, duration, ns = _FIXED_HEADER.unpack(fixed)
+    ns = int(ns)
+    sig = fh.read(256 * ns)
+    if len(sig) != 256 * ns:
+        raise ValueError("truncated EDF/BDF signal header")
+
+    def column(name):
+        return [sig[slice(*_field_span(name, ns, k))].decode("latin-1").strip()
+                for k in range(ns)]
+
+    return EdfHeader(
+        container="BDF" if version[:1] == b"\xff" else "EDF",
+        header_bytes=256 * (ns + 1),
+        n_records=int(n_records),
+        record_duration=float(duration),
+        labels=column("label"),
+        dimensions=column("dimension"),
+        physical_min=[float(v) for v in column("physical_min")],
+        physical_max=[float(v) for v in column("physical_max")],
+        digital_min=[int(v) for v in column("digital_min")],
+        digital_max=[int(v) for v in column("digital_max")],
+        samples_per_record=[int(v) for v in column("samples_per_record")],
+    )
+
+
+def read_header(path: str) -> EdfHeader:
+    """Parse the header of the EDF/BDF file at ``path``.
+
+    Reads only the 256-byte fixed header and the 256-byte-per-signal block
+    after it — no data records, no annotations, no file-size validation —
+    so it is much cheaper than opening the file with ``pyedflib.EdfReader``
+    (which matters on NFS). Raises ``ValueError`` for a malformed header
+    and ``OSError`` if the file cannot be read.
+    """
+    with open(path, "rb") as fh:
+        return _parse_header(fh)
+
+
 # ----------------------------------------------------------------------
 # Source-EDF header inspection
 # ----------------------------------------------------------------------
@@ -47,33 +170,47 @@ def read_source_edf_units(
 ) -> Optional[Dict[str, Tuple[float, float, int, int, str]]]:
     """Return ``{label: (pmin, pmax, dmin, dmax, dim)}`` from a source EDF.
 
-    Returns ``None`` if the file does not exist or cannot be opened.
-    Returned values are *raw* — placeholder ``pmin=0, pmax=1`` headers
-    are returned as-is so the caller can decide whether to honour them
-    via :func:`is_placeholder_units`.
+    Returns ``None`` if the file does not exist or its header cannot be
+    parsed. Returned values are *raw* — placeholder ``pmin=0, pmax=1``
+    headers are returned as-is so the caller can decide whether to honour
+    them via :func:`is_placeholder_units`.
     """
-    import os
-
-    if not path or not os.path.exists(path):
+    if not path:
         return None
     try:
-        f = pyedflib.EdfReader(path)
-    except Exception:
+        header = read_header(path)
+    except (OSError, ValueError):
         return None
+    return {
+        header.labels[k]: (
+            header.physical_min[k],
+            header.physical_max[k],
+            header.digital_min[k],
+            header.digital_max[k],
+            header.dimensions[k],
+        )
+        for k in header.data_signals
+    }
+
+
+def read_edf_header(path: str) -> Optional[Dict[str, object]]:
+    """Return ``{"labels", "sfreq", "duration"}`` from an EDF/BDF header.
+
+    ``labels`` excludes the EDF+/BDF+ annotation signal; ``sfreq`` is the
+    first data signal's rate and ``duration`` covers every data record,
+    including the zero padding of a partial last record. Returns ``None``
+    if the header cannot be read.
+    """
     try:
-        labels = list(f.getSignalLabels())
-        result: Dict[str, Tuple[float, float, int, int, str]] = {}
-        for i, label in enumerate(labels):
-            result[label] = (
-                float(f.getPhysicalMinimum(i)),
-                float(f.getPhysicalMaximum(i)),
-                int(f.getDigitalMinimum(i)),
-                int(f.getDigitalMaximum(i)),
-                f.getPhysicalDimension(i).strip(),
-            )
-        return result
-    finally:
-        f.close()
+        header = read_header(path)
+    except (OSError, ValueError):
+        return None
+    data = header.data_signals
+    return {
+        "labels": [header.labels[k] for k in data],
+        "sfreq": header.sfreq(data[0]) if data else None,
+        "duration": max(header.n_records, 0) * header.record_duration,
+    }
 
 
 def is_placeholder_units(pmin: float, pmax: float, dim: str) -> bool:
@@ -146,6 +283,7 @@ def encode_egi_to_bdf(
     labels: Sequence[str] | None = None,
     dim: str = "V",
     container: str = "BDF",
+    peak_v: np.ndarray | None = None,
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict | None]:
     """EGI float → BDF/EDF integer samples, minimum quantization per channel.
 
@@ -157,6 +295,10 @@ def encode_egi_to_bdf(
     typical EGI amplitudes (~1e-4 V → ~3-4 sig figs). The integer samples are
     identical regardless of ``dim`` — only the stored gain precision changes.
 
+    ``peak_v`` is the per-channel peak absolute amplitude in Volts, when the
+    caller already has it (e.g. from a streaming pre-scan); it saves a full
+    pass over ``data_v``. Omitted, it is computed from the data.
+
     Returns
     -------
     data_int     : (n_channels, n_samples) int32
@@ -175,17 +317,15 @@ def encode_egi_to_bdf(
     if si_scale is None:
         raise ValueError(f"unsupported dim {dim!r}; expected one of V/mV/uV/nV")
 
-    dmin, dmax = _CONTAINER_RANGES[container]
-
     # Work in the header's physical unit so quantization and the stored
     # physical_min/max share that scale.
     data_phys = data_v / si_scale
 
-    peak = np.max(np.abs(data_phys), axis=1)
-    peak = np.where(peak == 0.0, 1e-6, peak)
-
-    gain = peak / float(dmax)                        # (dim units)/LSB per channel
+    if peak_v is None:
+        peak_v = np.max(np.abs(data_v), axis=1)
+    gain = _egi_gain(peak_v, si_scale, container)     # (dim units)/LSB per channel
 
+    dmin, dmax = _CONTAINER_RANGES[container]
     data_int = (
         np.round(data_phys / gain[:, np.newaxis])
         .clip(dmin, dmax)
@@ -197,14 +337,46 @@ def encode_egi_to_bdf(
 
     signal_units = None
     if labels is not None:
-        signal_units = {
-            label: (*units_for_container(gain[i], dim, container), dim)
-            for i, label in enumerate(labels)
-        }
+        signal_units = egi_signal_units(peak_v, labels, dim=dim, container=container)
 
     return data_int, phys_min, phys_max, signal_units
 
 
+def _egi_gain(peak_v, si_scale: float, container: str) -> np.ndarray:
+    """Per-channel gain ((dim units)/LSB) spreading each peak over the full
+    digital range; silent channels get a 1e-6 floor so pmin != pmax."""
+    peak = np.asarray(peak_v, dtype=float) / si_scale
+    peak = np.where(peak == 0.0, 1e-6, peak)
+    return peak / float(_CONTAINER_RANGES[container][1])
+
+
+def egi_signal_units(
+    peak_v: np.ndarray,
+    labels: Sequence[str],
+    dim: str = "V",
+    container: str = "BDF",
+) -> Dict[str, Tuple[float, float, int, int, str]]:
+    """``{label: (pmin, pmax, dmin, dmax, dim)}`` for EGI data with the given
+    per-channel peak amplitudes (Volts).
+
+    These are exactly the headers :func:`encode_egi_to_bdf` returns, without
+    needing the samples — so a streaming writer can set up the file from a
+    lightweight pre-scan and encode each block with the same gains.
+    """
+    si_scale = _DIM_SI_SCALE.get(dim.strip().lower())
+    if si_scale is None:
+        raise ValueError(f"unsupported dim {dim!r}; expected one of V/mV/uV/nV")
+    if len(labels) != len(peak_v):
+        raise ValueError(
+            f"len(labels)={len(labels)} != len(peak_v)={len(peak_v)}"
+        )
+    gain = _egi_gain(peak_v, si_scale, container)
+    return {
+        label: (*units_for_container(gain[i], dim, container), dim)
+        for i, label in enumerate(labels)
+    }
+
+
 # ----------------------------------------------------------------------
 # Priority cascade
 # ----------------------------------------------------------------------
@@ -377,21 +549,30 @@ def write_digital(
         ``"EDF"`` (int16, FILETYPE_EDFPLUS) or
         ``"BDF"`` (int24, FILETYPE_BDFPLUS).
     """
+    write_digital_blocks(
+        path, labels, [signals_int], sfreq, signal_units, container=container,
+    )
+
+
+def write_digital_blocks(
+    path: str,
+    labels: Sequence[str],
+    blocks: Iterable[np.ndarray],
+    sfreq: float,
+    signal_units: Dict[str, Tuple[float, float, int, int, str]],
+    *,
+    container: str = "EDF",
+) -> None:
+    """Streaming form of :func:`write_digital`.
+
+    ``blocks`` yields consecutive ``(n_channels, n)`` integer arrays; block
+    lengths need not line up with the file's data records. pyedflib pads the
+    tail of every ``writeSamples`` call out to a whole record, so only whole
+    records are written per block and the remainder is carried into the next
+    one — the file is byte-identical to writing the concatenated array in a
+    single call, and memory stays bounded by one block.
+    """
     n_channels = len(labels)
-    if signals_int.shape[0] != n_channels:
-        raise ValueError(
-            f"signals_int shape {signals_int.shape} does not match "
-            f"len(labels)={n_channels}"
-        )
-    if container == "EDF":
-        if signals_int.dtype != np.int16:
-            # pyedflib's digital writer expects int dtype; int16 is the
-            # only safe choice for EDF.
-            if (signals_int.min() < -32768) or (signals_int.max() > 32767):
-                raise ValueError(
-                    "samples exceed int16 range — promote container to BDF"
-                )
-            signals_int = signals_int.astype(np.int16)
 
     headers: List[dict] = []
     for label in labels:
@@ -429,12 +610,369 @@ def write_digital(
         if record_duration is not None:
             writer.setDatarecordDuration(record_duration)
         writer.setSignalHeaders(headers)
-        # writeSamples expects a list of 1-D arrays per channel (one per
-        # signal); pyedflib will accept a 2-D array too in newer versions
-        # but the list form works on every version we've shipped against.
-        writer.writeSamples(
-            [np.ascontiguousarray(signals_int[i]) for i in range(n_channels)],
-            digital=True,
-        )
+        spr = int(writer.get_smp_per_record(0))
+
+        carry = None
+        for signals_int in blocks:
+            if signals_int.shape[0] != n_channels:
+                raise ValueError(
+                    f"signals_int shape {signals_int.shape} does not match "
+                    f"len(labels)={n_channels}"
+                )
+            signals_int = _digital_dtype(signals_int, container)
+            if carry is not None:
+                signals_int = np.concatenate([carry, signals_int], axis=1)
+            n_whole = (signals_int.shape[1] // spr) * spr
+            carry = signals_int[:, n_whole:]
+            if n_whole:
+                _write_samples(writer, signals_int[:, :n_whole])
+        if carry is not None and carry.shape[1]:
+            _write_samples(writer, carry)
     finally:
         writer.close()
+
+
+def _digital_dtype(signals_int: np.ndarray, container: str) -> np.ndarray:
+    if container == "EDF" and signals_int.dtype != np.int16:
+        # pyedflib's digital writer expects int dtype; int16 is the
+        # only safe choice for EDF.
+        if signals_int.size and (
+            (signals_int.min() < -32768) or (signals_int.max() > 32767)
+        ):
+            raise ValueError(
+                "samples exceed int16 range — promote container to BDF"
+            )
+        signals_int = signals_int.astype(np.int16)
+    return signals_int
+
+
+def _write_samples(writer, signals_int: np.ndarray) -> None:
+    # writeSamples expects a list of 1-D arrays per channel (one per
+    # signal); pyedflib will accept a 2-D array too in newer versions
+    # but the list form works on every version we've shipped against.
+    writer.writeSamples(
+        [np.ascontiguousarray(signals_int[i]) for i in range(signals_int.shape[0])],
+        digital=True,
+    )
+
+
+# ----------------------------------------------------------------------
+# Verifier
+# ----------------------------------------------------------------------
+
+# Bytes of data records decoded per chunk by read_digital / verify_digital.
+_VERIFY_CHUNK_BYTES = 64 * 1024 * 1024
+
+def _decode_records(buf: bytes, width: int) -> np.ndarray:
+    """Little-endian int16 (EDF) or int24 (BDF) samples as int32."""
+    if width == 2:
+        return np.frombuffer(buf, dtype="<i2").astype(np.int32)
+    b = np.frombuffer(buf, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+    v = b[:, 0] | (b[:, 1] << 8) | (b[:, 2] << 16)
+    return (v ^ 0x800000) - 0x800000
+
+
+def _data_samples_per_record(header: EdfHeader) -> int:
+    spr = {header.samples_per_record[k] for k in header.data_signals}
+    if len(spr) > 1:
+        raise ValueError("data signals have mixed samples-per-record")
+    return spr.pop() if spr else 0
+
+
+def _data_chunks(fh, header: EdfHeader, spr: int):
+    """Yield ``(raw bytes, samples)`` per chunk of data records read from
+    ``fh`` (positioned just after the header). ``samples`` is the data
+    signals' stored integers, shape ``(n_data_signals, records * spr)``."""
+    width = header.sample_width
+    data_idx = header.data_signals
+    record_samples = int(sum(header.samples_per_record))
+    # Column of each data signal's first sample within a record.
+    starts = np.cumsum([0] + header.samples_per_record[:-1])
+    cols = (starts[data_idx][:, None] + np.arange(spr)).ravel()
+    chunk = max(1, _VERIFY_CHUNK_BYTES // max(1, record_samples * width))
+    n = len(data_idx)
+
+    for first in range(0, header.n_records, chunk):
+        k = min(chunk, header.n_records - first)
+        buf = fh.read(k * record_samples * width)
+        if len(buf) != k * record_samples * width:
+            done = first + len(buf) // (record_samples * width)
+            raise ValueError(f"file truncated in data record {done}")
+        records = _decode_records(buf, width).reshape(k, record_samples)
+        # (k, n * spr) -> (n, k * spr)
+        yield buf, (records[:, cols].reshape(k, n, spr)
+                    .transpose(1, 0, 2).reshape(n, k * spr))
+
+
+def read_digital(path: str) -> Tuple[EdfHeader, np.ndarray]:
+    """Return ``(header, samples)`` for the EDF/BDF file at ``path``.
+
+    ``samples`` holds every data signal's stored integers as int32, shape
+    ``(n_data_signals, n_records * samples_per_record)`` — the same values
+    ``pyedflib``'s ``readSignal(i, digital=True)`` returns, decoded straight
+    from the data records in chunks. The annotation signal is skipped;
+    data signals must share one samples-per-record.
+    """
+    with open(path, "rb") as fh:
+        header = _parse_header(fh)
+        spr = _data_samples_per_record(header)
+        samples = np.empty((len(header.data_signals), max(header.n_records, 0) * spr),
+                           dtype=np.int32)
+        pos = 0
+        for _, stored in _data_chunks(fh, header, spr):
+            samples[:, pos:pos + stored.shape[1]] = stored
+            pos += stored.shape[1]
+    return header, samples
+
+
+def _verify_records(path, labels, n_samples, check_chunk):
+    """The pass shared by the ``verify_digital*`` checks.
+
+    Checks the labels and record count, hands each chunk's real samples
+    (``(pos, stored[:, :n_real])``) to ``check_chunk`` — which returns a
+    mismatch detail or None — requires the last record's padding to be zero,
+    and hashes the whole file on the way. Returns ``(ok, detail, sha256)``.
+    """
+    hasher = hashlib.sha256()
+    with open(path, "rb") as fh:
+        header = _parse_header(fh)
+        fh.seek(0)
+        hasher.update(fh.read(header.header_bytes))
+
+        expected_labels = [label[:16].strip() for label in labels]
+        got_labels = [header.labels[k] for k in header.data_signals]
+        if got_labels != expected_labels:
+            return False, f"labels differ: {got_labels} != {expected_labels}", ""
+        try:
+            spr = _data_samples_per_record(header)
+        except ValueError as e:
+            return False, str(e), ""
+        n_records = header.n_records
+        if n_records < 0 or n_records * spr < n_samples:
+            return False, (f"{max(n_records, 0) * spr} samples per channel on "
+                           f"disk, expected {n_samples}"), ""
+
+        pos = 0
+        try:
+            for buf, stored in _data_chunks(fh, header, spr):
+                hasher.update(buf)
+                n_read = stored.shape[1]
+                n_real = max(0, min(n_read, n_samples - pos))
+                detail = check_chunk(pos, stored[:, :n_real])
+                if detail:
+                    return False, detail, ""
+                if np.any(stored[:, n_real:]):
+                    return False, f"non-zero padding after sample {n_samples}", ""
+                pos += n_read
+        except ValueError as e:
+            return False, str(e), ""
+
+        for tail in iter(lambda: fh.read(_VERIFY_CHUNK_BYTES), b""):
+            hasher.update(tail)
+    return True, "", hasher.hexdigest()
+
+
+def verify_digital(
+    path: str,
+    labels: Sequence[str],
+    signals_int: np.ndarray,
+) -> Tuple[bool, str, str]:
+    """Re-read ``path`` and check it holds exactly ``signals_int``.
+
+    Reads the data records straight off disk in chunks of
+    ``_VERIFY_CHUNK_BYTES`` and compares the stored integers against the
+    ones handed to :func:`write_digital` — an exact integer comparison, no
+    float round-trip. The labels (as truncated on write) must match and the
+    padding pyedflib adds to the last record must be zero; the EDF+/BDF+
+    annotation signal is skipped.
+
+    Returns ``(ok, detail, sha256)``. ``detail`` names the first mismatched
+    channel and sample; ``sha256`` is the hex digest of the whole file,
+    computed on the same pass (empty when the check fails).
+    """
+    def check_chunk(pos, stored):
+        bad = stored != signals_int[:, pos:pos + stored.shape[1]]
+        if bad.any():
+            j, ch = np.argwhere(bad.T)[0]
+            return (f"{labels[ch]}: sample {pos + j} is {int(stored[ch, j])}, "
+                    f"expected {int(signals_int[ch, pos + j])}")
+        return None
+
+    return _verify_records(path, labels, signals_int.shape[1], check_chunk)
+
+
+class ChannelDigests:
+    """Per-channel sha256 of the integer blocks handed to
+    :func:`write_digital_blocks`, for checking a streamed file without the
+    recording in memory (:func:`verify_digital_digests`)::
+
+        digests = ChannelDigests(len(labels))
+        write_digital_blocks(path, labels, digests.wrap(blocks), ...)
+    """
+
+    def __init__(self, n_channels: int):
+        self._hashers = [hashlib.sha256() for _ in range(n_channels)]
+        self.n_samples = 0
+
+    def update(self, signals_int: np.ndarray) -> None:
+        for hasher, row in zip(self._hashers, signals_int):
+            hasher.update(np.ascontiguousarray(row, dtype="<i4").tobytes())
+        self.n_samples += signals_int.shape[1]
+
+    def wrap(self, blocks: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """Pass ``blocks`` through, digesting each on the way."""
+        for signals_int in blocks:
+            self.update(signals_int)
+            yield signals_int
+
+    def hexdigests(self) -> List[str]:
+        return [hasher.hexdigest() for hasher in self._hashers]
+
+
+def verify_digital_digests(
+    path: str,
+    labels: Sequence[str],
+    digests: ChannelDigests,
+) -> Tuple[bool, str, str]:
+    """Like :func:`verify_digital`, for a file written from streamed blocks:
+    each channel's stored integers must hash to the digest taken as the
+    blocks were written. A mismatch names the channel, not the sample."""
+    hashers = [hashlib.sha256() for _ in labels]
+
+    def check_chunk(pos, stored):
+        for hasher, row in zip(hashers, stored):
+            hasher.update(np.ascontiguousarray(row, dtype="<i4").tobytes())
+        return None
+
+    ok, detail, sha256 = _verify_records(path, labels, digests.n_samples, check_chunk)
+    if ok:
+        for label, hasher, expected in zip(labels, hashers, digests.hexdigests()):
+            if hasher.hexdigest() != expected:
+                return False, f"{label}: stored samples differ from the blocks written", ""
+    return ok, detail, sha256
+
+
+# ----------------------------------------------------------------------
+# Header patcher
+# ----------------------------------------------------------------------
+
+def _format_edf_number(value: float) -> str:
+    """``value`` as edflib (so pyedflib, so :func:`write_digital`) writes it
+    into an 8-char physical min/max field: the integer part, then up to nine
+    truncated (not rounded) decimals with trailing zeros dropped, the whole
+    cut to 8 characters. A BDF's -838860.8 µV is therefore ``-838860.``;
+    matching this keeps a no-op patch from rewriting the file."""
+    value = float(value)
+    value += -1e-12 if value < 0 else 1e-12       # edflib's nudge before truncating
+    whole = int(value)
+    text = ("-" if value < 0 else "") + str(abs(whole))
+    if len(text) > 8:
+        raise ValueError(f"{value!r} does not fit an 8-character EDF header field")
+    decimals = abs(int((value - whole) * 1000000000))
+    if decimals:
+        text += "." + f"{decimals:09d}".rstrip("0")
+    return text[:8]
+
+
+def _ascii_field(text: str, width: int) -> bytes:
+    try:
+        raw = text.encode("ascii")
+    except UnicodeEncodeError:
+        raise ValueError(f"EDF header values must be ASCII: {text!r}") from None
+    return raw[:width].ljust(width)
+
+
+def patch_header(
+    path: str,
+    labels: Optional[Sequence[str]] = None,
+    signal_units: Optional[Dict[str, Tuple[float, float, int, int, str]]] = None,
+) -> bool:
+    """Rewrite signal labels and units in an existing EDF/BDF header.
+
+    Only the fixed-size header is changed — the data records are copied
+    byte for byte, so a label or unit fix costs a file copy instead of a
+    re-conversion. ``labels`` replaces the data signals' labels in order
+    (the EDF+/BDF+ annotation signal is left alone). Each must already be
+    the name the file should hold — at most 16 characters, e.g. the
+    ``_truncate_bipolar`` form — since cutting it here would silently
+    diverge from the name the writers use. ``signal_units`` maps a data
+    signal's (new) label to ``(pmin, pmax, dmin, dmax, dim)`` as returned
+    by :func:`resolve_edf_units`; its physical min/max and dimension are
+    rewritten, while ``dmin``/``dmax`` must match the file, since the stored
+    integers are not touched. Signals absent from ``signal_units`` keep
+    their units; a key that names no signal is an error.
+
+    The patched file is written to a temporary sibling and swapped in with
+    ``os.replace``, so readers see either the old file or the new one.
+    Returns True if the header changed, False if its parsed values already
+    matched (the file is then left alone).
+    """
+    with open(path, "rb") as fh:
+        try:
+            header = _parse_header(fh)
+        except ValueError as e:
+            raise ValueError(f"{path}: {e}") from None
+        fh.seek(0)
+        fixed = fh.read(_FIXED_HEADER.size)
+        sig = bytearray(fh.read(header.header_bytes - _FIXED_HEADER.size))
+    ns = len(header.labels)
+
+    def set_field(name, k, text):
+        start, stop = _field_span(name, ns, k)
+        sig[start:stop] = _ascii_field(text, stop - start)
+
+    data_idx = header.data_signals
+    new_labels = list(header.labels)
+    if labels is not None:
+        if len(labels) != len(data_idx):
+            raise ValueError(f"{path}: {len(labels)} labels for "
+                             f"{len(data_idx)} data signals")
+        too_long = [label for label in labels if len(label) > 16]
+        if too_long:
+            raise ValueError(f"{path}: labels longer than 16 characters: {too_long}")
+        for k, label in zip(data_idx, labels):
+            set_field("label", k, label)
+            new_labels[k] = label.strip()
+
+    signal_units = signal_units or {}
+    unknown = set(signal_units) - {new_labels[k] for k in data_idx}
+    if unknown:
+        raise ValueError(f"{path}: signal_units for labels not in the file: {sorted(unknown)}")
+    for k in data_idx:
+        units = signal_units.get(new_labels[k])
+        if units is None:
+            continue
+        pmin, pmax, dmin, dmax, dim = units
+        file_range = (header.digital_min[k], header.digital_max[k])
+        if file_range != (int(dmin), int(dmax)):
+            raise ValueError(
+                f"{path}: {new_labels[k]} digital range {list(file_range)} != "
+                f"[{dmin}, {dmax}] — the data must be re-encoded, not patched")
+        if dim.strip().lower() not in _VALID_DIMENSIONS:
+            raise ValueError(f"unrecognized physical dimension {dim!r}")
+        set_field("physical_min", k, _format_edf_number(pmin))
+        set_field("physical_max", k, _format_edf_number(pmax))
+        set_field("dimension", k, dim.strip().replace("µ", "u"))
+
+    patched = _parse_header(io.BytesIO(fixed + bytes(sig)))
+    fields = ("labels", "dimensions", "physical_min", "physical_max")
+    if all(getattr(patched, f) == getattr(header, f) for f in fields):
+        return False
+
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        shutil.copyfile(path, tmp)
+        shutil.copymode(path, tmp)
+        with open(tmp, "r+b") as fh:
+            fh.seek(_FIXED_HEADER.size)
+            fh.write(sig)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    return True
@@ -8,7 +8,10 @@ import os
 from glob import glob
 import mne_bids
 
-from .edf_digital_writer import resolve_edf_units, write_digital
+from .edf_digital_writer import (
+    is_placeholder_units, patch_header, read_edf_header, read_header,
+    read_source_edf_units, resolve_edf_units, write_digital,
+)
 from cli.stages import IEEG_BIDS_CITATION, StageGatedConverter
 
 
@@ -70,6 +73,73 @@ assert {k for k, v in CML_TO_BIDS_SPACE.items() if v == 'Other'} == \
 )
 
 
+class SessionPathPlan:
+    """Every output path of one converted session, as plain strings.
+
+    Built once per converter (``converter.paths``) from root / subject /
+    session / task, so the writers, stage gating and ``_existing_*`` lookups
+    join strings instead of constructing (and entity-validating) a fresh
+    ``mne_bids.BIDSPath`` per file. Names follow BIDS entity order, as
+    mne_bids writes them: sub < ses < task < acq < space < desc.
+
+        plan.beh['.tsv']                         # .../beh/<prefix>_beh.tsv
+        plan.ieeg['bipolar', '.edf']             # .../ieeg/<prefix>_acq-bipolar_ieeg.edf
+        plan.space_file('ind', 'electrodes', '.tsv', acq='bipolar')
+    """
+
+    ACQUISITIONS = ('monopolar', 'bipolar')
+    SPACE_FILES = (('electrodes', '.tsv'), ('electrodes', '.json'), ('coordsystem', '.json'))
+
+    def __init__(self, root, subject, session, task):
+        self.root = str(root)
+        self.subject = str(subject)
+        self.session = str(session)
+        self.task = task
+        self.key = (self.root, self.subject, self.session, self.task)
+
+        self.prefix = f'sub-{subject}_ses-{session}_task-{task}'
+        self.session_root = os.path.join(self.root, f'sub-{subject}', f'ses-{session}')
+        self.beh_dir = os.path.join(self.session_root, 'beh')
+        self.ieeg_dir = os.path.join(self.session_root, 'ieeg')
+        self.scans_tsv = os.path.join(self.session_root, f'sub-{subject}_ses-{session}_scans.tsv')
+
+        self.beh = {ext: self._name(self.beh_dir, 'beh', ext) for ext in ('.tsv', '.json')}
+        self.events = {ext: self._name(self.ieeg_dir, 'events', ext) for ext in ('.tsv', '.json')}
+        self.ieeg = {(acq, ext): self._name(self.ieeg_dir, 'ieeg', ext, acq=acq)
+                     for acq in self.ACQUISITIONS for ext in ('.edf', '.bdf', '.json')}
+        self.channels = {(acq, ext): self._name(self.ieeg_dir, 'channels', ext, acq=acq)
+                         for acq in self.ACQUISITIONS for ext in ('.tsv', '.json')}
+        self.channelmap = {acq: self._name(self.ieeg_dir, 'channelmap', '.tsv', acq=acq)
+                           for acq in self.ACQUISITIONS}
+        self.spaces = {(cml_space, suffix, ext, acq): self._space_name(cml_space, suffix, ext, acq)
+                       for cml_space in CML_TO_BIDS_SPACE
+                       for suffix, ext in self.SPACE_FILES
+                       for acq in (None, 'bipolar')}
+
+    def _name(self, directory, suffix, extension, acq=None, space=None, desc=None):
+        parts = [self.prefix]
+        if acq:
+            parts.append(f'acq-{acq}')
+        if space:
+            parts.append(f'space-{space}')
+        if desc:
+            parts.append(f'desc-{desc}')
+        parts.append(suffix)
+        return os.path.join(directory, '_'.join(parts) + extension)
+
+    def _space_name(self, cml_space, suffix, extension, acq):
+        return self._name(self.ieeg_dir, suffix, extension, acq=acq,
+                          space=CML_TO_BIDS_SPACE[cml_space], desc=CML_TO_BIDS_DESC.get(cml_space))
+
+    def session_dir(self, datatype):
+        return os.path.join(self.session_root, datatype)
+
+    def space_file(self, cml_space, suffix, extension, acq=None):
+        """Path of a per-space electrodes/coordsystem file (see ``_space_file``)."""
+        path = self.spaces.get((cml_space, suffix, extension, acq))
+        return path if path is not None else self._space_name(cml_space, suffix, extension, acq)
+
+
 class intracranial_BIDS_converter(StageGatedConverter):
     MODALITY_LABEL = 'intracranial EEG'
     MODALITY_CITATION = IEEG_BIDS_CITATION
@@ -83,6 +153,14 @@ class intracranial_BIDS_converter(StageGatedConverter):
               'mono-eeg', 'bi-eeg',
               'mono-channels', 'bi-channels')
 
+    # Set by the orchestrator from --metadata-only. When True, a session whose
+    # EDF/BDF is already in the BIDS tree is not re-read from the source: sfreq
+    # and duration come from the existing _ieeg.json (or the EDF header),
+    # contacts/pairs are matched to the channels the file holds, and the EEG
+    # stages rewrite only the recording's header units (patch_BIDS_ieeg_header)
+    # and the sidecar and events files around it.
+    metadata_only = False
+
     # initialize
     def __init__(self, subject, experiment, session, system_version, unit_scale=1e6, area=False, brain_regions=None, overrides=None, root='/scratch/hherrema/BIDS/'):
         self.subject = subject
@@ -103,63 +181,86 @@ class intracranial_BIDS_converter(StageGatedConverter):
         return re.sub(r'[^a-zA-Z0-9]', '', self.experiment)
 
     # ---------- BIDS Utility ----------
+    # BIDS session label the outputs are written under (pyFR remaps re-implants)
+    def _bids_session(self):
+        return self.session
+
+    def _path_plan(self, session):
+        # Cached per key: pyFR's re-implant session remap depends on the
+        # montage, which ``cml_reader`` may correct after the first lookup.
+        key = (str(self.root), str(self.subject), str(session), self.task_label)
+        plans = self.__dict__.setdefault('_path_plans', {})
+        plan = plans.get(key)
+        if plan is None:
+            plan = plans[key] = SessionPathPlan(*key)
+        return plan
+
+    @property
+    def paths(self):
+        """``SessionPathPlan`` for the data files (beh, events, ieeg,
+        channels, channelmap), under ``_bids_session()``."""
+        return self._path_plan(self._bids_session())
+
+    @property
+    def gating_paths(self):
+        """``SessionPathPlan`` under ``self.session``, for stage gating, the
+        electrodes / coordsystem files and scans.tsv. Same plan as ``paths``
+        except for pyFR re-implants, whose data files go to the remapped
+        session while these stay under the original one."""
+        return self._path_plan(self.session)
+
     # return a base BIDS_path object to update
     def _BIDS_path(self):
-        bids_path = mne_bids.BIDSPath(subject=self.subject, task=self.task_label, session=str(self.session),
+        bids_path = mne_bids.BIDSPath(subject=self.subject, task=self.task_label, session=str(self._bids_session()),
                                         root=self.root)
         return bids_path
 
-    # write pandas dataframe to tsv file
-    def _to_tsv(self, dframe, fpath):
-        dframe.to_csv(fpath, sep='\t', index=False)
+    def _scans_tsv_path(self):
+        return self.gating_paths.scans_tsv
 
     # ---------- Stage gating ----------
     def _session_dir(self, datatype):
-        return os.path.join(self.root, f'sub-{self.subject}', f'ses-{self.session}', datatype)
+        return self.gating_paths.session_dir(datatype)
 
     def _bids_prefix(self):
-        return f'sub-{self.subject}_ses-{self.session}_task-{self.task_label}'
+        return self.gating_paths.prefix
 
     def _stage_outputs_exist(self, stage):
         """True iff every expected file for `stage` already exists on disk."""
-        prefix = self._bids_prefix()
-        ieeg_dir = self._session_dir('ieeg')
-        beh_dir = self._session_dir('beh')
+        paths = self.gating_paths
+        prefix = paths.prefix
+        ieeg_dir = paths.ieeg_dir
 
         if stage == 'behavioral':
-            return all(os.path.exists(p) for p in (
-                os.path.join(beh_dir, f'{prefix}_beh.tsv'),
-                os.path.join(beh_dir, f'{prefix}_beh.json'),
-            ))
+            return all(self._exists(p) for p in paths.beh.values())
         if stage == 'electrodes':
             # At least one space-*_electrodes.tsv + matching .json + _coordsystem.json must exist.
-            if not os.path.isdir(ieeg_dir):
+            if not self._isdir(ieeg_dir):
                 return False
-            tsvs = glob(os.path.join(ieeg_dir, f'{prefix}_space-*_electrodes.tsv'))
+            tsvs = self._glob(os.path.join(ieeg_dir, f'{prefix}_space-*_electrodes.tsv'))
             for tsv in tsvs:
                 base = tsv[:-len('_electrodes.tsv')]
-                if os.path.exists(base + '_electrodes.json') and os.path.exists(base + '_coordsystem.json'):
+                if self._exists(base + '_electrodes.json') and self._exists(base + '_coordsystem.json'):
                     return True
             return False
         if stage == 'bi-electrodes':
             # At least one acq-bipolar_space-*_electrodes.tsv + matching .json.
-            if not os.path.isdir(ieeg_dir):
+            if not self._isdir(ieeg_dir):
                 return False
-            tsvs = glob(os.path.join(ieeg_dir, f'{prefix}_acq-bipolar_space-*_electrodes.tsv'))
+            tsvs = self._glob(os.path.join(ieeg_dir, f'{prefix}_acq-bipolar_space-*_electrodes.tsv'))
             for tsv in tsvs:
                 base = tsv[:-len('_electrodes.tsv')]
-                if os.path.exists(base + '_electrodes.json'):
+                if self._exists(base + '_electrodes.json'):
                     return True
             return False
         if stage in ('mono-channels', 'bi-channels'):
             acq = 'monopolar' if stage == 'mono-channels' else 'bipolar'
-            base = os.path.join(ieeg_dir, f'{prefix}_acq-{acq}_channels')
-            return os.path.exists(base + '.tsv') and os.path.exists(base + '.json')
+            return (self._exists(paths.channels[acq, '.tsv'])
+                    and self._exists(paths.channels[acq, '.json']))
         if stage in ('mono-eeg', 'bi-eeg'):
             acq = 'monopolar' if stage == 'mono-eeg' else 'bipolar'
-            json_ok = os.path.exists(os.path.join(ieeg_dir, f'{prefix}_acq-{acq}_ieeg.json'))
-            data_ok = any(os.path.exists(os.path.join(ieeg_dir, f'{prefix}_acq-{acq}_ieeg{ext}'))
-                          for ext in ('.edf', '.bdf'))
+            json_ok = self._exists(paths.ieeg[acq, '.json'])
+            data_ok = any(self._exists(paths.ieeg[acq, ext]) for ext in ('.edf', '.bdf'))
             return json_ok and data_ok
         raise ValueError(f"unknown stage: {stage!r}")
 
@@ -222,15 +323,32 @@ class intracranial_BIDS_converter(StageGatedConverter):
 
         # The data index montage can disagree with what is actually localized
         # on disk (e.g. R1204T RepFR1 is indexed montage=1 but only montage 0
-        # is localized). Resolve to a montage whose contacts/pairs load so the
-        # electrode + bipolar stages are not silently dropped.
+        # is localized). Resolving it probes the localization directory, so it
+        # is deferred to _ensure_montage(), called by run() only when a
+        # localization-dependent stage will run; events load fine on the
+        # index montage, so behavioral-only runs never touch localization.
         self.localization = int(sel.localization)
         self.index_montage = int(sel.montage)
-        self.montage = self._resolve_montage(self.localization, self.index_montage)
+        self.montage = self.index_montage
+        self._montage_pending = True
 
         reader = cml.CMLReader(subject=sel.subject, experiment=sel.experiment, session=sel.session,
                                localization=self.localization, montage=self.montage)
         return reader
+
+    def _ensure_montage(self):
+        """Resolve the montage to one whose contacts/pairs load (see
+        ``_resolve_montage``) and rebuild ``self.reader`` on it, once per
+        session, so the electrode + bipolar stages are not silently dropped.
+        A no-op for readers that did not defer resolution (e.g. pyFR's)."""
+        if not getattr(self, '_montage_pending', False):
+            return
+        self._montage_pending = False
+        self.montage = self._resolve_montage(self.localization, self.index_montage)
+        if self.montage != self.index_montage:
+            self.reader = cml.CMLReader(subject=self.subject, experiment=self.experiment,
+                                        session=self.session, localization=self.localization,
+                                        montage=self.montage)
     
     # ---------- Events ----------
     def _load_events(self):
@@ -279,16 +397,20 @@ class intracranial_BIDS_converter(StageGatedConverter):
         sample = pd.to_numeric(events["sample"], errors="coerce")
         aligned = sample >= 0
 
+        sfreq = None
         if not aligned.any():
             self._mark_no_eeg("events are not aligned to a recording "
                               "(no valid eegoffset)")
-            return pd.Series("n/a", index=events.index)
-
-        try:
-            sfreq = self._sfreq_hz()
-        except Exception as e:
-            self._mark_no_eeg("no EEG source metadata on disk "
-                              f"(sources.json/params.txt missing: {type(e).__name__})")
+        else:
+            try:
+                sfreq = self._sfreq_hz()
+            except Exception as e:
+                self._mark_no_eeg("no EEG source metadata on disk "
+                                  f"(sources.json/params.txt missing: {type(e).__name__})")
+        # The cmlreaders events as loaded (and offset-corrected): the
+        # reference --verify-in-worker checks the written events against.
+        self._remember_source_events(events["sample"], events["trial_type"], sfreq)
+        if sfreq is None:
             return pd.Series("n/a", index=events.index)
 
         return (sample / sfreq).mask(~aligned, "n/a")
@@ -319,6 +441,62 @@ class intracranial_BIDS_converter(StageGatedConverter):
             print(f"[NO EEG] {self.subject}, {self.experiment}, "
                   f"session {self.session}: {reason}")
 
+    def assign_serial_positions(self, events, only_unset=True):
+        """Give each recall (REC_WORD) the serial position of its word: the
+        1-based position of the first WORD event in the same list with the same
+        ``item_name``, or -999 for intrusions.
+
+        Done as one left merge of recalls onto first presentations keyed on
+        (list, item_name). With ``only_unset``, lists whose recalls already
+        carry serial positions (anything other than the -999 default) keep them.
+        """
+        has_list = events['list'].notna()
+        is_word = (events['trial_type'] == 'WORD') & has_list
+        is_rec = (events['trial_type'] == 'REC_WORD') & has_list
+        item = events['item_name'].astype(str)      # stray array cells would be unhashable
+
+        words = pd.DataFrame({'list': events.loc[is_word, 'list'], 'item_name': item[is_word]})
+        words['pos'] = words.groupby('list').cumcount() + 1
+        words = words.drop_duplicates(['list', 'item_name'])        # first presentation wins
+        recs = pd.DataFrame({'list': events.loc[is_rec, 'list'], 'item_name': item[is_rec]})
+        pos = recs.merge(words, on=['list', 'item_name'], how='left')['pos']
+        pos = pos.fillna(-999).astype(int).to_numpy()
+
+        if only_unset:
+            current = events.loc[is_rec, 'serialpos']
+            unset = (current == -999).groupby(recs['list']).transform('all').to_numpy()
+            pos = np.where(unset, pos, current.to_numpy())
+
+        events.loc[is_rec, 'serialpos'] = pos
+        return events
+
+    # ---------- Stimulation parameters ----------
+    @staticmethod
+    def _stim_params_frame(events):
+        """One row per event with the keys of its ``stim_params`` as columns.
+
+        ``stim_params`` is a dict, or a list whose first element is the dict;
+        anything else (no stimulation) gives an all-NaN row. Built in a single
+        pass over the column and aligned to ``events.index``.
+        """
+        records = []
+        for sp in events['stim_params']:
+            if isinstance(sp, list):
+                sp = sp[0] if sp else None
+            records.append(sp if isinstance(sp, dict) else {})
+        return pd.DataFrame.from_records(records, index=events.index)
+
+    def unpack_stim_params(self, events):
+        """Add the stimulation parameters as columns of ``events``."""
+        return pd.concat([events, self._stim_params_frame(events)], axis=1)
+
+    def assign_stim_lists(self, events):
+        """Fill the default ``stim_list`` (-999, e.g. math events) with the
+        list's value: the max ``stim_list`` over events of the same list."""
+        list_max = events.groupby('list')['stim_list'].transform('max')
+        events['stim_list'] = events['stim_list'].mask(events['stim_list'] == -999, list_max)
+        return events
+
     def set_wordpool(self):
         raise NotImplementedError       # override in subclass
 
@@ -348,14 +526,15 @@ class intracranial_BIDS_converter(StageGatedConverter):
         return list(cols) + [c for c in self.UNCORRECTED_EVENT_COLS if c in events.columns]
 
     def write_BIDS_beh(self):
-        bids_path = self._BIDS_path().update(suffix='beh', extension='.tsv', datatype='beh')
-        os.makedirs(bids_path.directory, exist_ok=True)
+        paths = self.paths
+        os.makedirs(paths.beh_dir, exist_ok=True)
 
         # write events to tsv
-        self._to_tsv(self.events, bids_path.fpath)
+        self._to_tsv(self.events, paths.beh['.tsv'])
+        self._remember_events_written(paths.beh['.tsv'])
 
         # write sidecar json
-        with open(bids_path.update(extension='.json').fpath, 'w') as f:
+        with open(paths.beh['.json'], 'w') as f:
             json.dump(fp=f, obj=self.events_descriptor)
 
         # Stage the stim_file referenced by events.tsv so bids-validator
@@ -388,7 +567,7 @@ class intracranial_BIDS_converter(StageGatedConverter):
             return
         os.makedirs(os.path.dirname(dst), exist_ok=True)
         shutil.copyfile(src, dst)
-        print(f"STIM: copied {src} -> {dst}")
+        self._log("INFO", f"STIM: copied {src} -> {dst}")
 
     # ---------- Electrodes ----------
     def load_contacts(self):
@@ -411,8 +590,14 @@ class intracranial_BIDS_converter(StageGatedConverter):
         contacts that's the ``contact`` column; for pairs it's
         ``contact_1`` or ``contact_2``) and retry until the load succeeds.
 
-        Returns ``(filtered_scheme, dropped_scheme_df)``.
+        Returns ``(filtered_scheme, dropped_scheme_df)``. In metadata-only
+        mode the scheme is matched to the existing recording's header instead
+        (see ``_filter_scheme_to_written``), when there is one.
         """
+        if self.metadata_only:
+            written = self._filter_scheme_to_written(scheme, scheme_name)
+            if written is not None:
+                return written
         all_events = self.reader.load("events")
         valid = all_events[all_events.eegoffset >= 0]
         if valid.empty:
@@ -580,9 +765,6 @@ class intracranial_BIDS_converter(StageGatedConverter):
                 electrodes[br] = contacts[br].values if br in contacts.columns else np.nan
                 br_cols.append(br)
 
-        electrodes = electrodes.fillna('n/a')
-        electrodes = electrodes.replace('', 'n/a')
-
         electrodes = electrodes[['name', 'x', 'y', 'z', 'size', 'group', 'hemisphere', 'type'] + br_cols]
         return electrodes
 
@@ -694,19 +876,9 @@ class intracranial_BIDS_converter(StageGatedConverter):
         read_raw_bids refuses to parse ("Entities in filename not ordered
         correctly").
         """
-        bids_space = CML_TO_BIDS_SPACE[cml_space]
-        desc = CML_TO_BIDS_DESC.get(cml_space)
-        ieeg_dir = self._session_dir('ieeg')
-        os.makedirs(ieeg_dir, exist_ok=True)
-        parts = [self._bids_prefix()]
-        if acq:
-            parts.append(f'acq-{acq}')
-        parts.append(f'space-{bids_space}')
-        if desc:
-            parts.append(f'desc-{desc}')
-        parts.append(suffix)
-        fname = '_'.join(parts) + extension
-        return os.path.join(ieeg_dir, fname)
+        paths = self.gating_paths
+        os.makedirs(paths.ieeg_dir, exist_ok=True)
+        return paths.space_file(cml_space, suffix, extension, acq=acq)
 
     def write_BIDS_electrodes(self, cml_space, electrodes, sidecar):
         self._to_tsv(electrodes, self._space_file(cml_space, 'electrodes', '.tsv'))
@@ -789,9 +961,6 @@ class intracranial_BIDS_converter(StageGatedConverter):
                 electrodes[br] = pairs[br].values if br in pairs.columns else np.nan
                 br_cols.append(br)
 
-        electrodes = electrodes.fillna('n/a')
-        electrodes = electrodes.replace('', 'n/a')
-
         electrodes = electrodes[['name', 'label_full', 'contact_1', 'contact_2',
                                  'x', 'y', 'z', 'size', 'group', 'hemisphere', 'type'] + br_cols]
         return electrodes
@@ -911,8 +1080,6 @@ class intracranial_BIDS_converter(StageGatedConverter):
             })
             channels = pd.concat([channels, dropped_rows], ignore_index=True)
 
-        channels = channels.fillna('n/a')
-        channels = channels.replace('', 'n/a')
         return channels
     
     # convert CML contacts to BIDS channels (monopolar)
@@ -953,8 +1120,6 @@ class intracranial_BIDS_converter(StageGatedConverter):
             })
             channels = pd.concat([channels, dropped_rows], ignore_index=True)
 
-        channels = channels.fillna('n/a')
-        channels = channels.replace('', 'n/a')
         return channels
     
     def write_BIDS_channelmap(self, ref):
@@ -978,24 +1143,9 @@ class intracranial_BIDS_converter(StageGatedConverter):
 
         mapping_df = pd.DataFrame(renamed, columns=['original_name', 'truncated_name'])
 
-        # Pick a suffix this mne-bids version will accept.
-        try:
-            from mne_bids.path import ALLOWED_FILENAME_SUFFIX
-            suffix = 'channelmap' if 'channelmap' in ALLOWED_FILENAME_SUFFIX else 'channels'
-        except ImportError:
-            suffix = 'channelmap'
-
-        bids_path = self._BIDS_path().update(
-            suffix=suffix, extension='.tsv', datatype='ieeg',
-            acquisition=ref,
-        )
-        # If we had to fall back to 'channels', rewrite the basename so
-        # the file is still distinguishable from the real channels.tsv.
-        out_path = bids_path.fpath
-        if suffix != 'channelmap':
-            out_dir = os.path.dirname(out_path)
-            out_name = os.path.basename(out_path).replace('_channels.tsv', '_channelmap.tsv')
-            out_path = os.path.join(out_dir, out_name)
+        # Named directly (not via BIDSPath, whose suffix whitelist may not
+        # include 'channelmap'); .bidsignore'd below.
+        out_path = self.paths.channelmap[ref]
         os.makedirs(os.path.dirname(out_path), exist_ok=True)
         self._to_tsv(mapping_df, out_path)
 
@@ -1031,24 +1181,73 @@ class intracranial_BIDS_converter(StageGatedConverter):
             self._ensure_bidsignore_pattern(f'**/*_space-Other_desc-{desc}_*')
 
     def write_BIDS_channels(self, ref):
-        bids_path = self._BIDS_path().update(suffix='channels', extension='.tsv', datatype='ieeg')
-
         if ref == 'bipolar':
-            bids_path.update(acquisition='bipolar')
             df = self.channels_bi
         elif ref == 'monopolar':
-            bids_path.update(acquisition='monopolar')
             df = self.channels_mono
         else:
             raise ValueError(f"unknown ref: {ref!r}")
 
-        self._to_tsv(df, bids_path.fpath)
-        with open(bids_path.update(extension='.json').fpath, 'w') as f:
+        channels = self.paths.channels
+        self._to_tsv(df, channels[ref, '.tsv'])
+        with open(channels[ref, '.json'], 'w') as f:
             json.dump(fp=f, obj=self.make_channels_sidecar(), indent=2)
 
     # ---------- EEG ----------
+    def _existing_ieeg_path(self, ref):
+        """The EDF/BDF already written for ``ref`` ('monopolar' / 'bipolar'),
+        or None."""
+        for ext in ('.edf', '.bdf'):
+            path = self.paths.ieeg[ref, ext]
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _existing_eeg_metadata(self):
+        """``(sfreq, recording_duration)`` from the iEEG files already in the
+        BIDS tree, or None. The sidecar's values are exact as written; the
+        EDF/BDF header is the fallback (its duration includes the padding of
+        the last data record)."""
+        for ref in ('monopolar', 'bipolar'):
+            sidecar = self.paths.ieeg[ref, '.json']
+            try:
+                with open(sidecar) as f:
+                    meta = json.load(f)
+                return float(meta['SamplingFrequency']), float(meta['RecordingDuration'])
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+        for ref in ('monopolar', 'bipolar'):
+            path = self._existing_ieeg_path(ref)
+            header = read_edf_header(path) if path else None
+            if header and header['sfreq']:
+                return header['sfreq'], header['duration']
+        return None
+
+    def _filter_scheme_to_written(self, scheme, scheme_name):
+        """Split ``scheme`` into the entries whose (EDF-truncated) label is a
+        channel of the existing recording and the rest, or None when there
+        is no readable recording for it."""
+        ref = 'monopolar' if scheme_name == 'contacts' else 'bipolar'
+        path = self._existing_ieeg_path(ref)
+        header = read_edf_header(path) if path else None
+        if header is None:
+            return None
+        if ref == 'bipolar':
+            labels = scheme['label'].astype(str).map(
+                lambda n: self._truncate_bipolar(n) if len(n) > 16 else n)
+        else:
+            labels = scheme['label'].astype(str).str[:16]
+        keep = labels.str.strip().isin(set(header['labels'])).to_numpy()
+        if not keep.all():
+            print(f"  Dropped {int((~keep).sum())} {scheme_name} not in {os.path.basename(path)}")
+        return scheme[keep], scheme[~keep]
+
     # set sfreq and recording_duration attributes
     def eeg_metadata(self):
+        if self.metadata_only:
+            existing = self._existing_eeg_metadata()
+            if existing is not None:
+                return existing
         try:
             eeg = self.reader.load_eeg()
         except Exception as exc:
@@ -1157,20 +1356,15 @@ class intracranial_BIDS_converter(StageGatedConverter):
         """
         if ref == "bipolar":
             data_int, labels, sfreq, container = self.eeg_bi
-            sidecar_dict = self.eeg_sidecar_bi
         elif ref == "monopolar":
             data_int, labels, sfreq = self.eeg_mono
             container = "EDF"
-            sidecar_dict = self.eeg_sidecar_mono
         else:
             raise ValueError(f"unknown ref {ref!r}")
 
         ext = ".edf" if container == "EDF" else ".bdf"
-        bids_path = self._BIDS_path().update(
-            suffix="ieeg", extension=ext, datatype="ieeg", acquisition=ref,
-        )
-        out_path = bids_path.fpath
-        os.makedirs(out_path.parent, exist_ok=True)
+        out_path = self.paths.ieeg[ref, ext]
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
 
         # Resolve per-channel units via the priority cascade.
         source_edf = self._source_recording_path() if ref == "monopolar" else None
@@ -1191,27 +1385,77 @@ class intracranial_BIDS_converter(StageGatedConverter):
             )
 
         write_digital(
-            str(out_path),
+            out_path,
             labels,
             data_int,
             sfreq,
             signal_units,
             container=container,
         )
-
-        # Sidecar JSON.
-        with open(bids_path.update(extension=".json").fpath, "w") as f:
-            json.dump(sidecar_dict, f, indent=2)
+        self._remember_written('digital', out_path, labels, data_int)
 
         # Append to scans.tsv (replacing any prior entry for this acquisition).
         self._update_scans_tsv(out_path)
 
-        # Events sidecar (only on the first acquisition write — same as before).
-        bids_path = self._BIDS_path().update(
-            suffix="events", extension=".tsv", datatype="ieeg",
+        self.write_BIDS_ieeg_sidecars(ref)
+
+    def patch_BIDS_ieeg_header(self, ref):
+        """Bring the units of the recording already written for ``ref`` up
+        to date with ``resolve_edf_units``, rewriting only its header
+        (``patch_header``) — the --metadata-only counterpart of the unit
+        resolution in ``write_BIDS_ieeg``.
+
+        Only channels resolved from the source EDF header or the unit
+        conversion CSV are patched; the data-derived fallback needs the
+        samples, so those channels keep the units they were written with.
+        A channel whose resolved digital range differs from the file's needs
+        a re-encode and is reported instead. Labels are left as written.
+        """
+        path = self._existing_ieeg_path(ref)
+        header = read_header(path)
+        labels = [header.labels[k] for k in header.data_signals]
+        source_edf = self._source_recording_path() if ref == "monopolar" else None
+        signal_units, units_status = resolve_edf_units(
+            labels,
+            source_edf_path=source_edf,
+            conversion_to_V=float(self.unit_scale) if self.unit_scale else None,
+            container=header.container,
         )
-        self._to_tsv(self.events, bids_path.fpath)
-        with open(bids_path.update(extension=".json").fpath, "w") as f:
+        if "derived" in units_status:
+            src = read_source_edf_units(source_edf) if source_edf else None
+            signal_units = {
+                label: units for label, units in signal_units.items()
+                if src and label in src
+                and not is_placeholder_units(src[label][0], src[label][1], src[label][4])
+            }
+
+        file_ranges = {header.labels[k]: (header.digital_min[k], header.digital_max[k])
+                       for k in header.data_signals}
+        stale = [label for label, units in signal_units.items()
+                 if (int(units[2]), int(units[3])) != file_ranges[label]]
+        if stale:
+            print(f"  WARN: {os.path.basename(path)}: digital range changed for "
+                  f"{len(stale)} channel(s) ({', '.join(stale[:5])}); units not "
+                  f"patched, re-encode with --overwrite eeg (without --metadata-only)")
+        signal_units = {label: units for label, units in signal_units.items()
+                        if label not in stale}
+        if patch_header(path, signal_units=signal_units):
+            self._log("INFO", f"PATCHED: {ref} units in {os.path.basename(path)}")
+
+    def write_BIDS_ieeg_sidecars(self, ref):
+        """Write the ``_ieeg.json`` sidecar for ``ref`` and the session's
+        events TSV + JSON: everything ``write_BIDS_ieeg`` writes except the
+        recording itself (and its scans.tsv row)."""
+        sidecar_dict = self.eeg_sidecar_bi if ref == "bipolar" else self.eeg_sidecar_mono
+        paths = self.paths
+        os.makedirs(paths.ieeg_dir, exist_ok=True)
+        with open(paths.ieeg[ref, ".json"], "w") as f:
+            json.dump(sidecar_dict, f, indent=2)
+
+        # Events sidecar (only on the first acquisition write — same as before).
+        self._to_tsv(self.events, paths.events[".tsv"])
+        self._remember_events_written(paths.events[".tsv"])
+        with open(paths.events[".json"], "w") as f:
             json.dump(fp=f, obj=self.events_descriptor)
 
     # ---------- EEG (monopolar) ----------
@@ -1251,7 +1495,8 @@ class intracranial_BIDS_converter(StageGatedConverter):
                 self.contacts = self.contacts[mask].reset_index(drop=True)
             else:
                 self.contacts = self.contacts.iloc[:n_loaded].reset_index(drop=True)
-            print(
+            self._log(
+                "DEBUG",
                 f"  eeg_mono_to_BIDS: reconciled self.contacts to {n_loaded} "
                 f"channels (was {n_loaded + (len(mask) - mask.sum()) if kept else '?'})"
             )
@@ -1367,7 +1612,8 @@ class intracranial_BIDS_converter(StageGatedConverter):
                 dropped = self.pairs[~mask]
                 self.pairs = self.pairs[mask].reset_index(drop=True)
                 if len(dropped):
-                    print(
+                    self._log(
+                        "DEBUG",
                         f"  eeg_bi_to_BIDS: cmlreaders silently dropped {len(dropped)} "
                         f"pairs at load time; reconciled self.pairs"
                     )
@@ -1418,7 +1664,7 @@ class intracranial_BIDS_converter(StageGatedConverter):
         self._ensure_dataset_description()
         self._ensure_readme()
 
-        print(f"DEBUG: overrides={self.overrides} root={self.root} session_dir={self._session_dir('ieeg')}")
+        self._log("DEBUG", f"overrides={self.overrides} root={self.root} session_dir={self._session_dir('ieeg')}")
 
         # ---------- Behavioral ----------
         if self._should_run('behavioral'):
@@ -1433,7 +1679,7 @@ class intracranial_BIDS_converter(StageGatedConverter):
                 return
         else:
             self._mark_stage('behavioral', 'skipped')
-            print(f"SKIP: behavioral outputs exist for {self.subject}/{self.experiment}/ses-{self.session}")
+            self._log("INFO", f"SKIP: behavioral outputs exist for {self.subject}/{self.experiment}/ses-{self.session}")
 
         # Decide upfront which stages will run so we know what to load.
         # We always attempt both monopolar and bipolar; per-acquisition
@@ -1456,9 +1702,9 @@ class intracranial_BIDS_converter(StageGatedConverter):
                     self._mark_stage(stage, 'no_eeg')
             run_mono_eeg = run_bi_eeg = run_mono_channels = run_bi_channels = False
 
-        print(f"DEBUG: run_electrodes={run_electrodes} run_bi_electrodes={run_bi_electrodes} "
-              f"run_mono_eeg={run_mono_eeg} run_bi_eeg={run_bi_eeg} "
-              f"run_mono_channels={run_mono_channels} run_bi_channels={run_bi_channels}")
+        self._log("DEBUG", f"run_electrodes={run_electrodes} run_bi_electrodes={run_bi_electrodes} "
+                           f"run_mono_eeg={run_mono_eeg} run_bi_eeg={run_bi_eeg} "
+                           f"run_mono_channels={run_mono_channels} run_bi_channels={run_bi_channels}")
 
         # write_BIDS_ieeg needs self.events and self.events_descriptor even
         # when the behavioral stage was skipped — load them if any EEG stage
@@ -1475,6 +1721,11 @@ class intracranial_BIDS_converter(StageGatedConverter):
         needs_contacts = run_electrodes or run_mono_eeg or run_mono_channels
         needs_pairs = run_bi_eeg or run_bi_channels or run_bi_electrodes
 
+        # Every stage from here on reads contacts, pairs or electrode
+        # categories; settle the montage before any of them (or the EEG) load.
+        if needs_eeg_meta or needs_contacts or needs_pairs:
+            self._ensure_montage()
+
         if needs_eeg_meta:
             self.sfreq, self.recording_duration = self.eeg_metadata()
 
@@ -1519,7 +1770,7 @@ class intracranial_BIDS_converter(StageGatedConverter):
                     print(f"WARNING: no known CML coordinate spaces found for {self.subject}")
                 for cml_space in available:
                     bids_space = CML_TO_BIDS_SPACE[cml_space]
-                    print(f"WRITING: electrodes (cml={cml_space}, space={bids_space}) for {self.subject}/{self.experiment}/ses-{self.session}")
+                    self._log("INFO", f"WRITING: electrodes (cml={cml_space}, space={bids_space}) for {self.subject}/{self.experiment}/ses-{self.session}")
                     electrodes = self.contacts_to_electrodes(cml_space)
                     sidecar = self.make_electrodes_sidecar(cml_space)
                     self.write_BIDS_electrodes(cml_space, electrodes, sidecar)
@@ -1529,7 +1780,7 @@ class intracranial_BIDS_converter(StageGatedConverter):
                 self._report_stage_failure(['electrodes'], 'Electrodes write', e)
         elif self.stage_outcomes.get('electrodes') == 'not_run':
             self._mark_stage('electrodes', 'skipped')
-            print(f"SKIP: electrodes outputs exist for {self.subject}/{self.experiment}/ses-{self.session}")
+            self._log("INFO", f"SKIP: electrodes outputs exist for {self.subject}/{self.experiment}/ses-{self.session}")
 
         # ---------- Bipolar (channels + EEG) ----------
         if needs_pairs:
@@ -1562,7 +1813,7 @@ class intracranial_BIDS_converter(StageGatedConverter):
                     print(f"WARNING: no known CML coordinate spaces found for bipolar pairs of {self.subject}")
                 for cml_space in available:
                     bids_space = CML_TO_BIDS_SPACE[cml_space]
-                    print(f"WRITING: bipolar electrodes (cml={cml_space}, space={bids_space}) for {self.subject}/{self.experiment}/ses-{self.session}")
+                    self._log("INFO", f"WRITING: bipolar electrodes (cml={cml_space}, space={bids_space}) for {self.subject}/{self.experiment}/ses-{self.session}")
                     electrodes = self.pairs_to_bipolar_electrodes(cml_space)
                     sidecar = self.make_bipolar_electrodes_sidecar(cml_space)
                     self.write_BIDS_bipolar_electrodes(cml_space, electrodes, sidecar)
@@ -1576,11 +1827,15 @@ class intracranial_BIDS_converter(StageGatedConverter):
         # when write_BIDS_channels overwrites it (or so the file exists
         # for the channels stage to target on a re-run).
         if run_bi_eeg:
-            print(f"WRITING: bi-eeg for {self.subject}/{self.experiment}/ses-{self.session}")
+            self._log("INFO", f"WRITING: bi-eeg for {self.subject}/{self.experiment}/ses-{self.session}")
             try:
                 self.eeg_sidecar_bi = self.eeg_sidecar('bipolar')
-                self.eeg_bi = self.eeg_bi_to_BIDS()
-                self.write_BIDS_ieeg('bipolar')
+                if self.metadata_only and self._existing_ieeg_path('bipolar'):
+                    self.patch_BIDS_ieeg_header('bipolar')
+                    self.write_BIDS_ieeg_sidecars('bipolar')
+                else:
+                    self.eeg_bi = self.eeg_bi_to_BIDS()
+                    self.write_BIDS_ieeg('bipolar')
                 self._mark_stage('bi-eeg', 'ok')
             except Exception as e:
                 self._report_stage_failure(['bi-eeg'], 'Bipolar EEG conversion', e)
@@ -1588,7 +1843,7 @@ class intracranial_BIDS_converter(StageGatedConverter):
             self._mark_stage('bi-eeg', 'skipped')
 
         if run_bi_channels:
-            print(f"WRITING: bi-channels for {self.subject}/{self.experiment}/ses-{self.session}")
+            self._log("INFO", f"WRITING: bi-channels for {self.subject}/{self.experiment}/ses-{self.session}")
             try:
                 self.channels_bi = self.pairs_to_channels()
                 self.write_BIDS_channels('bipolar')
@@ -1601,11 +1856,15 @@ class intracranial_BIDS_converter(StageGatedConverter):
 
         # ---------- Monopolar (channels + EEG) ----------
         if run_mono_eeg:
-            print(f"WRITING: mono-eeg for {self.subject}/{self.experiment}/ses-{self.session}")
+            self._log("INFO", f"WRITING: mono-eeg for {self.subject}/{self.experiment}/ses-{self.session}")
             try:
                 self.eeg_sidecar_mono = self.eeg_sidecar('monopolar')
-                self.eeg_mono = self.eeg_mono_to_BIDS()
-                self.write_BIDS_ieeg('monopolar')
+                if self.metadata_only and self._existing_ieeg_path('monopolar'):
+                    self.patch_BIDS_ieeg_header('monopolar')
+                    self.write_BIDS_ieeg_sidecars('monopolar')
+                else:
+                    self.eeg_mono = self.eeg_mono_to_BIDS()
+                    self.write_BIDS_ieeg('monopolar')
                 self._mark_stage('mono-eeg', 'ok')
             except Exception as e:
                 self._report_stage_failure(['mono-eeg'], 'Monopolar EEG conversion', e)
@@ -1613,7 +1872,7 @@ class intracranial_BIDS_converter(StageGatedConverter):
             self._mark_stage('mono-eeg', 'skipped')
 
         if run_mono_channels:
-            print(f"WRITING: mono-channels for {self.subject}/{self.experiment}/ses-{self.session}")
+            self._log("INFO", f"WRITING: mono-channels for {self.subject}/{self.experiment}/ses-{self.session}")
             try:
                 self.channels_mono = self.contacts_to_channels()
                 self.write_BIDS_channels('monopolar')
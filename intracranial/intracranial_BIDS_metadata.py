@@ -13,6 +13,10 @@ from tqdm import tqdm
 import math
 import string
 from pathlib import Path
+try:
+    from . import static_tables
+except ImportError:         # imported top-level by run_BIDS_metadata.py
+    import static_tables
 
 _HERE = Path(__file__).parent
 
@@ -169,10 +173,8 @@ class intracranial_BIDS_metadata:
     
     # query results from system_version_finder.py for NaN system versions
     def _determine_system_version(self, row):
-        sys_vers = pd.read_csv(_HERE / 'system_versions.csv')
-        sv = sys_vers[(sys_vers.subject == row.subject) & (sys_vers.experiment==row.experiment) & 
-                      (sys_vers.session == row.session)]
-        return sv.iloc[0].system_version
+        return static_tables.row('system_versions', row.subject, row.experiment,
+                                 row.session)['system_version']
     
     # sleuth system version by inferring from files
     # elemem folder = system 4
@@ -232,10 +234,8 @@ class intracranial_BIDS_metadata:
             return 10000000.0
         else:
             # read in from csv
-            sys1_units = pd.read_csv(_HERE / 'system_1_unit_conversions.csv')
-            return sys1_units[(sys1_units.subject == row.subject) &
-                              (sys1_units.experiment == row.experiment) & 
-                              (sys1_units.session == row.session)].iloc[0]['conversion_to_V']
+            return static_tables.row('system_1_unit_conversions', row.subject, row.experiment,
+                                     row.session)['conversion_to_V']
     
     def _area_data(self, row, system_version):
         area_path = f'/data10/RAM/subjects/{row.subject}/docs/area.txt'
@@ -243,13 +243,12 @@ class intracranial_BIDS_metadata:
     
     def _brain_regions(self, row):
         # read in from csv
-        region_data = pd.read_csv(_HERE / 'bids_brain_regions.csv')
-        regions = region_data[(region_data.subject==row.subject) & (region_data.experiment==row.experiment) & (region_data.session==row.session)]
-        if len(regions) == 0:
+        regions = static_tables.lookup('bids_brain_regions', row.subject, row.experiment, row.session)
+        if regions is None:
             return dict(zip(self.BRAIN_REGIONS, np.zeros(len(self.BRAIN_REGIONS), dtype=int)))
         else:
-            return {'wb.region':regions['wb.region'].iloc[0], 'ind.region':regions['ind.region'].iloc[0],
-                    'das.region':regions['das.region'].iloc[0], 'stein.region':regions['stein.region'].iloc[0]}
+            return {'wb.region':regions['wb.region'], 'ind.region':regions['ind.region'],
+                    'das.region':regions['das.region'], 'stein.region':regions['stein.region']}
         
     def _n_eegfiles(self, reader):
         # load events
@@ -5,10 +5,10 @@ import numpy as np
 import re
 import json
 import os
-import mne_bids
 import scipy
 from pathlib import Path
 from ..intracranial_BIDS_converter import intracranial_BIDS_converter
+from .. import static_tables
 
 _HERE = Path(__file__).parent
 
@@ -303,17 +303,11 @@ class pyFR_BIDS_converter(intracranial_BIDS_converter):
         self.root = root
 
     # ---------- BIDS Utility ---------
-    # return a base BIDS_path object to update
-    def _BIDS_path(self):
-        # update session if re-implant
+    # BIDS session label: re-implants are remapped to their new session
+    def _bids_session(self):
         new_session = self.reassign_session()
-        if new_session:
-            bids_path = mne_bids.BIDSPath(subject=self.subject, task=self.experiment, session=str(new_session),
-                                            root=self.root)
-        else:
-            bids_path = mne_bids.BIDSPath(subject=self.subject, task=self.experiment, session=str(self.session),
-                                            root=self.root)
-        return bids_path
+        return new_session if new_session else self.session
+
     # instantiate CMLRead object, save as attribute
     def cml_reader(self):
         df = cml.get_data_index()
@@ -336,13 +330,8 @@ class pyFR_BIDS_converter(intracranial_BIDS_converter):
         return reader
 
     def reassign_session(self):
-        re_implants = pd.read_csv(_HERE / 're_implants.csv')
-        ri = re_implants[(re_implants.subject == self.subject) & (re_implants.montage == self.montage) &
-                         (re_implants.session == self.session)]
-        if len(ri) == 1:
-            return ri.iloc[0].new_session
-        else:
-            return None
+        ri = static_tables.lookup('re_implants', self.subject, self.montage, self.session)
+        return ri['new_session'] if ri is not None else None
 
     # ---------- Events ----------
     def set_wordpool(self):
@@ -377,7 +366,7 @@ class pyFR_BIDS_converter(intracranial_BIDS_converter):
                    (events.trial_type=='PROB'), 'response_time'] = events['rectime'] / 1000.0
         events['stim_file'] = np.where(events.trial_type=='WORD', self.wordpool_file, 'n/a')              # add wordpool to word events
         events['item_name'] = events['item'].replace('X', 'n/a')
-        events = self.assign_serial_positions(events)                                                # assign serail positions to recalls
+        events = self.assign_serial_positions(events, only_unset=False)                                   # assign serial positions to recalls (pyFR recalls carry none)
         # Some columns (e.g. the math `test` problem = array([X, Y, Z])) hold
         # array/list cell values. pandas' elementwise fillna/replace below does
         # `cell == ''`, which raises "truth value of an array ... is ambiguous"
@@ -424,37 +413,6 @@ class pyFR_BIDS_converter(intracranial_BIDS_converter):
         events['duration'] = durations        # preserves column order
         return events
 
-    # assign serial positions to recall events (all given serial position = -999)
-    def assign_serial_positions(self, events):
-        serialpos = []
-        for l, l_evs in events.groupby('list', sort=False):         # preserve order
-            w_evs = l_evs.query("trial_type == 'WORD'")
-            r_evs = l_evs.query("trial_type == 'REC_WORD'")
-
-            # recall events all given default serial position == -999 or 0
-
-            # Coerce to strings so the membership/argwhere comparisons stay
-            # scalar — a stray array/empty-array cell otherwise triggers a
-            # numpy broadcast error ("operands could not be broadcast ...").
-            words = np.array([str(x) for x in w_evs.item_name])
-            recs = np.array([str(x) for x in r_evs.item_name])
-            sp = []
-            for r in recs:
-                match = np.argwhere(words == r)
-                sp.append(int(match[0][0]) + 1 if len(match) else -999)
-
-            serialpos.extend(sp)
-
-        # Guard against a length mismatch (e.g. no REC_WORD rows but serialpos
-        # populated, or vice versa), which pandas reports as a broadcast error.
-        n_rec = int((events['trial_type'] == 'REC_WORD').sum())
-        if len(serialpos) == n_rec:
-            events.loc[events['trial_type'] == 'REC_WORD', 'serialpos'] = serialpos
-        else:
-            print(f"WARNING: serialpos length {len(serialpos)} != REC_WORD count {n_rec} "
-                  f"for {self.subject}/{self.experiment}/ses-{self.session}; leaving serialpos unset")
-        return events
-
     def make_events_descriptor(self):
         descriptions = {
             'B': 'Beginning of session.',
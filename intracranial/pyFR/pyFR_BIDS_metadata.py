@@ -5,6 +5,7 @@ import pandas as pd
 import scipy
 from tqdm import tqdm
 from ..intracranial_BIDS_metadata import intracranial_BIDS_metadata
+from .. import static_tables
 
 # class to use when doing metadata checks before converting pyFR to BIDS format
 class pyFR_BIDS_metadata(intracranial_BIDS_metadata):
@@ -118,7 +119,5 @@ class pyFR_BIDS_metadata(intracranial_BIDS_metadata):
         return system_version, unit_scale
 
     def _determine_unit_scale(self, row):
-        sys1_units = pd.read_csv('system_1_unit_conversions.csv')
-        return sys1_units[(sys1_units.subject == row.subject) &
-                        (sys1_units.experiment == row.experiment) &
-                        (sys1_units.session == row.session)].iloc[0]['conversion_to_V']
+        return static_tables.row('system_1_unit_conversions', row.subject, row.experiment,
+                                 row.session)['conversion_to_V']
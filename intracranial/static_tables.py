@@ -0,0 +1,87 @@
+"""Lookup store for the static side-table CSVs shipped with the converters.
+
+Several converters and metadata classes look one session up in a small CSV
+(word durations, re-implant session remaps, system versions, System 1 unit
+conversions, brain-region flags). Re-reading and mask-filtering the CSV on
+every call is wasted work; here each table is parsed once per process, on
+first use, into a dict keyed by its lookup columns.
+
+    from intracranial import static_tables
+    static_tables.lookup('re_implants', subject, montage, session)   # dict | None
+    static_tables.row('word_durations', subject, session)            # dict, KeyError if absent
+
+Rows are plain dicts of column -> value. When a key occurs more than once the
+first row wins, as ``.iloc[0]`` on the filtered frame did. Key parts are
+compared as strings on both sides, so ``session=3``, ``np.int64(3)``, ``3.0``
+and ``'3'`` all find the same row.
+"""
+
+import numbers
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+_HERE = Path(__file__).parent
+
+# name -> (CSV path, key columns)
+TABLES = {
+    'word_durations': (_HERE / 'RepFR1' / 'word_durations.csv', ('subject', 'session')),
+    're_implants': (_HERE / 'pyFR' / 're_implants.csv', ('subject', 'montage', 'session')),
+    'system_versions': (_HERE / 'system_versions.csv', ('subject', 'experiment', 'session')),
+    'system_1_unit_conversions': (_HERE / 'system_1_unit_conversions.csv', ('subject', 'experiment', 'session')),
+    'bids_brain_regions': (_HERE / 'bids_brain_regions.csv', ('subject', 'experiment', 'session')),
+}
+
+_INDEX = {}
+_LOCK = threading.Lock()            # Dask workers may share the process across threads
+
+
+def _canonical(value):
+    # Integral floats (a column with a blank cell reads as float) print as ints.
+    if isinstance(value, numbers.Real) and float(value).is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _normalize(key):
+    return tuple(_canonical(k) for k in key)
+
+
+def _load(name):
+    path, key_cols = TABLES[name]
+    frame = pd.read_csv(path, dtype={'subject': str})
+    index = {}
+    for rec in frame.to_dict('records'):
+        index.setdefault(_normalize(rec[c] for c in key_cols), rec)
+    return index
+
+
+def table(name):
+    """The ``{key tuple: row dict}`` index for ``name``, parsed on first use."""
+    index = _INDEX.get(name)
+    if index is None:
+        with _LOCK:
+            index = _INDEX.get(name)
+            if index is None:
+                index = _INDEX[name] = _load(name)
+    return index
+
+
+def lookup(name, *key):
+    """Row of table ``name`` for ``key`` (in the table's key-column order), or None."""
+    return table(name).get(_normalize(key))
+
+
+def row(name, *key):
+    """Like ``lookup``, but a missing row raises KeyError."""
+    rec = lookup(name, *key)
+    if rec is None:
+        raise KeyError(f"no {name} entry for {', '.join(map(str, key))}")
+    return rec
+
+
+def clear():
+    """Drop the parsed tables (e.g. after editing a CSV in a long-lived session)."""
+    with _LOCK:
+        _INDEX.clear()
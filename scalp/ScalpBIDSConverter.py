@@ -6,13 +6,13 @@ import os
 import sys
 import json
 import inspect
+import tempfile
 from glob import glob, escape as glob_escape
-import shutil
 import mne_bids
 import cmlreaders as cml
 import mne
 import time
-import pyedflib
+from concurrent.futures import ThreadPoolExecutor
 
 # edf_digital_writer lives under intracranial/ — share it without a move.
 sys.path.insert(
@@ -24,9 +24,12 @@ sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
 )
 from edf_digital_writer import (  # noqa: E402
-    write_digital, resolve_edf_units, encode_egi_to_bdf,
+    write_digital, write_digital_blocks, resolve_edf_units,
+    encode_egi_to_bdf, egi_signal_units, read_header, read_digital,
+    ChannelDigests,
 )
 from cli.stages import EEG_BIDS_CITATION, StageGatedConverter  # noqa: E402
+from bz2_cache import decompressed_path  # noqa: E402
 
 # Montage cap files ship next to this module. Anchor on __file__ rather than
 # the cwd — the entry point lives at the repo root, not in scalp/.
@@ -44,6 +47,11 @@ class ScalpBIDSConverter(StageGatedConverter):
     # or "brainvision" (IEEE float32 .vhdr/.eeg/.vmrk). Change here in code.
     egi_output_format = "brainvision"
 
+    # Block length (s) for streaming EGI reads: the non-finite/peak pre-scan
+    # and both writers hold one block at a time. A minute of a 129-channel
+    # net at 1 kHz is ~60 MB of float64.
+    egi_block_seconds = 60.0
+
     # Manual raw-file pins, for sessions the automatic resolution in
     # locate_raw_files() cannot settle. Keyed by (subject_raw, session) ->
     # chosen basename (or absolute path); a list/tuple of names pins a
@@ -299,6 +307,8 @@ class ScalpBIDSConverter(StageGatedConverter):
         except Exception as exc:
             self._report_stage_failure(['eeg', 'montage'], 'EEG load', exc)
             return
+        finally:
+            self._save_usability_cache()
 
         # No recording holds samples, and nothing claimed one should. That's a
         # real property of some sessions — the recording was aborted before the
@@ -320,51 +330,66 @@ class ScalpBIDSConverter(StageGatedConverter):
         multi_run = len(raw_filepaths) > 1
         eeg_ok, montage_ok = True, True
 
-        for index, raw_filepath in enumerate(raw_filepaths, start=1):
-            run = str(index) if multi_run else None
-            try:
-                self.raw_filepath = raw_filepath
-                if self.raw_filepath.endswith(".bz2"):
-                    self.unzip_raw_files()
-                self.file_type = os.path.splitext(self.raw_filepath)[1]
-                self.raw_file = self.load_scalp_eeg()
-                self.set_montage()
-                self.events = self.load_events(
-                    eegfile=self.raw_filepath if multi_run else None,
-                    sfreq=self.sfreq,
-                )
-                # events_descriptor is otherwise only built in the behavioral
-                # stage; build it here too so the eeg/montage stages are
-                # self-sufficient when behavioral is skipped (e.g. a re-run with
-                # --overwrite eeg / --overwrite montage but existing behavioral output).
-                self.make_event_descriptors()
-            except Exception as exc:
-                # Both downstream stages depend on the source EEG; fail together.
-                eeg_ok = montage_ok = False
-                self._report_stage_failure(
-                    ['eeg', 'montage'],
-                    f'EEG load{f" (run {run})" if run else ""}', exc)
-                return
-
-            # ---------- EEG (direct pyedflib write, no MNE round-trip) ----------
-            if run_eeg:
-                try:
-                    self.write_bids_eeg(overwrite=True, run=run)
-                except Exception as exc:
-                    eeg_ok = False
-                    self._report_stage_failure(
-                        ['eeg'],
-                        f'EEG conversion{f" (run {run})" if run else ""}', exc)
+        # Start decompressing every .bz2 part up front, so a later part
+        # unpacks while an earlier one converts (bz2 releases the GIL).
+        pool, unzipped = None, {}
+        if any(p.endswith(".bz2") for p in raw_filepaths):
+            pool = ThreadPoolExecutor(max_workers=1)
+            unzipped = {p: pool.submit(decompressed_path, p)
+                        for p in raw_filepaths if p.endswith(".bz2")}
 
-            # ---------- Montage (channels.tsv + electrodes.tsv only) ----------
-            if run_montage:
+        try:
+            for index, raw_filepath in enumerate(raw_filepaths, start=1):
+                run = str(index) if multi_run else None
                 try:
-                    self.write_bids_montage(overwrite=True, run=run)
+                    self.raw_filepath = raw_filepath
+                    if raw_filepath in unzipped:
+                        self.raw_filepath = unzipped[raw_filepath].result()
+                    self.file_type = os.path.splitext(self.raw_filepath)[1]
+                    self.raw_file = self.load_scalp_eeg()
+                    self.set_montage()
+                    self.events = self.load_events(
+                        # The source name, which is what events.eegfile records.
+                        eegfile=raw_filepath if multi_run else None,
+                        sfreq=self.sfreq,
+                    )
+                    # events_descriptor is otherwise only built in the behavioral
+                    # stage; build it here too so the eeg/montage stages are
+                    # self-sufficient when behavioral is skipped (e.g. a re-run with
+                    # --overwrite eeg / --overwrite montage but existing behavioral output).
+                    self.make_event_descriptors()
                 except Exception as exc:
-                    montage_ok = False
+                    # Both downstream stages depend on the source EEG; fail together.
+                    eeg_ok = montage_ok = False
                     self._report_stage_failure(
-                        ['montage'],
-                        f'Montage write{f" (run {run})" if run else ""}', exc)
+                        ['eeg', 'montage'],
+                        f'EEG load{f" (run {run})" if run else ""}', exc)
+                    return
+
+                # ---------- EEG (direct pyedflib write, no MNE round-trip) ----------
+                if run_eeg:
+                    try:
+                        self.write_bids_eeg(overwrite=True, run=run)
+                    except Exception as exc:
+                        eeg_ok = False
+                        self._report_stage_failure(
+                            ['eeg'],
+                            f'EEG conversion{f" (run {run})" if run else ""}', exc)
+
+                # ---------- Montage (channels.tsv + electrodes.tsv only) ----------
+                if run_montage:
+                    try:
+                        self.write_bids_montage(overwrite=True, run=run)
+                    except Exception as exc:
+                        montage_ok = False
+                        self._report_stage_failure(
+                            ['montage'],
+                            f'Montage write{f" (run {run})" if run else ""}', exc)
+        finally:
+            # An early return (failed load) or exception leaves later parts
+            # queued; don't unpack them for nothing.
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
 
         # A stage counts as 'ok' only when every run wrote. Failures were
         # already marked (and, unless --force, raised) by _report_stage_failure.
@@ -402,38 +427,38 @@ class ScalpBIDSConverter(StageGatedConverter):
 
         if stage == 'behavioral':
             # Behavioral lives under either beh/ (no EEG) or eeg/ (events.tsv).
-            return any(os.path.exists(p) for p in (
+            return any(self._exists(p) for p in (
                 os.path.join(beh_dir, f'{prefix}_beh.tsv'),
                 os.path.join(eeg_dir, f'{prefix}_events.tsv'),
-            )) or bool(glob(os.path.join(eeg_dir, f'{prefix}_run-*_events.tsv')))
+            )) or bool(self._glob(os.path.join(eeg_dir, f'{prefix}_run-*_events.tsv')))
         if stage == 'eeg':
             # Glob rather than test one fixed name: a session recorded in two
             # parts writes {prefix}_run-1_eeg.* / _run-2_eeg.*, and each data
             # file needs its own sidecar.
             data_files = [p for ext in ('.edf', '.bdf', '.vhdr')
-                          for p in glob(os.path.join(eeg_dir, f'{prefix}*_eeg{ext}'))]
+                          for p in self._glob(os.path.join(eeg_dir, f'{prefix}*_eeg{ext}'))]
             if not data_files:
                 return False
             return all(
-                os.path.exists(os.path.splitext(p)[0] + '.json')
+                self._exists(os.path.splitext(p)[0] + '.json')
                 for p in data_files
             )
         if stage == 'montage':
             data_files = [p for ext in ('.edf', '.bdf', '.vhdr')
-                          for p in glob(os.path.join(eeg_dir, f'{prefix}*_eeg{ext}'))]
+                          for p in self._glob(os.path.join(eeg_dir, f'{prefix}*_eeg{ext}'))]
             if data_files:
                 # One channels.tsv per recording.
                 channels_ok = all(
-                    os.path.exists(
+                    self._exists(
                         os.path.splitext(p)[0].rsplit('_eeg', 1)[0] + '_channels.tsv')
                     for p in data_files
                 )
             else:
-                channels_ok = os.path.exists(
+                channels_ok = self._exists(
                     os.path.join(eeg_dir, f'{prefix}_channels.tsv'))
             # space-* prefix on the electrodes file: any matching tsv satisfies.
             sub_ses_prefix = f'sub-{self.subject}_ses-{self.session}'
-            electrodes_ok = bool(glob(os.path.join(
+            electrodes_ok = bool(self._glob(os.path.join(
                 eeg_dir, f'{sub_ses_prefix}_space-*_electrodes.tsv'
             )))
             return channels_ok and electrodes_ok
@@ -509,10 +534,98 @@ class ScalpBIDSConverter(StageGatedConverter):
                 break
         return stem
 
+    # Persisted (path, size, mtime) -> usable verdicts, so a nightly run does
+    # not reopen every candidate recording. Override the location with
+    # BIDS_CONVERT_USABILITY_CACHE; delete the file to force a full recheck.
+    USABILITY_CACHE_PATH = os.environ.get(
+        "BIDS_CONVERT_USABILITY_CACHE",
+        os.path.expanduser("~/.cache/bids-convert/recording_usability.json"),
+    )
+    # Bump whenever _check_usable_recording changes what it accepts: a cache
+    # written under another version is discarded, not trusted. 2: BDFs must
+    # hold every data record their header advertises.
+    USABILITY_CHECK_VERSION = 2
+    _usability_cache = None          # {path: [size, mtime_ns, usable]}
+    _usability_dirty = {}            # entries added since the last save
+
     @classmethod
     def _is_usable_recording(cls, path):
         """True if `path` actually holds samples.
 
+        Verdicts are cached against the path's size and mtime (an .mff's
+        directory mtime), in memory and in ``USABILITY_CACHE_PATH`` — a
+        recording that changes on disk is simply checked again. See
+        ``_check_usable_recording`` for what the check rejects.
+        """
+        path = path.rstrip("/")
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        cache = cls._load_usability_cache()
+        hit = cache.get(path)
+        if hit is not None and hit[0] == st.st_size and hit[1] == st.st_mtime_ns:
+            return hit[2]
+        usable = cls._check_usable_recording(path, st.st_size)
+        cache[path] = cls._usability_dirty[path] = [st.st_size, st.st_mtime_ns, usable]
+        return usable
+
+    @classmethod
+    def _read_usability_file(cls):
+        """The verdicts on disk, or {} if the file is missing, unreadable or
+        was written by another version of the check."""
+        try:
+            with open(cls.USABILITY_CACHE_PATH) as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if (not isinstance(stored, dict)
+                or stored.get("check_version") != cls.USABILITY_CHECK_VERSION):
+            return {}
+        return stored.get("verdicts") or {}
+
+    @classmethod
+    def _load_usability_cache(cls):
+        if cls._usability_cache is None:
+            cls._usability_cache = cls._read_usability_file()
+        return cls._usability_cache
+
+    @classmethod
+    def _save_usability_cache(cls):
+        """Merge new verdicts into the on-disk cache (atomic replace).
+
+        Re-reads the file first so concurrent workers only ever lose each
+        other's latest additions, never the whole cache.
+        """
+        if not cls._usability_dirty:
+            return
+        path = cls.USABILITY_CACHE_PATH
+        try:
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            merged = cls._read_usability_file()
+            merged.update(cls._usability_dirty)
+            # A unique name in the same directory: the cache may live on NFS
+            # shared by workers on several hosts, where pids collide.
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix=".recording_usability.",
+                                       suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"check_version": cls.USABILITY_CHECK_VERSION,
+                               "verdicts": merged}, f)
+                os.replace(tmp, path)
+            except BaseException:
+                if os.path.exists(tmp):
+                    os.unlink(tmp)
+                raise
+            cls._usability_dirty = {}
+        except OSError as exc:
+            print(f"[WARN] could not save recording usability cache {path}: {exc}")
+
+    @classmethod
+    def _check_usable_recording(cls, path, size):
+        """Open `path` and decide whether it holds samples.
+
         These session directories are full of husks that look like recordings:
         header-only BDFs (exactly 35328 bytes, zero data records, from
         recordings that were aborted before the first data block), zero-byte
@@ -522,24 +635,17 @@ class ScalpBIDSConverter(StageGatedConverter):
         those is what turned a handful of empty sessions into IndexError /
         broadcast-shape crashes deep inside the readers.
         """
-        path = path.rstrip("/")
         if path.endswith(".mff"):
-            return bool(glob(os.path.join(path, "signal*.bin")))
-        try:
-            size = os.path.getsize(path)
-        except OSError:
-            return False
+            return bool(glob(os.path.join(glob_escape(path), "signal*.bin")))
         if size == 0:
             return False
         if path.endswith(".bdf"):
+            # Header only: data records advertised, and all of them on disk.
             try:
-                reader = pyedflib.EdfReader(path)
-            except Exception:
+                header = read_header(path)
+            except (OSError, ValueError):
                 return False
-            try:
-                return reader.datarecords_in_file > 0
-            finally:
-                reader.close()
+            return header.n_records > 0 and size >= header.file_bytes
         # EGI simple binary: the header must parse, and the file must be long
         # enough to hold the n_samples it advertises.
         try:
@@ -553,20 +659,34 @@ class ScalpBIDSConverter(StageGatedConverter):
             return False
         return header["samp_rate"] > 0 and size >= needed
 
+    def _eeg_dir_names(self, eeg_dir):
+        """Entry names in `eeg_dir`, listed once per converter.
+
+        Every lookup below (exact / case-insensitive / same-stem matches and
+        the heuristic's extension globs) filters this list instead of hitting
+        the directory again.
+        """
+        cache = self.__dict__.setdefault('_eeg_dir_names_cache', {})
+        if eeg_dir not in cache:
+            try:
+                with os.scandir(eeg_dir) as it:
+                    cache[eeg_dir] = sorted(entry.name for entry in it)
+            except OSError:
+                cache[eeg_dir] = None
+        return cache[eeg_dir]
+
     def _resolve_eegfile(self, name, eeg_dir):
         """Map one events.eegfile basename onto a real path in `eeg_dir`.
 
         Exact match, then case-insensitive (plenty of recordings were saved as
-        'ltp106 ...' / 'LTp296_...' / 'Ltp329_...'), then a same-stem glob so a
-        name differing only in container resolves to its sibling.
+        'ltp106 ...' / 'LTp296_...' / 'Ltp329_...'), then a same-stem match so
+        a name differing only in container resolves to its sibling.
         """
-        exact = os.path.join(eeg_dir, name)
-        if os.path.exists(exact):
-            return exact
-        try:
-            entries = os.listdir(eeg_dir)
-        except OSError:
+        entries = self._eeg_dir_names(eeg_dir)
+        if entries is None:
             return None
+        if name in entries:
+            return os.path.join(eeg_dir, name)
         lowered = name.lower()
         for entry in entries:
             if entry.lower() == lowered:
@@ -575,8 +695,8 @@ class ScalpBIDSConverter(StageGatedConverter):
         stem = self._recording_stem(name)
         if not stem:
             return None
-        siblings = [p for p in glob(os.path.join(eeg_dir, glob_escape(stem) + "*"))
-                    if p.rstrip("/").endswith(self.RECORDING_EXTS)]
+        siblings = [os.path.join(eeg_dir, entry) for entry in entries
+                    if entry.startswith(stem) and entry.endswith(self.RECORDING_EXTS)]
         if not siblings:
             return None
         # Prefer one that still holds data, and among those the container the
@@ -604,9 +724,12 @@ class ScalpBIDSConverter(StageGatedConverter):
         When a single real .mff coexists with .raw file(s) of the same session,
         the native .mff wins.
         """
-        candidates = (glob(os.path.join(eeg_dir, "*.raw*"))
-                      + glob(os.path.join(eeg_dir, "*.bdf*"))
-                      + glob(os.path.join(eeg_dir, "*.mff*")))
+        entries = self._eeg_dir_names(eeg_dir) or []
+        # Same selection as globbing "*.raw*", "*.bdf*", "*.mff*" in turn.
+        candidates = [os.path.join(eeg_dir, entry)
+                      for ext in (".raw", ".bdf", ".mff")
+                      for entry in entries
+                      if ext in entry and not entry.startswith(".")]
 
         prefix = self.subject_raw.lower()
 
@@ -676,7 +799,7 @@ class ScalpBIDSConverter(StageGatedConverter):
                     raise FileNotFoundError(
                         f"MANUAL_EEG_FILE pin does not exist: {path}")
                 pinned.append(path)
-            print(f"Raw File (manual pin): {pinned}")
+            self._log("INFO", f"Raw File (manual pin): {pinned}")
             return pinned
 
         targets = self.eegfile_targets()
@@ -692,7 +815,7 @@ class ScalpBIDSConverter(StageGatedConverter):
                     missing.append(f"{name} (no samples)")
             if resolved:
                 note = f" [unresolved: {missing}]" if missing else ""
-                print(f"Raw File(s) from events.eegfile: {resolved}{note}")
+                self._log("INFO", f"Raw File(s) from events.eegfile: {resolved}{note}")
                 return resolved
             # eegfile named files we can't use. Don't silently guess something
             # else — that risks converting the wrong recording.
@@ -713,7 +836,7 @@ class ScalpBIDSConverter(StageGatedConverter):
                 f"Multiple real EEG files for {self.subject_raw} "
                 f"session {self.session} and no events.eegfile to choose "
                 f"between them; pin one in MANUAL_EEG_FILE: {usable}")
-        print(f"Raw File Found (heuristic): {usable[0]}")
+        self._log("INFO", f"Raw File Found (heuristic): {usable[0]}")
         return usable
 
     def locate_raw_file(self):
@@ -741,14 +864,6 @@ class ScalpBIDSConverter(StageGatedConverter):
         self.recording_start = raw.info['meas_date']
         return raw
     
-    def unzip_raw_files(self):
-        output_path = os.path.splitext(self.raw_filepath.replace(' ', '_'))[0]
-        if not os.path.exists(output_path):
-            success = os.system(f"bunzip2 -k '{self.raw_filepath}'") == 0
-            if success:
-                shutil.move(self.raw_filepath, output_path)
-                self.raw_filepath = output_path
-    
     def set_montage(self):
         self.eeg_sidecar = {"PowerLineFrequency":60.0}
         if self.file_type == ".bdf":
@@ -825,15 +940,21 @@ class ScalpBIDSConverter(StageGatedConverter):
         """
         events = self._raw_events().copy()
         if eegfile is not None:
-            aligned = events['eegfile'].map(lambda p: os.path.basename(str(p).strip()))
-            events = events[aligned == os.path.basename(eegfile)]
+            # Compare bare names: a part may be pinned or logged as its .bz2.
+            def _name(p):
+                name = os.path.basename(str(p).strip())
+                return name[:-len(".bz2")] if name.endswith(".bz2") else name
+            aligned = events['eegfile'].map(_name)
+            events = events[aligned == _name(eegfile)]
+        self._remember_source_events(events['eegoffset'], events['type'],
+                                     None if beh_only else (sfreq or self.sfreq))
         events = events.rename(columns={"eegoffset":"sample", "type":"trial_type"})
         ## math distractor
         if "test" in events.columns:
-            events[["test_x", "test_y", "test_z"]] = events['test'].apply(pd.Series)
+            events[["test_x", "test_y", "test_z"]] = self._split_test_column(events['test'])
             events = events.drop(columns=["test"])
         if "font" in events.columns:
-            events["font"] = events['font'].apply(os.path.basename)
+            events["font"] = events['font'].str.rsplit("/", n=1).str[-1]
         if beh_only:
             standard_cols = ["mstime", "trial_type", 'stim_file']
             events["mstime"] = events["mstime"] - events["mstime"].iloc[0]
@@ -842,14 +963,35 @@ class ScalpBIDSConverter(StageGatedConverter):
             events['duration'] = "n/a"
             standard_cols = ['onset', 'duration', "trial_type", "sample", 'stim_file']
         events['stim_file'] = np.where(events.trial_type.str.contains("WORD"), self.wordpool_file, "n/a")
-        events = events.fillna("n/a")
-        events = events.replace("", "n/a")
-        events = events.replace("-999", "n/a")
-        events = events.replace(-999, "n/a")
         cols_to_include = ScalpBIDSConverter.event_column_dict[self.experiment]
         cols_to_include = [col for col in cols_to_include if col in events.columns]
+        # Select first so the n/a substitution only touches written columns.
         events = events[standard_cols + cols_to_include]
+        events = events.fillna("n/a").replace(self._NA_VALUES)
         return events
+
+    # Sentinels written as "n/a", in one replace pass.
+    _NA_VALUES = {"": "n/a", "-999": "n/a", -999: "n/a"}
+
+    @staticmethod
+    def _split_test_column(test):
+        """``test`` ([X, Y, Z] per math problem) → (n_events, 3) array.
+
+        Stacks the per-row lists in one go; falls back to a ragged frame
+        (short rows NaN-padded, as ``apply(pd.Series)`` did) when some rows
+        are not a full triple.
+        """
+        values = test.to_numpy()
+        try:
+            split = np.stack([np.asarray(v) for v in values]) if len(values) else np.empty((0, 3))
+        except ValueError:
+            split = None
+        if split is None or split.ndim != 2:
+            split = pd.DataFrame(
+                [list(v) if pd.api.types.is_list_like(v) else [v] for v in values],
+                index=test.index,
+            ).to_numpy()
+        return split
     
     def make_event_descriptors(self):
         descriptions = {
@@ -1167,14 +1309,16 @@ class ScalpBIDSConverter(StageGatedConverter):
                                           extension=".tsv",
                                           root=self.root)
         os.makedirs(bids_path.directory, exist_ok=True)
-        self.events.to_csv(bids_path.fpath, sep="\t", index=False)
+        self._to_tsv(self.events, bids_path.fpath)
+        self._remember_events_written(bids_path.fpath)
         with open(bids_path.update(suffix="beh", extension=".json").fpath, "w") as f:
             json.dump(fp=f, obj = self.events_descriptor)
     
     def write_bids_eeg(self, overwrite=True, run=None):
         """Write the EEG file as a bit-exact digital copy of the source.
 
-        BDF inputs are read with ``pyedflib`` and written back via
+        BDF inputs are decoded straight from their data records
+        (``read_digital``) and written back via
         ``write_digital(container="BDF")`` — the on-disk digital int24
         samples and per-channel ``(pmin, pmax, dmin, dmax, dim)`` headers
         match the source byte-for-byte. EGI ``.raw`` / ``.mff`` inputs
@@ -1213,7 +1357,8 @@ class ScalpBIDSConverter(StageGatedConverter):
         events_tsv = bids_path.copy().update(
             suffix="events", extension=".tsv",
         ).fpath
-        self.events.to_csv(events_tsv, sep="\t", index=False)
+        self._to_tsv(self.events, events_tsv)
+        self._remember_events_written(events_tsv)
         events_json = bids_path.copy().update(
             suffix="events", extension=".json",
         ).fpath
@@ -1224,23 +1369,16 @@ class ScalpBIDSConverter(StageGatedConverter):
         self._update_scans_tsv(out_path)
 
     def _write_eeg_from_bdf(self, bids_path):
-        """True bit-exact copy: pyedflib → pyedflib, no MNE."""
+        """True bit-exact copy: raw data records → pyedflib, no MNE."""
         src_bdf = self.raw_filepath
         out_path = bids_path.copy().update(
             suffix="eeg", extension=".bdf",
         ).fpath
         os.makedirs(out_path.parent, exist_ok=True)
 
-        f = pyedflib.EdfReader(str(src_bdf))
-        try:
-            labels = list(f.getSignalLabels())
-            sfreq = float(f.getSampleFrequency(0))
-            n_samp = f.getNSamples()[0]
-            data_int = np.empty((len(labels), n_samp), dtype=np.int32)
-            for i in range(len(labels)):
-                data_int[i] = f.readSignal(i, digital=True).astype(np.int32)
-        finally:
-            f.close()
+        header, data_int = read_digital(str(src_bdf))
+        labels = [header.labels[k] for k in header.data_signals]
+        sfreq = header.sfreq(header.data_signals[0])
 
         signal_units, _ = resolve_edf_units(
             labels,
@@ -1253,48 +1391,86 @@ class ScalpBIDSConverter(StageGatedConverter):
             str(out_path), labels, data_int, sfreq, signal_units,
             container="BDF",
         )
+        self._remember_written('digital', out_path, labels, data_int)
         return out_path
 
-    def _scrub_nonfinite(self, raw):
-        """Zero out non-finite samples, recording which channels were hit.
+    def _scan_nonfinite(self, raw):
+        """Find non-finite samples and per-channel peaks in one streaming pass.
 
         A run of EGI sessions from 2013 decodes with a handful of ±inf samples
         on one channel in the first few seconds — a saturated electrode at
         recording onset, not file corruption (LTP244 ses-18: 49 samples on
         E124 between samples 1038 and 2190; LTP247 ses-14: 76 samples, same
         channel, same window). pybv refuses to write them at all, so the whole
-        session used to fail. Zero-filling the affected samples lets the
-        session convert; ``write_bids_montage`` then marks those channels
-        ``status=bad`` in channels.tsv so the substitution stays visible
-        downstream rather than passing as clean signal.
+        session used to fail. The writers zero-fill the affected samples (see
+        ``_scrubbed_blocks``) so the session converts; ``write_bids_montage``
+        then marks those channels ``status=bad`` in channels.tsv so the
+        substitution stays visible downstream rather than passing as clean
+        signal.
+
+        The recording is scanned in ``egi_block_seconds`` blocks via lazy
+        segment reads and never loaded. The same pass records each channel's
+        peak absolute amplitude (Volts, after zero-filling) in
+        ``self.channel_peaks`` — the BDF writer needs it to fix per-channel
+        gains before the first sample is written.
 
         Populates ``self.nonfinite_channels`` (used by write_bids_montage) and
-        returns the raw, modified in place.
+        ``self.channel_peaks``.
         """
         self.nonfinite_channels = {}
-        data = raw.get_data()
-        bad = ~np.isfinite(data)
-        if not bad.any():
-            return raw
-        for ch_index in np.unique(np.nonzero(bad)[0]):
-            samples = np.nonzero(bad[ch_index])[0]
+        n_channels = len(raw.ch_names)
+
+        peaks = np.zeros(n_channels)
+        counts = np.zeros(n_channels, dtype=np.int64)
+        first = np.full(n_channels, -1, dtype=np.int64)
+        last = np.full(n_channels, -1, dtype=np.int64)
+        for start, data in self._egi_blocks(raw):
+            bad = ~np.isfinite(data)
+            if bad.any():
+                rows, cols = np.nonzero(bad)
+                counts += np.bincount(rows, minlength=n_channels)
+                for ch_index in np.unique(rows):
+                    samples = cols[rows == ch_index] + start
+                    if first[ch_index] < 0:
+                        first[ch_index] = samples[0]
+                    last[ch_index] = samples[-1]
+                data = np.where(bad, 0.0, data)
+            np.maximum(peaks, np.max(np.abs(data), axis=1), out=peaks)
+        self.channel_peaks = peaks
+
+        for ch_index in np.nonzero(counts)[0]:
             self.nonfinite_channels[raw.ch_names[ch_index]] = (
-                len(samples), int(samples[0]), int(samples[-1]))
-        # get_data() may hand back a view or a copy depending on preload;
-        # write through _data so the change lands on the object we export.
-        raw.load_data()
-        raw._data[bad] = 0.0
-        for name, (count, first, last) in self.nonfinite_channels.items():
+                int(counts[ch_index]), int(first[ch_index]), int(last[ch_index]))
+        for name, (count, first_bad, last_bad) in self.nonfinite_channels.items():
             print(f"[WARN] {self.subject} {self.experiment} ses-{self.session}: "
-                  f"{count} non-finite samples on {name} (samples {first}-{last}) "
+                  f"{count} non-finite samples on {name} (samples {first_bad}-{last_bad}) "
                   f"zero-filled; channel marked bad")
-        return raw
+
+    def _egi_blocks(self, raw):
+        """Yield ``(start, data)`` for consecutive ``egi_block_seconds`` blocks
+        of ``raw``, in Volts, read lazily from the source file."""
+        block = max(1, int(round(self.egi_block_seconds * raw.info['sfreq'])))
+        for start in range(0, raw.n_times, block):
+            yield start, raw.get_data(start=start, stop=min(start + block, raw.n_times))
+
+    def _scrubbed_blocks(self, raw):
+        """``_egi_blocks`` data with non-finite samples zero-filled.
+
+        Only channels ``_scan_nonfinite`` flagged can hold any, so clean
+        sessions skip the isfinite pass entirely.
+        """
+        for _, data in self._egi_blocks(raw):
+            if self.nonfinite_channels:
+                data[~np.isfinite(data)] = 0.0
+            yield data
 
     def _write_eeg_from_egi(self, bids_path):
         """EGI .raw / .mff → BDF.
 
         MNE decodes the source to Volts and we requantize to int32 over
-        BDF's full 24-bit range.
+        BDF's full 24-bit range. Gains come from the ``_scan_nonfinite``
+        pre-scan, so the samples are then encoded and appended one block at
+        a time — the recording is never held in memory whole.
 
         Stim/sync channels (sync, D255, DIN1, ...) are dropped —
         channels.tsv already lists only the eeg+eog subset.
@@ -1304,55 +1480,163 @@ class ScalpBIDSConverter(StageGatedConverter):
         ).fpath
         os.makedirs(out_path.parent, exist_ok=True)
 
-        raw = self._scrub_nonfinite(self.raw_file.copy().pick(['eeg', 'eog']))
+        raw = self.raw_file.copy().pick(['eeg', 'eog'])
+        self._scan_nonfinite(raw)
         labels = list(raw.ch_names)
         sfreq = float(raw.info['sfreq'])
 
-        data_v = raw.get_data()
-        data_int, phys_min, phys_max, signal_units = encode_egi_to_bdf(
-            data_v, labels=labels, dim="uV", container="BDF",
+        signal_units = egi_signal_units(
+            self.channel_peaks, labels, dim="uV", container="BDF",
         )
-        peak = float(np.max(np.abs(data_v))) or 1e-6
-        print(
+        peak = float(np.max(self.channel_peaks, initial=0.0)) or 1e-6
+        self._log(
+            "DEBUG",
             f"  EGI requantize path: peak={peak:.3e} V, "
             f"per-channel min quantization over 24-bit BDF range "
             f"({self.subject} {self.experiment} ses-{self.session})"
         )
-        write_digital(
-            str(out_path), labels, data_int, sfreq, signal_units,
+        blocks = (
+            encode_egi_to_bdf(
+                data, dim="uV", container="BDF", peak_v=self.channel_peaks,
+            )[0]
+            for data in self._scrubbed_blocks(raw)
+        )
+        digests = ChannelDigests(len(labels))
+        write_digital_blocks(
+            str(out_path), labels, digests.wrap(blocks), sfreq, signal_units,
             container="BDF",
         )
+        self._remember_written('digests', out_path, labels, digests)
 
         return out_path
 
     def _write_eeg_from_egi_brainvision(self, bids_path):
         """EGI .raw / .mff → BrainVision (.vhdr/.eeg/.vmrk), IEEE float32.
 
-        MNE decodes the source to Volts and pybv writes them straight to
-        float32 — no integer requantization and no 8-char EDF/BDF header
+        MNE decodes the source to Volts and the samples go straight to
+        float32 µV — no integer requantization and no 8-char EDF/BDF header
         gain truncation, so the round-trip is at the float32 floor
         (~1e-7 relative).
 
         Same channel subset as the BDF path: stim/sync channels are
         dropped so channels.tsv (also keyed off eeg+eog) stays consistent.
+
+        The .eeg is appended one block at a time (``export_raw`` needs the
+        whole recording as one array); the two text files are written here
+        from the channel list and annotations — see ``_write_vhdr`` and
+        ``_write_vmrk`` — so nothing depends on pybv/MNE internals.
         """
         out_path = bids_path.copy().update(
             suffix="eeg", extension=".vhdr",
         ).fpath
         os.makedirs(out_path.parent, exist_ok=True)
-
-        raw = self._scrub_nonfinite(self.raw_file.copy().pick(['eeg', 'eog']))
-        peak = float(np.max(np.abs(raw.get_data()))) or 1e-6
-        print(
+        eeg_path = out_path.with_suffix(".eeg")
+        vmrk_path = out_path.with_suffix(".vmrk")
+
+        raw = self.raw_file.copy().pick(['eeg', 'eog'])
+        self._scan_nonfinite(raw)
+        peak = float(np.max(self.channel_peaks, initial=0.0)) or 1e-6
+        self._log(
+            "DEBUG",
             f"  EGI BrainVision path: peak={peak:.3e} V, float32 "
             f"({self.subject} {self.experiment} ses-{self.session})"
         )
-        mne.export.export_raw(
-            str(out_path), raw, fmt="brainvision", overwrite=True,
-        )
+
+        try:
+            with open(eeg_path, "wb") as fout:
+                for data in self._scrubbed_blocks(raw):
+                    # multiplexed: sample-major, channels interleaved
+                    fout.write((data * 1e6).T.astype("<f4").tobytes())
+            self._write_vmrk(vmrk_path, eeg_path, raw)
+            self._write_vhdr(out_path, eeg_path, vmrk_path, raw)
+        except BaseException:
+            for path in (eeg_path, vmrk_path, out_path):
+                if path.exists():
+                    path.unlink()
+            raise
 
         return out_path
 
+    @staticmethod
+    def _bv_escape(text):
+        # BrainVision codes commas inside a field as "\1".
+        return str(text).replace(",", r"\1")
+
+    def _write_vhdr(self, vhdr_path, eeg_path, vmrk_path, raw):
+        """BrainVision header for the float32 µV samples streamed by
+        ``_write_eeg_from_egi_brainvision``. Every channel is eeg/eog, so
+        all are Volts and stored as µV at resolution 1 (a reader multiplies
+        each stored value by the resolution)."""
+        lines = [
+            "Brain Vision Data Exchange Header File Version 1.0",
+            "",
+            "[Common Infos]",
+            "Codepage=UTF-8",
+            f"DataFile={eeg_path.name}",
+            f"MarkerFile={vmrk_path.name}",
+            "DataFormat=BINARY",
+            "; DataOrientation: MULTIPLEXED=ch1,pt1, ch2,pt1 ...",
+            "DataOrientation=MULTIPLEXED",
+            f"NumberOfChannels={len(raw.ch_names)}",
+            "; Sampling interval in microseconds",
+            f"SamplingInterval={1e6 / raw.info['sfreq']}",
+            "",
+            "[Binary Infos]",
+            "BinaryFormat=IEEE_FLOAT_32",
+            "",
+            "[Channel Infos]",
+            "; Each entry: Ch<Channel number>=<Name>,<Reference channel name>,",
+            '; <Resolution in "Unit">,<Unit>, Future extensions..',
+            "; Fields are delimited by commas, some fields might be omitted (empty).",
+            '; Commas in channel names are coded as "\\1".',
+        ]
+        lines.extend(f"Ch{i}={self._bv_escape(name)},,1,µV"
+                     for i, name in enumerate(raw.ch_names, start=1))
+        with open(vhdr_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def _write_vmrk(self, vmrk_path, eeg_path, raw):
+        """BrainVision marker file: a "New Segment" marker carrying the
+        measurement date, then one marker per annotation. Descriptions of
+        the form ``Stimulus/S  1`` / ``Response/R  1`` / ``Comment/...``
+        keep their marker type, anything else becomes a Comment — the
+        mapping ``mne.export`` uses."""
+        sfreq = raw.info['sfreq']
+        markers = []
+        meas_date = raw.info["meas_date"]
+        markers.append(("New Segment", "", 1, 1, 0) + (
+            (meas_date.strftime("%Y%m%d%H%M%S%f"),) if meas_date is not None else ()))
+        for annot in raw.annotations:
+            # annotation onsets include first_samp; positions are 1-based
+            onset = int(raw.time_as_index(annot["onset"] - raw.first_time)[0])
+            duration = max(1, int(annot["duration"] * sfreq))
+            kind, description = "Comment", annot["description"]
+            for prefix in ("Stimulus/", "Response/", "Comment/"):
+                if description.startswith(prefix):
+                    kind, description = prefix[:-1], description[len(prefix):]
+                    break
+            markers.append((kind, description, onset + 1, duration, 0))
+
+        lines = [
+            "Brain Vision Data Exchange Marker File, Version 1.0",
+            "",
+            "[Common Infos]",
+            "Codepage=UTF-8",
+            f"DataFile={eeg_path.name}",
+            "",
+            "[Marker Infos]",
+            "; Each entry: Mk<Marker number>=<Type>,<Description>,<Position in data points>,",
+            "; <Size in data points>, <Channel number (0 = marker is related to all channels)>",
+            "; Fields are delimited by commas, some fields might be omitted (empty).",
+            '; Commas in type or description text are coded as "\\1".',
+        ]
+        lines.extend(
+            f"Mk{i}=" + ",".join(self._bv_escape(field) for field in marker)
+            for i, marker in enumerate(markers, start=1)
+        )
+        with open(vmrk_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
     def write_bids_montage(self, overwrite=True, run=None):
         """Write only ``*_channels.tsv``, ``*_electrodes.tsv`` and
         ``*_coordsystem.json`` for this session — without re-encoding the
@@ -1406,7 +1690,7 @@ class ScalpBIDSConverter(StageGatedConverter):
         """Mark channels whose non-finite samples were zero-filled as bad.
 
         Runs after ``_channels_tsv`` has written the file, so the substitution
-        made in ``_scrub_nonfinite`` is recorded where a reader will find it
+        made by the EGI writers is recorded where a reader will find it
         instead of silently passing as clean signal.
         """
         flagged = getattr(self, 'nonfinite_channels', None)
@@ -1423,4 +1707,4 @@ class ScalpBIDSConverter(StageGatedConverter):
             channels.loc[row, 'status_description'] = (
                 f"{count} non-finite samples (samples {first}-{last}) "
                 f"zero-filled during conversion")
-        channels.to_csv(channels_tsv, sep="\t", index=False)
+        self._to_tsv(channels, channels_tsv)
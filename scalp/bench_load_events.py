@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""Micro-benchmark for ``ScalpBIDSConverter.load_events``.
+
+Builds a synthetic ltpFR2-shaped events frame (math problems in ``test``,
+``-999`` / blank sentinels, a font path column) and times the events-table
+build on it, reported per 10k events. No data archive access: the frame is
+handed to the converter through its events cache, so ``CMLReader`` is never
+called.
+
+Usage::
+
+    python bench_load_events.py                  # 10k events, 20 repeats
+    python bench_load_events.py --n-events 100000 --repeats 5
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from ScalpBIDSConverter import ScalpBIDSConverter  # noqa: E402
+
+
+def synthetic_events(n_events, seed=0):
+    rng = np.random.default_rng(seed)
+    types = rng.choice(["WORD", "REC_WORD", "PROB", "REST", "DISTRACTOR"], n_events)
+    is_prob = types == "PROB"
+    test = [list(rng.integers(1, 10, 3)) if p else [0, 0, 0] for p in is_prob]
+    return pd.DataFrame({
+        "subject": "LTP999",
+        "experiment": "ltpFR2",
+        "session": 0,
+        "type": types,
+        "eegoffset": np.sort(rng.integers(0, 5_000_000, n_events)),
+        "mstime": np.sort(rng.integers(0, 5_000_000, n_events)),
+        "trial": rng.integers(-999, 24, n_events),
+        "item_name": np.where(types == "WORD", "APPLE", ""),
+        "item_num": np.where(types == "WORD", rng.integers(1, 576, n_events), -999),
+        "list": rng.integers(0, 24, n_events),
+        "answer": np.where(is_prob, rng.integers(3, 28, n_events), -999),
+        "test": test,
+        "font": "/Library/Fonts/Verdana.ttf",
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n-events", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    converter = ScalpBIDSConverter("LTP999", "ltpFR2", 0, root="/tmp/bench_bids")
+    converter._raw_events_cache = synthetic_events(args.n_events)
+    converter.wordpool_file = "wordpools/wasnorm_wordpool_576.txt"
+    converter.sfreq = 2048.0
+
+    for label, kwargs in (("eeg", {}), ("beh", {"beh_only": True})):
+        times = timeit.repeat(lambda: converter.load_events(**kwargs),
+                              number=1, repeat=args.repeats)
+        per_10k = min(times) * 10_000 / args.n_events
+        print(f"load_events ({label}): {per_10k * 1e3:.1f} ms per 10k events "
+              f"(best of {args.repeats}, n_events={args.n_events})")
+
+
+if __name__ == "__main__":
+    main()
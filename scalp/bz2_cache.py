@@ -0,0 +1,105 @@
+"""Scratch cache of decompressed ``.bz2`` scalp recordings.
+
+A few older sessions only exist on disk as ``*.raw.bz2`` / ``*.bdf.bz2``.
+The readers need the plain file, so ``decompressed_path`` streams the
+archive through Python's ``bz2`` module (which handles the multi-stream
+files pbzip2 writes) into a cache directory and hands back that path.
+The source tree is never written to.
+
+Entries are keyed on the source's path, size and mtime, so a rerun reuses
+the decompressed copy and a replaced archive is decompressed afresh. The
+directory is capped at ``BIDS_CONVERT_BZ2_CACHE_GB``; once over, the least
+recently used entries are evicted (each hit refreshes the entry's mtime).
+Entries used within ``IN_USE_GRACE_S`` are never evicted — MNE reopens the
+file on every lazy read, so deleting one a worker is converting would break
+it mid-write.
+
+Override the location with ``BIDS_CONVERT_BZ2_CACHE`` (defaults under the
+system temp dir); it is shared safely between concurrent workers, since
+every entry is written to a private temp name and renamed into place.
+"""
+
+import bz2
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+
+
+CACHE_DIR = os.environ.get(
+    "BIDS_CONVERT_BZ2_CACHE",
+    os.path.join(tempfile.gettempdir(), "bids-convert-bz2"),
+)
+MAX_BYTES = int(float(os.environ.get("BIDS_CONVERT_BZ2_CACHE_GB", "50")) * 1024 ** 3)
+IN_USE_GRACE_S = 6 * 3600
+
+_CHUNK = 16 * 1024 * 1024
+
+
+def _cache_name(src, st):
+    key = f"{os.path.abspath(src)}\0{st.st_size}\0{st.st_mtime_ns}"
+    digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+    # Keep the inner extension (.raw / .bdf) — the converter dispatches on it.
+    base = os.path.basename(src)[: -len(".bz2")].replace(" ", "_")
+    return f"{digest}_{base}"
+
+
+def decompressed_path(src, cache_dir=None, max_bytes=None):
+    """Path to a decompressed copy of ``src`` (a ``.bz2`` file) in the cache,
+    decompressing it first on a miss."""
+    cache_dir = cache_dir or CACHE_DIR
+    os.makedirs(cache_dir, exist_ok=True)
+    out = os.path.join(cache_dir, _cache_name(src, os.stat(src)))
+
+    if os.path.exists(out):
+        os.utime(out)                   # LRU: mark as recently used
+        print(f"Using cached decompression: {out}")
+        return out
+
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, prefix=".part-")
+    try:
+        with bz2.open(src, "rb") as fin, os.fdopen(fd, "wb") as fout:
+            shutil.copyfileobj(fin, fout, _CHUNK)
+        os.replace(tmp, out)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    print(f"Decompressed {src} -> {out}")
+
+    evict(cache_dir, max_bytes if max_bytes is not None else MAX_BYTES, keep=out)
+    return out
+
+
+def evict(cache_dir, max_bytes, keep=None):
+    """Delete least recently used entries until the cache fits ``max_bytes``.
+
+    Skips ``keep``, in-flight ``.part-`` files and anything used within
+    ``IN_USE_GRACE_S``, so the cache can sit over budget until those age out.
+    """
+    entries = []
+    total = 0
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            total += st.st_size
+            if entry.name.startswith(".part-") or entry.path == keep:
+                continue
+            entries.append((st.st_mtime, st.st_size, entry.path))
+
+    cutoff = time.time() - IN_USE_GRACE_S
+    for mtime, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if mtime > cutoff:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+        print(f"Evicted cached decompression: {path}")